@@ -1,30 +1,47 @@
+import asyncio
 import sys
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer, QObject, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
 
-from config import CONVERSATION_STARTER, AppStateDict
+from config import CONVERSATION_STARTER, REQUEST_REJECTED, AppStateDict
 from source.duck_widget.duck_widget import StoicDuckPro, dev_hotkeys
 from source.neuro_reader.eeg_service import EEGService
-from source.neuro_reader.utils import EEGDataDict
+from source.neuro_reader.snapshot import EEGSnapshot
 from source.neuro_reader.mock_service import MockEEGService
+from source.philosopher.async_philosopher_ai import AsyncPhilosopherAI
 from source.philosopher.philosopher_ai import PhilosopherAI
+from source.philosopher.recording import Recording
+
+try:
+    import qasync
+except ImportError:
+    qasync = None
+    print("Warning: 'qasync' not installed. Philosopher will run on threads.")
 
 
 class Bridge(QObject):
     ai_response_ready = pyqtSignal(str)
     user_speech_ready = pyqtSignal(str)
+    eeg_data_ready = pyqtSignal(object)
 
 
 def main():
     app: QApplication = QApplication(sys.argv)
+    if qasync:
+        # Runs asyncio on top of the Qt event loop, philosopher requests are coroutines
+        loop: qasync.QEventLoop = qasync.QEventLoop(app)
+        asyncio.set_event_loop(loop)
 
     duck_window: StoicDuckPro = StoicDuckPro()
 
     eeg_service = EEGService()
     # eeg_service: MockEEGService = MockEEGService()  #  used for testing
-    eeg_service.start()
 
-    philosopher: PhilosopherAI = PhilosopherAI()
+    philosopher: PhilosopherAI | AsyncPhilosopherAI = (
+        AsyncPhilosopherAI() if qasync else PhilosopherAI()
+    )
+    # Connects to Gemini, ElevenLabs and speech recognition while the UI starts
+    philosopher.warm_up()
     bridge: Bridge = Bridge()
 
     app_state: AppStateDict = {"stoic_mode_active": False, "conversation_locked": False}
@@ -50,6 +67,18 @@ def main():
 
     bridge.ai_response_ready.connect(update_gui_chat)
 
+    def unlock_if_rejected(request) -> None:
+        """
+        The philosopher returns None when its queue is full or shut down, no
+        response will unlock the chat then.
+
+        :param request: Future returned for the request.
+        """
+        if request is None:
+            print("[GUI] Request rejected.")
+            duck_window.chat_area.add_response(REQUEST_REJECTED)
+            duck_window.chat_area.set_locked(False)
+
     try:
         duck_window.chat_area.message_sent.disconnect()
     except Exception:
@@ -70,8 +99,12 @@ def main():
                 print("My job here is done. I go back monitoring EEG.")
                 app_state["conversation_locked"] = False
 
-        philosopher.trigger_intervention(
-            user_context=user_text, on_response_callback=on_ai_reply_to_user, force=True
+        unlock_if_rejected(
+            philosopher.trigger_intervention(
+                user_context=user_text,
+                on_response_callback=on_ai_reply_to_user,
+                force=True,
+            )
         )
 
     duck_window.chat_area.message_sent.connect(handle_user_input_from_gui)
@@ -82,8 +115,28 @@ def main():
 
     bridge.user_speech_ready.connect(show_user_speech_bubble)
 
-    def handle_recorded_audio(file_path: str):
-        print(f"Got audio file from GUI: {file_path}")
+    # Transcription of the recording in progress, fed from the recording thread
+    live_transcription: dict = {"stream": None}
+
+    def start_live_transcription(sample_rate: int):
+        live_transcription["stream"] = philosopher.start_listening(
+            sample_rate, on_partial=lambda text: print(f"[STT] {text}")
+        )
+
+    def feed_live_transcription(frames):
+        if live_transcription["stream"]:
+            live_transcription["stream"].feed(frames)
+
+    # Direct connections run in the recording thread, the GUI thread is not involved
+    duck_window.chat_area.recording_started.connect(
+        start_live_transcription, Qt.ConnectionType.DirectConnection
+    )
+    duck_window.chat_area.audio_captured.connect(
+        feed_live_transcription, Qt.ConnectionType.DirectConnection
+    )
+
+    def handle_recorded_audio(recording: Recording):
+        print(f"Got {recording.duration:.1f} s of audio from GUI")
 
         duck_window.chat_area.set_locked(True)
 
@@ -93,26 +146,38 @@ def main():
                 app_state["conversation_locked"] = False
 
         print("Starting the philosopher...")
-        philosopher.process_wav_and_trigger(
-            file_path=file_path,
-            on_user_text_callback=lambda txt: bridge.user_speech_ready.emit(txt),
-            on_ai_response_callback=on_ai_voice_finish,
-        )
+        stream = live_transcription["stream"]
+        live_transcription["stream"] = None
+        if stream:
+            request = philosopher.process_stream_and_trigger(
+                stream=stream,
+                on_user_text_callback=lambda txt: bridge.user_speech_ready.emit(txt),
+                on_ai_response_callback=on_ai_voice_finish,
+            )
+        else:
+            request = philosopher.process_recording_and_trigger(
+                recording=recording,
+                on_user_text_callback=lambda txt: bridge.user_speech_ready.emit(txt),
+                on_ai_response_callback=on_ai_voice_finish,
+            )
+        unlock_if_rejected(request)
         print("finished this")
 
     duck_window.chat_area.mic_requested.connect(handle_recorded_audio)
 
-    def polling_loop():
-        data: EEGDataDict = eeg_service.get_data()
+    def on_eeg_data(data: EEGSnapshot):
+        """
+        Runs in the GUI thread whenever the EEG worker publishes a new result.
 
-        raw_ratio: float = data.get("stress_index", 0.0)
+        :param data: Latest EEG snapshot.
+        """
+        raw_ratio: float = data.stress_index
         normalized_stress: float = min(raw_ratio / 3.0, 1.0)
 
         stress_to_show_in_gui: float = normalized_stress
 
         if app_state["conversation_locked"] or philosopher.is_speaking:
             stress_to_show_in_gui = max(normalized_stress, 0.95)
-        dev_hotkeys(duck_window)
         duck_window.update_stress(stress_to_show_in_gui)
 
         if app_state["conversation_locked"]:
@@ -122,11 +187,20 @@ def main():
             print("High stress detected, running stoic.")
             app_state["stoic_mode_active"] = True
             app_state["conversation_locked"] = True
-            philosopher.is_speaking = True
 
-            philosopher.say_specific_phrase(
-                text=CONVERSATION_STARTER, on_response_callback=on_ai_thought_callback
-            )
+            # Prepared while stress was rising, falls back to the scripted phrase
+            if not philosopher.deliver_intervention(
+                on_response_callback=on_ai_thought_callback
+            ):
+                philosopher.say_specific_phrase(
+                    text=CONVERSATION_STARTER,
+                    on_response_callback=on_ai_thought_callback,
+                )
+        elif normalized_stress >= 0.5 and not app_state["stoic_mode_active"]:
+            # WORRY: stress may keep rising, get the intervention ready
+            philosopher.prepare_intervention()
+        elif normalized_stress < 0.5 and not app_state["stoic_mode_active"]:
+            philosopher.discard_intervention()
         elif normalized_stress < 0.3 and app_state["stoic_mode_active"]:
             if not philosopher.is_speaking:
                 print(
@@ -134,15 +208,28 @@ def main():
                 )
                 app_state["stoic_mode_active"] = False
 
-    timer: QTimer = QTimer()
-    timer.timeout.connect(polling_loop)
-    timer.start(200)
+    # Emitted from the EEG worker thread, queued to the GUI thread by Qt
+    bridge.eeg_data_ready.connect(on_eeg_data)
+    unsubscribe_eeg = eeg_service.subscribe(bridge.eeg_data_ready.emit)
+    eeg_service.start()
+
+    # Polled on its own, so quitting and stress simulation work without EEG data
+    hotkey_timer: QTimer = QTimer()
+    hotkey_timer.timeout.connect(lambda: dev_hotkeys(duck_window))
+    hotkey_timer.start(200)
 
     duck_window.show()
 
-    exit_code: int = app.exec()
+    if qasync:
+        # Runs `app.exec()` with asyncio on top and returns its exit code
+        with loop:
+            exit_code: int = loop.run_forever()
+    else:
+        exit_code: int = app.exec()
 
+    unsubscribe_eeg()
     eeg_service.stop()
+    philosopher.shutdown()
     return exit_code
 
 
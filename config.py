@@ -2,6 +2,7 @@ from typing import Final, TypedDict
 
 
 CONVERSATION_STARTER: Final[str] = "I sense deep distress in you, young padawan."
+REQUEST_REJECTED: Final[str] = "I have too much to answer right now. Ask me again soon."
 
 
 class AppStateDict(TypedDict):
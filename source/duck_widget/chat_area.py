@@ -1,6 +1,6 @@
-import os
 import threading
 import time
+import numpy as np
 from PyQt6.QtWidgets import (
     QLabel,
     QWidget,
@@ -18,23 +18,26 @@ from PyQt6.QtCore import (
 
 from source.duck_widget.stylesheet_menager import StyleSheetManager
 from source.duck_widget.utils import AppConfig
+from source.neuro_reader.ring_buffer import RingBuffer
+from source.philosopher.recording import Recording
 
 # optional recording backend
 try:
     import sounddevice as sd
-    import soundfile as sf
 
     _REC_AVAILABLE = True
 except Exception:
     sd = None
-    sf = None
     _REC_AVAILABLE = False
 
 
 class ChatArea(QWidget):
     message_sent = pyqtSignal(str)
-    mic_requested = pyqtSignal(str)
-    recording_finished_signal = pyqtSignal(str)
+    mic_requested = pyqtSignal(object)
+    recording_finished_signal = pyqtSignal(object)
+    # Emitted from the recording thread: sample rate, then mono float32 frames
+    recording_started = pyqtSignal(int)
+    audio_captured = pyqtSignal(object)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -104,13 +107,17 @@ class ChatArea(QWidget):
         self._is_recording = False
         self._record_thread = None
         self._stop_recording = threading.Event()
+        # Preallocated once, the audio callback only copies into it
+        self._capture = RingBuffer(
+            1,
+            AppConfig.MAX_RECORDING_SECONDS * AppConfig.RECORDING_SAMPLE_RATE,
+            dtype=np.float32,
+        )
         self._rec_available = _REC_AVAILABLE
         if not self._rec_available:
             # disable if backend missing
             self.record_btn.setEnabled(False)
-            self.record_btn.setToolTip(
-                "Recording requires 'sounddevice' and 'soundfile' packages"
-            )
+            self.record_btn.setToolTip("Recording requires the 'sounddevice' package")
 
         self.record_btn.clicked.connect(self._toggle_recording)
 
@@ -187,68 +194,55 @@ class ChatArea(QWidget):
         self._record_thread = threading.Thread(target=self._record_worker, daemon=True)
         self._record_thread.start()
 
-    def _on_recording_finished(self, filename: str):
+    def _on_recording_finished(self, recording: Recording):
         """
         Function will run in the main thread using Signal.
 
-        :param filename: Filename to the recording.
+        :param recording: Captured audio.
         """
         self._is_recording = False
         self.record_btn.setText("🎤")
-        self._last_recording = filename
-        self.mic_requested.emit(str(filename))
+        self._last_recording = recording
+        self.mic_requested.emit(recording)
 
     def _record_worker(self):
         """
-        Records audio to a WAV file saved under the project folder ~/neurohackathon/assets.
-        Emits mic_requested(filename) when finished.
+        Records audio into memory, no file is written.
+        Emits audio_captured(frames) for every captured block, so listeners can
+        transcribe while recording, and mic_requested(recording) when finished.
         """
         try:
-            samplerate = 16000
+            samplerate = AppConfig.RECORDING_SAMPLE_RATE
             channels = 1
+            self._capture.reset()
 
-            # ensure recordings directory inside project root (two levels up from this file)
-            project_root = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "..")
-            )
-            rec_dir = os.path.join(project_root, "assets")
-            os.makedirs(rec_dir, exist_ok=True)
+            def callback(indata, frames, timeinfo, status):
+                if status:
+                    # write status to console but continue
+                    print(f"Recording status: {status}")
+                self._capture.extend(indata.T)
+                self.audio_captured.emit(indata[:, 0].copy())
 
-            filename = os.path.join(rec_dir, "voice_recording.wav")
+            self.recording_started.emit(samplerate)
 
-            # Use soundfile to write chunks from sounddevice InputStream
-            with sf.SoundFile(
-                filename,
-                mode="w",
+            with sd.InputStream(
                 samplerate=samplerate,
                 channels=channels,
-                subtype="PCM_16",
-            ) as file:
-
-                def callback(indata, frames, timeinfo, status):
-                    if status:
-                        # write status to console but continue
-                        print(f"Recording status: {status}")
-                    file.write(indata)
-
-                with sd.InputStream(
-                    samplerate=samplerate, channels=channels, callback=callback
-                ):
-                    # keep recording until stop requested
-                    while not self._stop_recording.is_set():
-                        time.sleep(0.1)
-
-            # finalize state on main thread
-            def finish():
-                self._is_recording = False
-                self.record_btn.setText("🎤")
-                # save last recording path and enable play button
-                self._last_recording = filename
-                self.play_btn.setVisible(True)
-                # emit filename to listeners
-                QTimer.singleShot(0, lambda: self.mic_requested.emit(filename))
-
-            self.recording_finished_signal.emit(filename)
+                dtype="float32",
+                callback=callback,
+            ):
+                # keep recording until stop requested
+                while not self._stop_recording.is_set():
+                    time.sleep(0.1)
+
+            if self._capture.total > self._capture.capacity:
+                print(
+                    f"Recording longer than {AppConfig.MAX_RECORDING_SECONDS} s, "
+                    "keeping the end."
+                )
+            # Copied out, so the next recording can reuse the buffer
+            recording = Recording(self._capture.latest()[0].copy(), samplerate)
+            self.recording_finished_signal.emit(recording)
         except Exception as e:
             print(f"Recording error: {e}")
 
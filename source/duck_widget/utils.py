@@ -29,6 +29,9 @@ class AppConfig:
     BORDER_RADIUS: int = 30
     MARGIN: int = 25
 
+    RECORDING_SAMPLE_RATE: int = 16000
+    MAX_RECORDING_SECONDS: int = 60
+
     BG_COLOR: str = "#FFFFFF"
     TEXT_PRIMARY: str = "#1A1A1A"
     TEXT_SECONDARY: str = "#666666"
@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+import numpy as np
+import mne
+from scipy import fft
+from scipy.signal import freqz, get_window
+
+from source.neuro_reader.utils import ALPHA_BAND, BETA_BAND, TOTAL_BAND
+
+
+@dataclass(frozen=True)
+class BandPowers:
+    alpha: float
+    beta: float
+    total: float
+
+    @property
+    def stress_index(self) -> float:
+        return self.beta / self.alpha if self.alpha > 0 else 0.0
+
+    @property
+    def alpha_rel(self) -> float:
+        return self.alpha / (self.total if self.total != 0 else 1e-9)
+
+    @property
+    def beta_rel(self) -> float:
+        return self.beta / (self.total if self.total != 0 else 1e-9)
+
+    @property
+    def mood(self) -> str:
+        if self.stress_index > 1.5:
+            return "HIGH STRESS"
+        if self.stress_index > 1.0:
+            return "FOCUS"
+        return "RELAX"
+
+
+class BandPowerEngine:
+    def __init__(self, sfreq: float, n_samples: int, n_fft: int = 256) -> None:
+        """
+        Band-pass + Welch PSD + band sums for fixed-size windows.
+        Everything that depends only on the window shape (FIR coefficients and their
+        spectrum, Welch taper, frequency masks) is computed once here, so `compute`
+        is a few batched FFTs over all channels.
+        The math follows `mne.filter.filter_data(l_freq, h_freq)` followed by
+        `mne.time_frequency.psd_array_welch(n_fft=n_fft)`.
+
+        :param sfreq: Sampling frequency.
+        :param n_samples: Window length in samples.
+        :param n_fft: Welch segment length.
+        """
+        self.sfreq: float = sfreq
+        self.n_samples: int = n_samples
+        self.n_fft: int = min(n_fft, n_samples)
+
+        # Band-pass (zero-phase FIR, same design as MNE's default)
+        self.fir: np.ndarray = mne.filter.create_filter(
+            None, sfreq, TOTAL_BAND[0], TOTAL_BAND[1], verbose=False
+        )
+        self._n_edge: int = min(len(self.fir), n_samples) - 1
+        self._shift: int = (len(self.fir) - 1) // 2 + self._n_edge
+        conv_length: int = n_samples + 2 * self._n_edge + len(self.fir) - 1
+        self._conv_fft_len: int = fft.next_fast_len(conv_length, real=True)
+        self._fir_spectrum: np.ndarray = fft.rfft(self.fir, n=self._conv_fft_len)
+
+        # Welch (non-overlapping segments, trailing partial segment dropped)
+        self.n_segments: int = n_samples // self.n_fft
+        self.taper: np.ndarray = get_window("hamming", self.n_fft)
+        self._scale: np.ndarray = np.full(
+            self.n_fft // 2 + 1, 2.0 / (sfreq * np.sum(self.taper**2))
+        )
+        self._scale[0] /= 2.0
+        if self.n_fft % 2 == 0:
+            self._scale[-1] /= 2.0  # DC and Nyquist are not doubled
+
+        self.freqs: np.ndarray = fft.rfftfreq(self.n_fft, 1.0 / sfreq)
+        self.alpha_mask: np.ndarray = self._band_mask(ALPHA_BAND)
+        self.beta_mask: np.ndarray = self._band_mask(BETA_BAND)
+        self.total_mask: np.ndarray = self._band_mask(TOTAL_BAND)
+
+        # Power gain of the band-pass on the Welch grid, for estimators that work
+        # on unfiltered segments (PSD of filtered signal ~= |H(f)|^2 * PSD)
+        _, response = freqz(self.fir, worN=self.freqs, fs=sfreq)
+        self.filter_gain: np.ndarray = np.abs(response) ** 2
+
+    def compute(self, window: np.ndarray) -> BandPowers:
+        """
+        Computes band powers averaged over channels.
+
+        :param window: Raw samples, shape (n_channels, n_samples). Not modified.
+        """
+        filtered: np.ndarray = self.filter(window)
+        used: int = self.n_segments * self.n_fft
+        segments: np.ndarray = filtered[:, :used].reshape(
+            filtered.shape[0], self.n_segments, self.n_fft
+        )
+        psd: np.ndarray = self.segment_psd(segments).mean(axis=(0, 1))
+        return self.band_powers(psd)
+
+    def filter(self, window: np.ndarray) -> np.ndarray:
+        """
+        Zero-phase band-pass of all channels at once.
+
+        :param window: Raw samples, shape (n_channels, n_samples).
+        """
+        padded: np.ndarray = np.pad(
+            window,
+            ((0, 0), (self._n_edge, self._n_edge)),
+            mode="reflect",
+            reflect_type="odd",
+        )
+        spectrum: np.ndarray = fft.rfft(padded, n=self._conv_fft_len, axis=-1)
+        convolved: np.ndarray = fft.irfft(
+            spectrum * self._fir_spectrum, n=self._conv_fft_len, axis=-1
+        )
+        return convolved[:, self._shift : self._shift + window.shape[1]]
+
+    def segment_psd(self, segments: np.ndarray) -> np.ndarray:
+        """
+        One-sided PSD (density) of each segment along the last axis.
+
+        :param segments: Array of shape (..., n_fft).
+        """
+        detrended: np.ndarray = segments - segments.mean(axis=-1, keepdims=True)
+        spectrum: np.ndarray = fft.rfft(detrended * self.taper, axis=-1)
+        return (spectrum.real**2 + spectrum.imag**2) * self._scale
+
+    def band_powers(self, psd: np.ndarray) -> BandPowers:
+        """
+        Sums a channel-averaged PSD over the alpha, beta and total bands.
+
+        :param psd: PSD on the `freqs` grid.
+        """
+        return BandPowers(
+            alpha=float(psd[self.alpha_mask].sum()),
+            beta=float(psd[self.beta_mask].sum()),
+            total=float(psd[self.total_mask].sum()),
+        )
+
+    def _band_mask(self, band: tuple[float, float]) -> np.ndarray:
+        return (self.freqs >= band[0]) & (self.freqs <= band[1])
@@ -0,0 +1,294 @@
+import multiprocessing as mp
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+import threading
+import time
+import numpy as np
+
+from source.neuro_reader.band_power import BandPowers
+from source.neuro_reader.pipeline import EEGPipeline
+
+
+class SharedSamples:
+    def __init__(
+        self,
+        n_channels: int,
+        capacity: int,
+        name: str | None = None,
+    ) -> None:
+        """
+        Single-producer sample ring in shared memory.
+        Layout: one int64 counter of samples written so far, then a float64
+        (n_channels, capacity) block. The producer writes samples first and bumps
+        the counter after, so a consumer never reads past the last full write.
+
+        :param n_channels: Number of channels.
+        :param capacity: Samples kept per channel.
+        :param name: Name of an existing block to attach to. Creates a new one if None.
+        """
+        self.n_channels: int = n_channels
+        self.capacity: int = capacity
+        size: int = 8 + 8 * n_channels * capacity
+        self.shm: SharedMemory = SharedMemory(name=name, create=name is None, size=size)
+        self._counter: np.ndarray = np.ndarray(
+            (1,), dtype=np.int64, buffer=self.shm.buf
+        )
+        self._data: np.ndarray = np.ndarray(
+            (n_channels, capacity), dtype=np.float64, buffer=self.shm.buf, offset=8
+        )
+        if name is None:
+            self._counter[0] = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def total(self) -> int:
+        return int(self._counter[0])
+
+    @property
+    def max_chunk(self) -> int:
+        """
+        Longest chunk `write` accepts. A longer one would overwrite samples inside
+        the half of the ring that `read` trusts.
+        """
+        return self.capacity // 2
+
+    def write(self, chunk: np.ndarray) -> None:
+        """
+        Appends samples. Only one thread of one process may write.
+
+        :param chunk: Array of shape (n_channels, n_samples), at most `max_chunk` long.
+        """
+        n_samples: int = chunk.shape[1]
+        if n_samples > self.max_chunk:
+            raise ValueError(
+                f"Chunk of {n_samples} samples exceeds the limit of {self.max_chunk}"
+            )
+        total: int = self.total
+        start: int = total % self.capacity
+        first: int = min(n_samples, self.capacity - start)
+        self._data[:, start : start + first] = chunk[:, :first]
+        self._data[:, : n_samples - first] = chunk[:, first:]
+        self._counter[0] = total + n_samples
+
+    def read(self, since: int) -> tuple[np.ndarray, int]:
+        """
+        Copies the samples written after `since`.
+        The producer overwrites old slots before it bumps the counter, so only the
+        newest half of the ring is trusted; anything older is skipped.
+
+        :param since: Absolute index of the first sample wanted.
+        :return: The samples and the absolute index to continue from.
+        """
+        trusted: int = self.capacity // 2
+        total: int = self.total
+        start: int = max(since, total - trusted)
+        positions: np.ndarray = np.arange(start, total) % self.capacity
+        samples: np.ndarray = self._data[:, positions]
+
+        # Drop whatever the producer may have reached during the copy
+        overwritten: int = self.total - trusted - start
+        if overwritten > 0:
+            samples = samples[:, overwritten:]
+        return samples, total
+
+    def close(self) -> None:
+        # Views must be released before the block can be closed
+        del self._counter, self._data
+        self.shm.close()
+
+
+def _dsp_worker(
+    shm_name: str,
+    n_channels: int,
+    capacity: int,
+    sfreq: int,
+    window_duration: float,
+    update_interval: float,
+    results: Connection,
+    control: Connection,
+) -> None:
+    """
+    DSP process main loop: shared samples in, band powers out.
+    """
+    samples: SharedSamples = SharedSamples(n_channels, capacity, name=shm_name)
+    pipeline: EEGPipeline = EEGPipeline(
+        sfreq=sfreq,
+        n_channels=n_channels,
+        window_duration=window_duration,
+        update_interval=update_interval,
+    )
+    position: int = 0  # A restarted worker begins with the newest trusted samples
+    try:
+        while True:
+            while control.poll():
+                message: tuple = control.recv()
+                if message[0] == "stop":
+                    return
+                if message[0] == "reset":
+                    pipeline.reset()
+                    position = max(position, message[1])
+
+            new_samples, position = samples.read(position)
+            if new_samples.shape[1]:
+                pipeline.push(new_samples)
+                powers: BandPowers | None = pipeline.step()
+                if powers is not None:
+                    results.send((powers.alpha, powers.beta, powers.total))
+            time.sleep(update_interval)
+    finally:
+        samples.close()
+
+
+class DSPProcess:
+    def __init__(
+        self,
+        sfreq: int,
+        n_channels: int,
+        window_duration: float = 4.0,
+        update_interval: float = 0.05,
+        buffer_duration: float = 10.0,
+    ) -> None:
+        """
+        Runs `EEGPipeline` in a separate process, so filtering and PSD never compete
+        with the GUI thread for the GIL. Has the same `push`/`step`/`reset`
+        interface as `EEGPipeline`, after an explicit `start`. Samples travel
+        through shared memory and only the three band powers come back.
+        A worker that died is restarted by `step`, the shared memory stays, so
+        `push` on the acquisition thread is never affected.
+
+        :param sfreq: Sampling frequency.
+        :param n_channels: Number of EEG channels in every chunk.
+        :param window_duration: Window length (in seconds).
+        :param update_interval: Time between results (in seconds).
+        :param buffer_duration: Shared ring length (in seconds). The DSP process may
+            fall behind by half of it before samples are dropped.
+        """
+        self.sfreq: int = sfreq
+        self.n_channels: int = n_channels
+        self.window_duration: float = window_duration
+        self.update_interval: float = update_interval
+        self.capacity: int = int(sfreq * max(buffer_duration, window_duration))
+
+        self.samples: SharedSamples | None = None
+        self.process: mp.Process | None = None
+        self._results: Connection | None = None
+        self._control: Connection | None = None
+        self._start_lock: threading.Lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Creates the shared memory and starts the DSP process.
+        Call before the first `push`, not from the acquisition callback.
+        """
+        with self._start_lock:
+            if self.process is None:
+                self.samples = SharedSamples(self.n_channels, self.capacity)
+                self._start_process()
+
+    def _start_process(self) -> None:
+        """
+        Must be called with `_start_lock` held. Attaches a new worker to `samples`.
+        """
+        # Spawn, as forking a process with Qt and audio threads is unsafe
+        context = mp.get_context("spawn")
+        self._results, child_results = context.Pipe(duplex=False)
+        child_control, self._control = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=_dsp_worker,
+            args=(
+                self.samples.name,
+                self.n_channels,
+                self.capacity,
+                self.sfreq,
+                self.window_duration,
+                self.update_interval,
+                child_results,
+                child_control,
+            ),
+            daemon=True,
+        )
+        self.process.start()
+        child_results.close()
+        child_control.close()
+
+    def push(self, chunk: np.ndarray) -> None:
+        """
+        Writes raw samples to shared memory. Must always be called from one thread.
+
+        :param chunk: Array of shape (n_channels, n_samples).
+        """
+        samples: SharedSamples | None = self.samples
+        if samples is None:
+            raise RuntimeError("DSPProcess.start() must be called before push()")
+        # Long chunks go in pieces, each within the trusted half of the ring
+        for start in range(0, chunk.shape[1], samples.max_chunk):
+            samples.write(chunk[:, start : start + samples.max_chunk])
+
+    def step(self) -> BandPowers | None:
+        """
+        Collects results without blocking.
+
+        :return: Newest band powers since the last call, or None.
+        """
+        if self.process is None:
+            return None
+        latest: tuple[float, float, float] | None = None
+        try:
+            while self._results.poll():
+                latest = self._results.recv()
+        except EOFError:
+            print("[DSP Process] Worker died, restarting.")
+            self._restart()
+        if latest is None:
+            return None
+        return BandPowers(*latest)
+
+    def _restart(self) -> None:
+        """
+        Replaces a dead worker. Keeps the shared memory, which `push` may be
+        writing to from the acquisition thread at the same time.
+        """
+        with self._start_lock:
+            if self.process is None:
+                return  # Closed meanwhile
+            self.process.join(timeout=1.0)
+            if self.process.is_alive():
+                self.process.terminate()
+            self._results.close()
+            self._control.close()
+            self._start_process()
+
+    def reset(self) -> None:
+        """
+        Drops the DSP state, samples pushed after this call start a new stream.
+        """
+        if self.process is None:
+            return
+        self._control.send(("reset", self.samples.total))
+        while self._results.poll():
+            self._results.recv()
+
+    def close(self) -> None:
+        """
+        Stops the DSP process and frees the shared memory.
+        Samples pushed afterwards raise, so stop the acquisition first.
+        """
+        with self._start_lock:
+            if self.process is None:
+                return
+            try:
+                self._control.send(("stop",))
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout=5.0)
+            if self.process.is_alive():
+                self.process.terminate()
+            self._results.close()
+            self._control.close()
+            self.samples.close()
+            self.samples.shm.unlink()
+            self.process = None
+            self.samples = None
@@ -0,0 +1,191 @@
+import threading
+import time
+from typing import Callable
+import numpy as np
+import brainaccess.core as bacore
+
+from source.neuro_reader.eeg_service import EEGService
+from source.neuro_reader.pipeline import EEGPipeline
+from source.neuro_reader.snapshot import EEGSnapshot
+from source.neuro_reader.utils import MINI_CAP_CHANNELS
+
+
+class EEGHub:
+    def __init__(
+        self,
+        device_names: list[str] | None = None,
+        window_duration: float = 4.0,
+        update_interval: float = 0.05,
+    ) -> None:
+        """
+        Serves several BrainAccess headsets from one process.
+        Every device gets its own `EEGService` (own `EEGManager`, acquisition and
+        DSP thread), so devices are processed in parallel and one slow or broken
+        headset does not delay the others.
+
+        :param device_names: Bluetooth names of the devices to manage.
+        :param window_duration: Window length (in seconds), for every device.
+        :param update_interval: Time between results (in seconds), for every device.
+        """
+        self.window_duration: float = window_duration
+        self.update_interval: float = update_interval
+        self.services: dict[str, EEGService] = {}
+        self.running: bool = False
+
+        for device_name in device_names or []:
+            self.add_device(device_name)
+
+    @property
+    def device_names(self) -> list[str]:
+        return list(self.services)
+
+    def add_device(self, device_name: str) -> EEGService:
+        """
+        Registers a device. It is started right away if the hub is running.
+
+        :param device_name: Bluetooth device name.
+        """
+        if device_name in self.services:
+            return self.services[device_name]
+
+        service: EEGService = EEGService(
+            device_name=device_name,
+            window_duration=self.window_duration,
+            update_interval=self.update_interval,
+            close_core=False,  # Shared by all devices, closed by the hub
+        )
+        self.services[device_name] = service
+        if self.running:
+            service.start()
+        return service
+
+    def remove_device(self, device_name: str) -> None:
+        service: EEGService | None = self.services.pop(device_name, None)
+        if service:
+            service.stop()
+
+    def start(self) -> None:
+        """
+        Starts all devices.
+        """
+        self.running = True
+        for service in self.services.values():
+            service.start()
+
+    def stop(self) -> None:
+        """
+        Stops all devices and shuts the BrainAccess library down.
+        """
+        self.running = False
+        # Signal every worker first, so they close their connections in parallel
+        for service in self.services.values():
+            service.running = False
+        for service in self.services.values():
+            service.stop()
+        try:
+            bacore.close()
+        except Exception as e:
+            print(f"[EEG Hub] Could not close BrainAccess: {e}")
+
+    def get_data(self, device_name: str) -> EEGSnapshot:
+        return self.services[device_name].get_data()
+
+    def get_all_data(self) -> dict[str, EEGSnapshot]:
+        return {name: service.get_data() for name, service in self.services.items()}
+
+    def subscribe(
+        self, device_name: str, callback: Callable[[EEGSnapshot], None]
+    ) -> Callable[[], None]:
+        """
+        Subscribes to the result stream of one device.
+
+        :param device_name: Bluetooth device name.
+        :param callback: Called with every new snapshot of that device.
+        :return: Function that removes the listener.
+        """
+        return self.services[device_name].subscribe(callback)
+
+    def subscribe_all(
+        self, callback: Callable[[str, EEGSnapshot], None]
+    ) -> Callable[[], None]:
+        """
+        Subscribes to the result streams of all currently registered devices.
+
+        :param callback: Called with the device name and its new snapshot.
+        :return: Function that removes all listeners.
+        """
+        unsubscribers: list[Callable[[], None]] = [
+            service.subscribe(lambda snapshot, name=name: callback(name, snapshot))
+            for name, service in self.services.items()
+        ]
+
+        def unsubscribe_all() -> None:
+            for unsubscribe in unsubscribers:
+                unsubscribe()
+
+        return unsubscribe_all
+
+
+def benchmark(
+    device_counts: tuple[int, ...] = (1, 2, 4, 8),
+    duration: float = 2.0,
+    sfreq: int = 250,
+    update_interval: float = 0.05,
+) -> dict[int, float]:
+    """
+    Measures DSP throughput of the hub layout (one processing thread per device),
+    fed with synthetic samples as fast as possible instead of real headsets.
+
+    :param device_counts: Numbers of simultaneous devices to test.
+    :param duration: Measuring time per device count (in seconds).
+    :return: Total windows per second for every device count.
+    """
+    n_channels: int = len(MINI_CAP_CHANNELS)
+    hop: int = max(1, round(sfreq * update_interval))
+    rng: np.random.Generator = np.random.default_rng(0)
+    data: np.ndarray = rng.standard_normal((n_channels, sfreq * 60))
+    results: dict[int, float] = {}
+
+    for n_devices in device_counts:
+        counts: list[int] = [0] * n_devices
+        barrier: threading.Barrier = threading.Barrier(n_devices)
+
+        def device_worker(index: int) -> None:
+            pipeline: EEGPipeline = EEGPipeline(
+                sfreq=sfreq, n_channels=n_channels, update_interval=update_interval
+            )
+            pipeline.push(data[:, : pipeline.buffer.capacity])
+            pipeline.step()
+            position: int = pipeline.buffer.capacity
+            barrier.wait()
+            deadline: float = time.perf_counter() + duration
+            while time.perf_counter() < deadline:
+                pipeline.push(data[:, position : position + hop])
+                pipeline.step()
+                counts[index] += 1
+                position = (position + hop) % (data.shape[1] - hop)
+
+        threads: list[threading.Thread] = [
+            threading.Thread(target=device_worker, args=(index,))
+            for index in range(n_devices)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        results[n_devices] = sum(counts) / duration
+    return results
+
+
+if __name__ == "__main__":
+    """
+    Use `python -m source.neuro_reader.eeg_hub` to run the benchmark below.
+    """
+    realtime_rate: float = 1 / 0.05  # Windows per second needed by one device
+    print("devices | windows/s total | windows/s per device | x real time")
+    for devices, rate in benchmark().items():
+        print(
+            f"{devices:7d} | {rate:15.0f} | {rate / devices:20.0f} | "
+            f"{rate / devices / realtime_rate:11.0f}"
+        )
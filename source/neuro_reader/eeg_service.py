@@ -1,3 +1,4 @@
+from pathlib import Path
 import time
 import threading
 import numpy as np
@@ -5,21 +6,46 @@ import mne
 from brainaccess.utils import acquisition
 from brainaccess.core.eeg_manager import EEGManager
 
-from source.neuro_reader.utils import MINI_CAP_CHANNELS, EEGDataDict, StatusEnum
+from source.neuro_reader.band_power import BandPowers
+from source.neuro_reader.dsp_process import DSPProcess
+from source.neuro_reader.pipeline import EEGPipeline
+from source.neuro_reader.session_recorder import SessionRecorder
+from source.neuro_reader.snapshot import SnapshotPublisher
+from source.neuro_reader.utils import MINI_CAP_CHANNELS, StatusEnum
 
 mne.set_log_level("WARNING")
 
 
-class EEGService:
-    def __init__(self, device_name="BA MINI 052", window_duration=4.0):
+class EEGService(SnapshotPublisher):
+    def __init__(
+        self,
+        device_name="BA MINI 052",
+        window_duration=4.0,
+        update_interval=0.05,
+        close_core=True,
+        offload=False,
+        record_dir=None,
+    ):
         """
         Initialize EEG service.
 
         :param device_name: Bluetooth device name.
         :param window_duration: Window length (in seconds). 4.0s proves to be a stable value.
+        :param update_interval: Time between published results (in seconds).
+        :param close_core: Shut the BrainAccess library down on stop. Must be False
+            when other devices are still streaming in this process (see `EEGHub`).
+        :param offload: Run filtering and PSD in a separate process (see `DSPProcess`),
+            so numeric work never holds the GIL needed by the GUI thread.
+        :param record_dir: If set, every connection is recorded to a new session
+            directory inside it (see `SessionRecorder`).
         """
+        super().__init__()
         self.device_name: str = device_name
         self.window_duration: float = window_duration
+        self.update_interval: float = update_interval
+        self.close_core: bool = close_core
+        self.offload: bool = offload
+        self.record_dir: Path | None = Path(record_dir) if record_dir else None
         self.sfreq: int = 250
 
         self.cap: dict[int, str] = MINI_CAP_CHANNELS
@@ -30,14 +56,17 @@ class EEGService:
         self.eeg: acquisition.EEG = acquisition.EEG()
         self.mgr: EEGManager | None = None
 
-        self.latest_data: EEGDataDict = {
-            "stress_index": 0.0,
-            "alpha_rel": 0.0,
-            "beta_rel": 0.0,
-            "status": StatusEnum.DISCONNECTED.value,
-            "connected": False,
-            "is_ready": False,
-        }
+        self._eeg_rows: list[int] = []
+        self.recorder: SessionRecorder | None = None
+        pipeline_class: type[EEGPipeline] | type[DSPProcess] = (
+            DSPProcess if offload else EEGPipeline
+        )
+        self.pipeline: EEGPipeline | DSPProcess = pipeline_class(
+            sfreq=self.sfreq,
+            n_channels=len(self.cap),
+            window_duration=self.window_duration,
+            update_interval=self.update_interval,
+        )
 
     def start(self):
         """
@@ -47,6 +76,9 @@ class EEGService:
             print("[EEG Service] Is already working.")
             return
 
+        if self.offload:
+            # Spawned here, never on the BrainAccess callback thread
+            self.pipeline.start()
         self.running = True
         self.thread = threading.Thread(target=self._worker_loop, daemon=True)
         self.thread.start()
@@ -60,15 +92,10 @@ class EEGService:
         self.running = False
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5.0)  # Wait max 5 seconds for closing
+        if self.offload:
+            self.pipeline.close()
         print("[EEG Service] Stopped.")
 
-    def get_data(self):
-        """
-        Pipeline method used in `__main__.py`.
-        Returns a copy of the dictionary.
-        """
-        return self.latest_data.copy()
-
     def _worker_loop(self):
         """
         Main data getter loop.
@@ -77,89 +104,91 @@ class EEGService:
             with EEGManager() as mgr:
                 self.mgr = mgr
                 print("[EEG Worker] Connecting...")
-                self.latest_data["status"] = StatusEnum.CONNECTED.value
+                self._publish(status=StatusEnum.CONNECTED.value)
 
                 self.eeg.setup(
                     mgr, device_name=self.device_name, cap=self.cap, sfreq=self.sfreq
                 )
                 self.eeg.start_acquisition()
+                eeg_channels: list[str] = [
+                    channel
+                    for channel, kind in self.eeg.channels_type.items()
+                    if kind == "EEG"
+                ]
+                self._eeg_rows = [
+                    self.eeg.channels_indexes[channel] for channel in eeg_channels
+                ]
+                if self.record_dir:
+                    self._start_recording(eeg_channels)
+                # Replaces the accumulating callback, so the session is no longer
+                # kept in memory by BrainAccess.
+                mgr.set_callback_chunk(self._on_chunk)
 
                 print(f"[EEG Worker] Bufforing {self.window_duration}s of data...")
-                self.latest_data["connected"] = True
-                self.latest_data["status"] = StatusEnum.BUFFERING.value
-
-                time.sleep(self.window_duration)
-                self.latest_data["is_ready"] = True
+                self._publish(connected=True, status=StatusEnum.BUFFERING.value)
 
                 while self.running:
-                    mne_raw = self.eeg.get_mne()
+                    powers: BandPowers | None = self.pipeline.step()
 
-                    if mne_raw.n_times < self.sfreq * self.window_duration:
-                        time.sleep(0.1)
+                    if powers is None:
+                        time.sleep(self.update_interval)
                         continue
 
-                    # 2. Get latest Window (X seconds)
-                    current_end = mne_raw.times[-1]
-                    tmin: float = max(0, current_end - self.window_duration)
-                    mne_window = mne_raw.copy().crop(tmin=tmin)
-
-                    mne_window.filter(4, 40, verbose=False)
-
-                    # Computing PSD (Power Spectral Density)
-                    n_fft: int = min(256, len(mne_window.times))
-                    spectrum = mne_window.compute_psd(
-                        method="welch", fmin=4, fmax=40, n_fft=n_fft, verbose=False
-                    )
-                    psds, freqs = spectrum.get_data(return_freqs=True)
-
-                    avg_psd = np.mean(psds, axis=0)
-
-                    alpha_mask = (freqs >= 8) & (freqs <= 13)
-                    beta_mask = (freqs >= 13) & (freqs <= 30)
-                    total_mask = (freqs >= 4) & (freqs <= 40)
-
-                    power_alpha = np.sum(avg_psd[alpha_mask])
-                    power_beta = np.sum(avg_psd[beta_mask])
-                    power_total = np.sum(avg_psd[total_mask])
-
-                    if power_total == 0:
-                        power_total = 1e-9
-
-                    ratio = power_beta / power_alpha if power_alpha > 0 else 0.0
-
-                    mood_text: str = "RELAX"
-                    if ratio > 1.5:
-                        mood_text = "HIGH STRESS"
-                    elif ratio > 1.0:
-                        mood_text = "FOCUS"
-
-                    # 6. Aktualizacja zmiennej publicznej
-                    self.latest_data.update(
-                        {
-                            "stress_index": ratio,
-                            "alpha_rel": power_alpha / power_total,
-                            "beta_rel": power_beta / power_total,
-                            "status": StatusEnum.COMPUTED.value,
-                            "mood": mood_text,
-                            "connected": True,
-                            "is_ready": True,
-                        }
+                    # 6. Publishing a new snapshot
+                    self._publish(
+                        stress_index=powers.stress_index,
+                        alpha_rel=powers.alpha_rel,
+                        beta_rel=powers.beta_rel,
+                        status=StatusEnum.COMPUTED.value,
+                        mood=powers.mood,
+                        connected=True,
+                        is_ready=True,
                     )
 
-                    time.sleep(0.2)
+                    time.sleep(self.update_interval)
 
         except Exception as e:
             print(f"[EEG Worker] Critical error: {e}")
-            self.latest_data["status"] = StatusEnum.ERROR.value
-            self.latest_data["connected"] = False
-            self.latest_data["is_ready"] = False
+            self._publish(
+                status=StatusEnum.ERROR.value, connected=False, is_ready=False
+            )
         finally:
             print("[EEG Worker] Closing connection...")
             try:
+                if self.mgr:
+                    self.mgr.set_callback_chunk(None)
                 self.eeg.stop_acquisition()
-                self.eeg.close()
+                if self.close_core:
+                    self.eeg.close()
                 if self.mgr:
                     self.mgr.disconnect()
             except Exception:
                 pass
-            self.latest_data["connected"] = False
+            self._publish(connected=False)
+            self.pipeline.reset()
+            if self.recorder:
+                self.unsubscribe(self.recorder.write_result)
+                self.recorder.close()
+                self.recorder = None
+
+    def _start_recording(self, ch_names: list[str]):
+        """
+        Opens a new session directory and records every chunk and result into it.
+        """
+        session_path: Path = self.record_dir / time.strftime("%Y%m%d_%H%M%S")
+        self.recorder = SessionRecorder(session_path, self.sfreq, ch_names)
+        self.recorder.start()
+        self.subscribe(self.recorder.write_result)
+
+    def _on_chunk(self, chunk: list[np.ndarray], chunk_size: int):
+        """
+        BrainAccess chunk callback. Runs on the device thread, so it only copies
+        the EEG rows out of the driver memory and queues them.
+
+        :param chunk: One array per stream channel.
+        :param chunk_size: Number of samples in the chunk.
+        """
+        samples: np.ndarray = np.array([chunk[row] for row in self._eeg_rows])
+        self.pipeline.push(samples)
+        if self.recorder:
+            self.recorder.write_samples(samples)
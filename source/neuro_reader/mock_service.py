@@ -1,19 +1,39 @@
 import random
+import threading
 import time
 
+from source.neuro_reader.snapshot import SnapshotPublisher
 
-class MockEEGService:
-    def __init__(self):
+
+class MockEEGService(SnapshotPublisher):
+    def __init__(self, update_interval=0.2):
+        super().__init__()
         self.start_time = time.time()
+        self.update_interval: float = update_interval
+
+        self.running: bool = False
+        self.thread: threading.Thread = None
         print("USING MOCK")
 
     def start(self):
-        pass
+        if self.running:
+            return
+
+        self.running = True
+        self.thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self.thread.start()
 
     def stop(self):
-        pass
+        self.running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=1.0)
+
+    def _worker_loop(self):
+        while self.running:
+            self._simulate()
+            time.sleep(self.update_interval)
 
-    def get_data(self):
+    def _simulate(self):
         """
         Simulate data
         """
@@ -35,12 +55,12 @@ class MockEEGService:
         jitter = random.uniform(-0.1, 0.1)
         fake_ratio = max(0.0, base_stress + jitter)
 
-        return {
-            "stress_index": fake_ratio,
-            "alpha_rel": 0.5,
-            "beta_rel": 0.5,
-            "status": "SIMULATED",
-            "connected": True,
-            "is_ready": True,
-            "mood": mood,
-        }
+        self._publish(
+            stress_index=fake_ratio,
+            alpha_rel=0.5,
+            beta_rel=0.5,
+            status="SIMULATED",
+            connected=True,
+            is_ready=True,
+            mood=mood,
+        )
@@ -0,0 +1,72 @@
+from collections import deque
+import numpy as np
+
+from source.neuro_reader.band_power import BandPowerEngine, BandPowers
+from source.neuro_reader.ring_buffer import RingBuffer
+from source.neuro_reader.sliding_welch import SlidingWelch
+from source.neuro_reader.streaming_filter import StreamingBandpass
+
+
+class EEGPipeline:
+    def __init__(
+        self,
+        sfreq: int,
+        n_channels: int,
+        window_duration: float = 4.0,
+        update_interval: float = 0.05,
+    ) -> None:
+        """
+        Device-independent processing chain:
+        queued chunks -> streaming band-pass -> ring buffer -> sliding Welch -> bands.
+
+        :param sfreq: Sampling frequency.
+        :param n_channels: Number of EEG channels in every chunk.
+        :param window_duration: Window length (in seconds).
+        :param update_interval: Time between results (in seconds), sets the Welch hop.
+        """
+        self.sfreq: int = sfreq
+        self.n_channels: int = n_channels
+
+        # Chunks may be pushed from any thread (e.g. the BrainAccess callback);
+        # everything after the queue is only touched by the thread calling `step`.
+        self._pending_chunks: deque[np.ndarray] = deque()
+        self.bandpass: StreamingBandpass = StreamingBandpass(
+            sfreq=sfreq, n_channels=n_channels
+        )
+        n_window: int = int(sfreq * window_duration)
+        hop: int = max(1, round(sfreq * update_interval))
+        self.engine: BandPowerEngine = BandPowerEngine(sfreq=sfreq, n_samples=n_window)
+        self.welch: SlidingWelch = SlidingWelch(self.engine, hop=hop)
+        # One hop of slack, so all segments of the window are still in the buffer
+        # even when a large batch arrives at once
+        self.buffer: RingBuffer = RingBuffer(
+            n_channels=n_channels, capacity=n_window + hop
+        )
+
+    def push(self, chunk: np.ndarray) -> None:
+        """
+        Queues raw samples. Safe to call from another thread.
+
+        :param chunk: Array of shape (n_channels, n_samples), owned by the pipeline.
+        """
+        self._pending_chunks.append(chunk)
+
+    def step(self) -> BandPowers | None:
+        """
+        Processes everything queued so far.
+
+        :return: Band powers of the latest window, or None while still buffering.
+        """
+        while self._pending_chunks:
+            self.buffer.extend(self.bandpass.process(self._pending_chunks.popleft()))
+        self.welch.update(self.buffer)
+
+        if not self.welch.is_ready:
+            return None
+        return self.engine.band_powers(self.welch.psd())
+
+    def reset(self) -> None:
+        self._pending_chunks.clear()
+        self.bandpass.reset()
+        self.buffer.reset()
+        self.welch.reset()
@@ -0,0 +1,163 @@
+import math
+from pathlib import Path
+import sys
+import threading
+import time
+import numpy as np
+import mne
+
+from source.neuro_reader.band_power import BandPowers
+from source.neuro_reader.pipeline import EEGPipeline
+from source.neuro_reader.session_recorder import SessionReader
+from source.neuro_reader.snapshot import SnapshotPublisher
+from source.neuro_reader.utils import StatusEnum
+
+AS_FAST_AS_POSSIBLE: float = math.inf
+
+
+def load_recording(file_path: str | Path) -> tuple[np.ndarray, float]:
+    """
+    Reads raw EEG from disk.
+    Directories are sessions written by `SessionRecorder` (memory-mapped),
+    `.npz` files need a `data` array (n_channels, n_samples) and an `sfreq` value,
+    anything else is opened with `mne.io.read_raw` and reduced to EEG channels.
+
+    :param file_path: Recording path.
+    :return: Samples and sampling frequency.
+    """
+    path: Path = Path(file_path)
+    if path.is_dir():
+        session: SessionReader = SessionReader(path)
+        return session.samples, session.sfreq
+    if path.suffix == ".npz":
+        with np.load(path) as recording:
+            return np.asarray(recording["data"], dtype=np.float64), float(
+                recording["sfreq"]
+            )
+
+    raw: mne.io.BaseRaw = mne.io.read_raw(path, preload=True, verbose=False)
+    raw.pick("eeg")
+    return raw.get_data(), float(raw.info["sfreq"])
+
+
+class ReplayEEGService(SnapshotPublisher):
+    def __init__(
+        self,
+        file_path: str | Path,
+        speed: float = 1.0,
+        window_duration: float = 4.0,
+        update_interval: float = 0.05,
+    ):
+        """
+        Streams a recorded session through the real processing pipeline.
+        Drop-in replacement for `EEGService` (same `start`/`stop`/`get_data`).
+
+        :param file_path: Recording, see `load_recording`.
+        :param speed: Playback speed multiplier, `AS_FAST_AS_POSSIBLE` for no pacing.
+        :param window_duration: Window length (in seconds).
+        :param update_interval: Recording time between results (in seconds).
+        """
+        super().__init__()
+        self.file_path: Path = Path(file_path)
+        self.speed: float = speed
+        self.window_duration: float = window_duration
+        self.update_interval: float = update_interval
+
+        self.data, self.sfreq = load_recording(self.file_path)
+
+        self.running: bool = False
+        self.thread: threading.Thread = None
+        self.finished: threading.Event = threading.Event()
+
+        self.windows_computed: int = 0
+        self.elapsed: float = 0.0  # Wall time of the last replay (in seconds)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Windows per second of the last replay.
+        """
+        return self.windows_computed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def start(self):
+        """
+        Starts the replay in the background.
+        """
+        if self.running:
+            print("[Replay Service] Is already working.")
+            return
+
+        self.running = True
+        self.finished.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        print(f"[Replay Service] Replaying {self.file_path.name} at x{self.speed}")
+
+    def stop(self):
+        self.running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=5.0)
+
+    def run(self):
+        """
+        Replays the whole recording in the calling thread.
+        """
+        self.running = True
+        pipeline: EEGPipeline = EEGPipeline(
+            sfreq=int(self.sfreq),
+            n_channels=self.data.shape[0],
+            window_duration=self.window_duration,
+            update_interval=self.update_interval,
+        )
+        hop: int = pipeline.welch.hop
+        self.windows_computed = 0
+        self._publish(connected=True, status=StatusEnum.BUFFERING.value)
+
+        started: float = time.perf_counter()
+        try:
+            for position in range(0, self.data.shape[1], hop):
+                if not self.running:
+                    break
+                if self.speed != AS_FAST_AS_POSSIBLE:
+                    # Wait until this chunk would have been recorded
+                    due: float = started + position / self.sfreq / self.speed
+                    delay: float = due - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+
+                pipeline.push(self.data[:, position : position + hop])
+                powers: BandPowers | None = pipeline.step()
+                if powers is None:
+                    continue
+
+                self.windows_computed += 1
+                self._publish(
+                    stress_index=powers.stress_index,
+                    alpha_rel=powers.alpha_rel,
+                    beta_rel=powers.beta_rel,
+                    status=StatusEnum.COMPUTED.value,
+                    mood=powers.mood,
+                    is_ready=True,
+                )
+        finally:
+            self.elapsed = time.perf_counter() - started
+            self.running = False
+            self._publish(
+                connected=False,
+                is_ready=False,
+                status=StatusEnum.DISCONNECTED.value,
+            )
+            self.finished.set()
+
+
+if __name__ == "__main__":
+    """
+    Use `python -m source.neuro_reader.replay_service <recording>` to measure
+    offline pipeline throughput.
+    """
+    service: ReplayEEGService = ReplayEEGService(sys.argv[1], speed=AS_FAST_AS_POSSIBLE)
+    service.run()
+    print(
+        f"{service.windows_computed} windows in {service.elapsed:.2f}s "
+        f"({service.throughput:.0f} windows/s)"
+    )
@@ -0,0 +1,93 @@
+import numpy as np
+
+
+class RingBuffer:
+    def __init__(self, n_channels: int, capacity: int, dtype=np.float64) -> None:
+        """
+        Fixed-size, preallocated multichannel sample buffer.
+        Every sample is stored twice (at `i` and `i + capacity`), so any run of the
+        most recent `capacity` samples is one contiguous slice and can be returned
+        as a view, without copying.
+
+        :param n_channels: Number of rows (channels).
+        :param capacity: Number of samples kept per channel.
+        :param dtype: Sample type.
+        """
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive.")
+
+        self.n_channels: int = n_channels
+        self.capacity: int = capacity
+        self.total: int = 0  # Number of samples written since creation/reset
+
+        self._buffer: np.ndarray = np.zeros((n_channels, 2 * capacity), dtype=dtype)
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    @property
+    def is_full(self) -> bool:
+        return self.total >= self.capacity
+
+    def reset(self) -> None:
+        """
+        Forgets all samples, keeps the allocation.
+        """
+        self.total = 0
+
+    def extend(self, chunk: np.ndarray) -> None:
+        """
+        Appends new samples.
+
+        :param chunk: Array of shape (n_channels, n_samples).
+        """
+        n_samples: int = chunk.shape[1]
+        if n_samples == 0:
+            return
+        if n_samples > self.capacity:
+            # Only the tail can survive anyway
+            self.total += n_samples - self.capacity
+            chunk = chunk[:, -self.capacity :]
+            n_samples = self.capacity
+
+        head: int = self.total % self.capacity
+        first: int = min(n_samples, self.capacity - head)
+        self._write(head, chunk[:, :first])
+        if first < n_samples:
+            self._write(0, chunk[:, first:])
+
+        self.total += n_samples
+
+    def latest(self, n_samples: int | None = None) -> np.ndarray:
+        """
+        Returns a read-only view of the newest samples, oldest first.
+
+        :param n_samples: How many samples to return. Defaults to all stored ones.
+        """
+        if n_samples is None:
+            n_samples = len(self)
+        return self.view(self.total - n_samples, self.total)
+
+    def view(self, start: int, stop: int) -> np.ndarray:
+        """
+        Returns a read-only view of samples by absolute index (counted from creation).
+
+        :param start: Absolute index of the first sample.
+        :param stop: Absolute index one past the last sample.
+        """
+        if not (self.total - len(self) <= start <= stop <= self.total):
+            raise IndexError(
+                f"Samples [{start}, {stop}) are not in the buffer "
+                f"(holding [{self.total - len(self)}, {self.total}))."
+            )
+        offset: int = start % self.capacity
+        window: np.ndarray = self._buffer[:, offset : offset + (stop - start)]
+        window.flags.writeable = False
+        return window
+
+    def _write(self, position: int, block: np.ndarray) -> None:
+        width: int = block.shape[1]
+        self._buffer[:, position : position + width] = block
+        self._buffer[:, position + self.capacity : position + self.capacity + width] = (
+            block
+        )
@@ -0,0 +1,274 @@
+import json
+from pathlib import Path
+import queue
+import threading
+import time
+import numpy as np
+
+from source.neuro_reader.snapshot import EEGSnapshot
+
+# Session directory layout, every file is append-only
+META_FILE: str = "meta.json"
+SAMPLES_FILE: str = "samples.f32"  # float32, sample-major (n_samples, n_channels)
+RESULTS_FILE: str = "results.bin"  # RESULT_DTYPE records
+INDEX_FILE: str = "index.bin"  # INDEX_DTYPE records
+
+RESULT_DTYPE: np.dtype = np.dtype(
+    [
+        ("sample_index", "<i8"),  # Samples recorded before the result
+        ("timestamp", "<f8"),
+        ("stress_index", "<f8"),
+        ("alpha_rel", "<f8"),
+        ("beta_rel", "<f8"),
+        ("status", "S16"),
+        ("mood", "S16"),
+        ("connected", "?"),
+        ("is_ready", "?"),
+    ]
+)
+INDEX_DTYPE: np.dtype = np.dtype(
+    [
+        ("sample_index", "<i8"),
+        ("result_index", "<i8"),
+        ("timestamp", "<f8"),
+    ]
+)
+
+
+class SessionRecorder:
+    def __init__(
+        self,
+        path: str | Path,
+        sfreq: float,
+        ch_names: list[str],
+        queue_size: int = 1024,
+        index_interval: float = 1.0,
+    ) -> None:
+        """
+        Append-only recorder of raw samples and computed results.
+        `write_samples` and `write_result` only enqueue, a writer thread does the
+        file I/O, so callers (e.g. the acquisition callback) never wait on the disk.
+        When the queue is full the data is dropped and counted instead.
+
+        :param path: Session directory, created if missing.
+        :param sfreq: Sampling frequency.
+        :param ch_names: Channel names, in row order of the written chunks.
+        :param queue_size: Maximum number of pending writes.
+        :param index_interval: Recording time between index blocks (in seconds).
+        """
+        self.path: Path = Path(path)
+        self.sfreq: float = sfreq
+        self.ch_names: list[str] = list(ch_names)
+        self.index_every: int = max(1, int(sfreq * index_interval))
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.thread: threading.Thread | None = None
+        self.error: Exception | None = None  # Set if the writer thread failed
+
+        self.samples_written: int = 0
+        self.results_written: int = 0
+        self.dropped_samples: int = 0
+        self.dropped_results: int = 0
+        self._next_index: int = 0
+
+    def start(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._write_meta()
+        self.thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.thread.start()
+        print(f"[Session Recorder] Recording to {self.path}")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Writes everything still queued and stops the writer.
+        Never blocks longer than `timeout`, e.g. when the disk hangs or the writer
+        died with a full queue.
+
+        :param timeout: Maximum wait for the writer (in seconds).
+        """
+        if self.thread is None:
+            return
+        deadline: float = time.monotonic() + timeout
+        if self.thread.is_alive():
+            try:
+                # The stop marker must not be dropped, wait for room in the queue
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            self.thread.join(max(0.0, deadline - time.monotonic()))
+        if self.thread.is_alive():
+            print(
+                "[Session Recorder] Writer did not finish, session may be incomplete."
+            )
+        self.thread = None
+
+        if self.error is not None:
+            print(f"[Session Recorder] Writer failed: {self.error}")
+        try:
+            self._write_meta()
+        except OSError as e:
+            print(f"[Session Recorder] Could not write {META_FILE}: {e}")
+        if self.dropped_samples or self.dropped_results:
+            print(
+                f"[Session Recorder] Dropped {self.dropped_samples} samples and "
+                f"{self.dropped_results} results."
+            )
+
+    def write_samples(self, chunk: np.ndarray) -> None:
+        """
+        Queues raw samples without blocking.
+
+        :param chunk: Array of shape (n_channels, n_samples), must not be modified later.
+        """
+        try:
+            self._queue.put_nowait(chunk)
+        except queue.Full:
+            self.dropped_samples += chunk.shape[1]
+
+    def write_result(self, snapshot: EEGSnapshot) -> None:
+        """
+        Queues a computed result without blocking. Can be used as a subscriber.
+        """
+        try:
+            self._queue.put_nowait(snapshot)
+        except queue.Full:
+            self.dropped_results += 1
+
+    def _writer_loop(self) -> None:
+        try:
+            self._write_queued()
+        except Exception as e:
+            self.error = e
+            print(f"[Session Recorder] Writer stopped: {e}")
+
+    def _write_queued(self) -> None:
+        with (
+            open(self.path / SAMPLES_FILE, "ab") as samples_file,
+            open(self.path / RESULTS_FILE, "ab") as results_file,
+            open(self.path / INDEX_FILE, "ab") as index_file,
+        ):
+            last_flush: float = time.monotonic()
+            while True:
+                item: np.ndarray | EEGSnapshot | None = self._queue.get()
+                if item is None:
+                    return
+
+                if isinstance(item, EEGSnapshot):
+                    self._append_result(results_file, item)
+                else:
+                    self._append_samples(samples_file, index_file, item)
+
+                # Lets readers follow a live session
+                if time.monotonic() - last_flush > 1.0:
+                    for file in (samples_file, results_file, index_file):
+                        file.flush()
+                    last_flush = time.monotonic()
+
+    def _append_samples(self, samples_file, index_file, chunk: np.ndarray) -> None:
+        # Index blocks point at the first sample written after each interval
+        while self._next_index < self.samples_written + chunk.shape[1]:
+            block: np.ndarray = np.zeros(1, dtype=INDEX_DTYPE)
+            block["sample_index"] = max(self._next_index, self.samples_written)
+            block["result_index"] = self.results_written
+            block["timestamp"] = time.time()
+            index_file.write(block.tobytes())
+            self._next_index += self.index_every
+
+        samples_file.write(np.ascontiguousarray(chunk.T, dtype="<f4").tobytes())
+        self.samples_written += chunk.shape[1]
+
+    def _append_result(self, results_file, snapshot: EEGSnapshot) -> None:
+        record: np.ndarray = np.zeros(1, dtype=RESULT_DTYPE)
+        record["sample_index"] = self.samples_written
+        record["timestamp"] = snapshot.timestamp
+        record["stress_index"] = snapshot.stress_index
+        record["alpha_rel"] = snapshot.alpha_rel
+        record["beta_rel"] = snapshot.beta_rel
+        record["status"] = snapshot.status.encode()
+        record["mood"] = snapshot.mood.encode()
+        record["connected"] = snapshot.connected
+        record["is_ready"] = snapshot.is_ready
+        results_file.write(record.tobytes())
+        self.results_written += 1
+
+    def _write_meta(self) -> None:
+        meta: dict = {
+            "sfreq": self.sfreq,
+            "ch_names": self.ch_names,
+            "samples_written": self.samples_written,
+            "results_written": self.results_written,
+            "dropped_samples": self.dropped_samples,
+            "dropped_results": self.dropped_results,
+        }
+        (self.path / META_FILE).write_text(json.dumps(meta, indent=2))
+
+
+class SessionReader:
+    def __init__(self, path: str | Path) -> None:
+        """
+        Zero-copy view of a recorded session. Arrays are `np.memmap`s, so only
+        the parts that are actually accessed are read from disk. Trailing partial
+        records (e.g. after a crash) are ignored.
+
+        :param path: Session directory written by `SessionRecorder`.
+        """
+        self.path: Path = Path(path)
+        meta: dict = json.loads((self.path / META_FILE).read_text())
+        self.sfreq: float = meta["sfreq"]
+        self.ch_names: list[str] = meta["ch_names"]
+        self.meta: dict = meta
+
+        n_channels: int = len(self.ch_names)
+        self.samples: np.ndarray = self._map(
+            SAMPLES_FILE, np.dtype("<f4"), (n_channels,)
+        ).T
+        self.results: np.ndarray = self._map(RESULTS_FILE, RESULT_DTYPE)
+        self.index: np.ndarray = self._map(INDEX_FILE, INDEX_DTYPE)
+
+    def _map(
+        self, name: str, dtype: np.dtype, shape: tuple[int, ...] = ()
+    ) -> np.ndarray:
+        row_size: int = dtype.itemsize * int(np.prod(shape))
+        n_rows: int = (self.path / name).stat().st_size // row_size
+        if n_rows == 0:
+            return np.zeros((0, *shape), dtype=dtype)
+        return np.memmap(
+            self.path / name, dtype=dtype, mode="r", shape=(n_rows, *shape)
+        )
+
+    @property
+    def duration(self) -> float:
+        """
+        Recorded time (in seconds).
+        """
+        return self.samples.shape[1] / self.sfreq
+
+    def sample_at(self, timestamp: float) -> int:
+        """
+        Approximate sample index recorded at a wall-clock time, from the index blocks.
+        """
+        if len(self.index) == 0:
+            return 0
+        block: int = max(
+            0, int(np.searchsorted(self.index["timestamp"], timestamp, "right")) - 1
+        )
+        offset: float = (timestamp - self.index["timestamp"][block]) * self.sfreq
+        return int(
+            min(self.index["sample_index"][block] + offset, self.samples.shape[1])
+        )
+
+    def window(self, start: float, stop: float) -> np.ndarray:
+        """
+        Samples between two recording times (in seconds), as a view.
+        """
+        return self.samples[:, int(start * self.sfreq) : int(stop * self.sfreq)]
+
+    def results_between(self, start: float, stop: float) -> np.ndarray:
+        """
+        Results computed between two recording times (in seconds).
+        """
+        positions: np.ndarray = self.results["sample_index"]
+        first, last = np.searchsorted(
+            positions, [start * self.sfreq, stop * self.sfreq], side="left"
+        )
+        return self.results[first:last]
@@ -0,0 +1,93 @@
+import numpy as np
+
+from source.neuro_reader.band_power import BandPowerEngine
+from source.neuro_reader.ring_buffer import RingBuffer
+
+
+class SlidingWelch:
+    def __init__(
+        self,
+        engine: BandPowerEngine,
+        hop: int,
+        gain: np.ndarray | None = None,
+    ) -> None:
+        """
+        Welch PSD of the latest window, updated incrementally.
+        Segments start at absolute sample indices that are multiples of `hop`, so a
+        segment never changes once complete: each update computes only the segments
+        that became complete since the previous one, and old ones drop out of a
+        fixed ring of per-segment spectra as they leave the window.
+
+        :param engine: Provides window length, segment length, taper and scaling.
+        :param hop: Distance between segment starts (samples). Sets the update rate.
+        :param gain: Optional per-frequency weights applied to every segment.
+        """
+        if not 0 < hop <= engine.n_fft:
+            raise ValueError(f"Hop must be in range (0, {engine.n_fft}], got {hop}.")
+
+        self.engine: BandPowerEngine = engine
+        self.hop: int = hop
+        self.gain: np.ndarray | None = gain
+        self.n_slots: int = (engine.n_samples - engine.n_fft) // hop + 1
+
+        self._spectra: np.ndarray = np.zeros((self.n_slots, len(engine.freqs)))
+        self._next_segment: int = 0  # First segment index not computed yet
+        self._filled: int = 0  # Consecutive valid segments ending at `_next_segment`
+
+    @property
+    def is_ready(self) -> bool:
+        return self._filled == self.n_slots
+
+    def reset(self) -> None:
+        self._next_segment = 0
+        self._filled = 0
+
+    def update(self, buffer: RingBuffer) -> int:
+        """
+        Computes the segments completed since the last call.
+
+        :param buffer: Source of samples, at least one window + one hop long.
+        :return: Number of new segments.
+        """
+        n_fft: int = self.engine.n_fft
+        if buffer.total < n_fft:
+            return 0
+
+        last: int = (buffer.total - n_fft) // self.hop
+        oldest_available: int = -(-(buffer.total - len(buffer)) // self.hop)
+        first: int = max(self._next_segment, last - self.n_slots + 1, oldest_available)
+        if first > last:
+            return 0
+
+        if first > self._next_segment:
+            self._filled = 0  # Gap, older segments are no longer contiguous
+
+        segments: np.ndarray = np.stack(
+            [
+                buffer.view(index * self.hop, index * self.hop + n_fft)
+                for index in range(first, last + 1)
+            ]
+        )
+        spectra: np.ndarray = self.engine.segment_psd(segments).mean(axis=1)
+        if self.gain is not None:
+            spectra *= self.gain
+
+        slots: np.ndarray = np.arange(first, last + 1) % self.n_slots
+        self._spectra[slots] = spectra
+
+        n_new: int = last - first + 1
+        self._next_segment = last + 1
+        self._filled = min(self._filled + n_new, self.n_slots)
+        return n_new
+
+    def psd(self) -> np.ndarray:
+        """
+        Channel-averaged PSD over the segments currently in the window.
+        """
+        if self._filled == self.n_slots:
+            return self._spectra.mean(axis=0)
+        slots: np.ndarray = (
+            np.arange(self._next_segment - self._filled, self._next_segment)
+            % self.n_slots
+        )
+        return self._spectra[slots].mean(axis=0)
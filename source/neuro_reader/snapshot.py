@@ -0,0 +1,154 @@
+import threading
+import time
+from typing import Callable
+
+from source.neuro_reader.utils import EEGDataDict, StatusEnum
+
+
+class EEGSnapshot:
+    __slots__ = (
+        "seq",
+        "timestamp",
+        "stress_index",
+        "alpha_rel",
+        "beta_rel",
+        "status",
+        "mood",
+        "connected",
+        "is_ready",
+    )
+
+    def __init__(
+        self,
+        seq: int = 0,
+        timestamp: float = 0.0,
+        stress_index: float = 0.0,
+        alpha_rel: float = 0.0,
+        beta_rel: float = 0.0,
+        status: str = StatusEnum.DISCONNECTED.value,
+        mood: str = "",
+        connected: bool = False,
+        is_ready: bool = False,
+    ) -> None:
+        """
+        Immutable EEG result record. Readers may keep and share it freely.
+        Supports `get`/`[]` so it can be used wherever an `EEGDataDict` was read.
+
+        :param seq: Publication number, increases with every new snapshot.
+        :param timestamp: `time.time()` of publication.
+        """
+        for name, value in (
+            ("seq", seq),
+            ("timestamp", timestamp),
+            ("stress_index", stress_index),
+            ("alpha_rel", alpha_rel),
+            ("beta_rel", beta_rel),
+            ("status", status),
+            ("mood", mood),
+            ("connected", connected),
+            ("is_ready", is_ready),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("EEGSnapshot is immutable, use `replace`.")
+
+    def __delattr__(self, name):
+        raise AttributeError("EEGSnapshot is immutable, use `replace`.")
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self) -> str:
+        fields: str = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"EEGSnapshot({fields})"
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def replace(self, **changes) -> "EEGSnapshot":
+        """
+        Returns a copy with some fields changed.
+        """
+        fields: dict = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        return EEGSnapshot(**fields)
+
+    def to_dict(self) -> EEGDataDict:
+        return {
+            "stress_index": self.stress_index,
+            "alpha_rel": self.alpha_rel,
+            "beta_rel": self.beta_rel,
+            "status": self.status,
+            "mood": self.mood,
+            "connected": self.connected,
+            "is_ready": self.is_ready,
+        }
+
+
+class SnapshotPublisher:
+    def __init__(self) -> None:
+        """
+        Single-writer, lock-free result publication.
+        The writer builds a new `EEGSnapshot` and swaps the reference in one
+        assignment, so readers always see a whole snapshot, never a half-updated one.
+        """
+        self._snapshot: EEGSnapshot = EEGSnapshot()
+        # Copy-on-write, so publishing iterates without holding the lock
+        self._listeners: tuple[Callable[[EEGSnapshot], None], ...] = ()
+        self._listeners_lock: threading.Lock = threading.Lock()
+
+    @property
+    def seq(self) -> int:
+        """
+        Sequence number of the latest snapshot, cheap check for new data.
+        """
+        return self._snapshot.seq
+
+    def get_data(self) -> EEGSnapshot:
+        """
+        Pipeline method used in `__main__.py`.
+        Returns the latest snapshot (no copy is needed, it is immutable).
+        """
+        return self._snapshot
+
+    def subscribe(self, callback: Callable[[EEGSnapshot], None]) -> Callable[[], None]:
+        """
+        Registers a listener called with every new snapshot.
+        Listeners run on the publishing (worker) thread, so they should only hand
+        the snapshot over, e.g. emit a Qt signal that is queued to the GUI thread.
+
+        :param callback: Function taking an `EEGSnapshot`.
+        :return: Function that removes the listener.
+        """
+        with self._listeners_lock:
+            self._listeners = self._listeners + (callback,)
+        return lambda: self.unsubscribe(callback)
+
+    def unsubscribe(self, callback: Callable[[EEGSnapshot], None]) -> None:
+        with self._listeners_lock:
+            self._listeners = tuple(
+                listener for listener in self._listeners if listener != callback
+            )
+
+    def _publish(self, **changes) -> EEGSnapshot:
+        """
+        Publishes the previous snapshot with `changes` applied and notifies
+        listeners. Must only be called from one thread (the worker).
+        """
+        previous: EEGSnapshot = self._snapshot
+        snapshot: EEGSnapshot = previous.replace(
+            seq=previous.seq + 1, timestamp=time.time(), **changes
+        )
+        self._snapshot = snapshot
+
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                print(f"[EEG Publisher] Listener error: {e}")
+        return snapshot
@@ -0,0 +1,45 @@
+import numpy as np
+from scipy.signal import butter, sosfilt, sosfilt_zi
+
+from source.neuro_reader.utils import TOTAL_BAND
+
+
+class StreamingBandpass:
+    def __init__(self, sfreq: float, n_channels: int, order: int = 4) -> None:
+        """
+        Causal Butterworth band-pass that keeps its state between chunks, so every
+        sample is filtered exactly once and chunk borders leave no transients.
+
+        :param sfreq: Sampling frequency.
+        :param n_channels: Number of channels filtered in parallel.
+        :param order: Butterworth order (per band edge).
+        """
+        self.sfreq: float = sfreq
+        self.n_channels: int = n_channels
+        self.sos: np.ndarray = butter(
+            order, TOTAL_BAND, btype="bandpass", fs=sfreq, output="sos"
+        )
+        self._zi_step: np.ndarray = sosfilt_zi(self.sos)  # Steady state for a unit step
+        self._zi: np.ndarray | None = None
+
+    def reset(self) -> None:
+        """
+        Drops the filter state. The next chunk starts a new stream.
+        """
+        self._zi = None
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Filters the next chunk of the stream.
+
+        :param chunk: Raw samples, shape (n_channels, n_samples).
+        :return: Filtered samples, same shape.
+        """
+        if chunk.shape[1] == 0:
+            return np.empty(chunk.shape)
+        if self._zi is None:
+            # Start as if the first value had been there forever, so the DC offset
+            # of the electrodes does not ring through the first window
+            self._zi = self._zi_step[:, None, :] * chunk[None, :, :1]
+        filtered, self._zi = sosfilt(self.sos, chunk, axis=-1, zi=self._zi)
+        return filtered
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import TypedDict
+from typing import Final, TypedDict
 
 # BrainAccess MINI documentation
 MINI_CAP_CHANNELS: dict[int, str] = {
@@ -13,12 +13,18 @@ MINI_CAP_CHANNELS: dict[int, str] = {
     7: "O2",
 }
 
+# Frequency bands (Hz), both ends inclusive
+ALPHA_BAND: Final[tuple[float, float]] = (8.0, 13.0)
+BETA_BAND: Final[tuple[float, float]] = (13.0, 30.0)
+TOTAL_BAND: Final[tuple[float, float]] = (4.0, 40.0)  # Also the band-pass range
+
 
 class EEGDataDict(TypedDict):
     stress_index: float  # Index Beta/Alpha ratio
     alpha_rel: float  # Relative power Alpha (0.0 - 1.0)
     beta_rel: float  # Relative power Beta (0.0 - 1.0)
     status: str  # Np. "DISCONNECTED", "CONNECTED"
+    mood: str  # "RELAX", "FOCUS" or "HIGH STRESS"
     connected: bool  # Is the device connected
     is_ready: bool  # Is the buffer full and trustworthy
 
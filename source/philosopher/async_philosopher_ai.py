@@ -0,0 +1,330 @@
+import asyncio
+from pathlib import Path
+import time
+from typing import AsyncIterator, Callable
+import pygame
+import speech_recognition as sr
+
+from source.philosopher.async_voice_engine import AsyncVoiceEngine
+from source.philosopher.brain import Brain
+from source.philosopher.brain_factory import create_brain
+from source.philosopher.recording import Recording
+from source.philosopher.response_cache import ResponseCache
+from source.philosopher.scheduler import AsyncPhilosopherScheduler, Priority
+from source.philosopher.speech_to_text import (
+    SpeechToText,
+    TranscriptionStream,
+    create_speech_to_text,
+    transcribe_recording,
+    transcribe_wav,
+)
+from source.philosopher.speculation import InterventionSlot, PreparedIntervention
+from source.philosopher.warmup import ConnectionWarmer
+from source.philosopher.utils import (
+    CONVERSATION_STARTER_PATH,
+    FALLBACK_ADVICE,
+    GONG_SOUND_PATH,
+    SPECULATIVE_CONTEXT,
+)
+
+
+class AsyncPhilosopherAI:
+    def __init__(self, pipelined: bool = True, backend: str | None = None) -> None:
+        """
+        Coroutine-based version of `PhilosopherAI` with the same public methods.
+        Requests are coroutines on the running loop (in the app, the Qt loop through
+        qasync), so waiting requests cost no threads and any of them can be
+        cancelled. `AsyncPhilosopherScheduler` runs them one at a time in the same
+        priority order as the threaded version. Only speech recognition runs in a
+        worker thread.
+
+        :param pipelined: Speak each sentence as soon as it is generated.
+        :param backend: Brain to use, see `create_brain`.
+        """
+        self.brain: Brain = create_brain(backend, cache=ResponseCache())
+        self.voice: AsyncVoiceEngine = AsyncVoiceEngine()
+        self.stt: SpeechToText = create_speech_to_text()
+        self.pipelined: bool = pipelined
+
+        self.scheduler: AsyncPhilosopherScheduler = AsyncPhilosopherScheduler()
+        # Not scheduled, preparing an intervention does not count as speaking
+        self.speculation: InterventionSlot = InterventionSlot()
+        self._speculation_task: asyncio.Task | None = None
+        self.warmer: ConnectionWarmer = ConnectionWarmer()
+        self.warmer.add_async("Brain", lambda: self.brain.warm_up_async())
+        self.warmer.add_async("ElevenLabs", lambda: self.voice.warm_up_async())
+        # Nothing to keep open for speech recognition, warmed once at startup
+        self.warmer.add(
+            "Speech recognition", lambda: self.stt.warm_up(), keep_alive=False
+        )
+        self._warm_up_task: asyncio.Task | None = None
+        self.last_intervention_time: float = 0
+        self.cooldown_seconds = 60
+
+        try:
+            self.gong: pygame.mixer.Sound | None = pygame.mixer.Sound(GONG_SOUND_PATH)
+        except Exception:
+            self.gong: pygame.mixer.Sound | None = None
+
+    @property
+    def is_speaking(self) -> bool:
+        """
+        True while a request is waiting or running.
+        """
+        return self.scheduler.busy
+
+    def shutdown(self) -> None:
+        """
+        Cancels the waiting and the running requests.
+        """
+        self.discard_intervention()
+        if self._warm_up_task:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
+        self.scheduler.shutdown()
+
+    def warm_up(self, keep_alive: bool = True) -> asyncio.Task:
+        """
+        Connects to the services on the event loop, see `PhilosopherAI.warm_up`.
+        Not a request, so it does not count in `is_speaking`.
+
+        :return: Task of the warm-up, running until `shutdown` if `keep_alive`.
+        """
+        if self._warm_up_task is None or self._warm_up_task.done():
+            self._warm_up_task = asyncio.ensure_future(
+                self.warmer.keep_alive_async()
+                if keep_alive
+                else self.warmer.warm_up_async()
+            )
+        return self._warm_up_task
+
+    def trigger_intervention(
+        self,
+        user_context: str,
+        on_response_callback: Callable | None = None,
+        force=False,
+    ) -> asyncio.Future | None:
+        """
+        Queues an intervention.
+
+        :param force: If True, ignore cooldown. Used for replies to the user.
+        :return: Future of the request, or None if it was skipped or rejected.
+        """
+        current_time: float = time.time()
+        if not force:
+            if self.is_speaking:
+                return None
+            if current_time - self.last_intervention_time < self.cooldown_seconds:
+                return None
+
+        self.last_intervention_time = current_time
+        priority: Priority = Priority.USER_REPLY if force else Priority.EEG_INTERVENTION
+        return self.scheduler.submit(
+            priority, self._intervention, user_context, on_response_callback
+        )
+
+    def prepare_intervention(
+        self, user_context: str = SPECULATIVE_CONTEXT
+    ) -> asyncio.Task | None:
+        """
+        Prepares an intervention before it is needed, see `PhilosopherAI`.
+
+        :return: Task of the preparation, or None if one is ready or in flight.
+        """
+        token: int | None = self.speculation.begin()
+        if token is None:
+            return None
+        self._speculation_task = asyncio.ensure_future(
+            self._prepare(user_context, token)
+        )
+        return self._speculation_task
+
+    def discard_intervention(self) -> None:
+        """
+        Throws away the prepared intervention and stops the one in flight.
+        """
+        self.speculation.discard()
+        if self._speculation_task:
+            self._speculation_task.cancel()
+            self._speculation_task = None
+
+    def deliver_intervention(self, on_response_callback=None) -> asyncio.Future | None:
+        """
+        Speaks the prepared intervention, see `PhilosopherAI`.
+
+        :return: Future of the request, or None if nothing fresh was prepared.
+        """
+        prepared: PreparedIntervention | None = self.speculation.take()
+        if prepared is None:
+            return None
+        self.last_intervention_time = time.time()
+        return self.scheduler.submit(
+            Priority.SCRIPTED, self._deliver, prepared, on_response_callback
+        )
+
+    def say_specific_phrase(
+        self, text: str, on_response_callback=None
+    ) -> asyncio.Future | None:
+        """
+        Sends the text to GUI and plays the scripted audio.
+
+        :return: Future of the request, or None if it was rejected.
+        """
+        return self.scheduler.submit(
+            Priority.SCRIPTED, self._say, text, on_response_callback
+        )
+
+    def start_listening(
+        self, sample_rate: int, on_partial: Callable[[str], None] | None = None
+    ) -> TranscriptionStream:
+        """
+        Starts transcribing a recording while it is being captured, see `PhilosopherAI`.
+        """
+        return TranscriptionStream(self.stt, sample_rate, on_partial)
+
+    def process_stream_and_trigger(
+        self,
+        stream: TranscriptionStream,
+        on_user_text_callback=None,
+        on_ai_response_callback=None,
+    ) -> asyncio.Future | None:
+        """
+        Answers a recording transcribed while captured, see `PhilosopherAI`.
+        """
+        return self.scheduler.submit(
+            Priority.USER_REPLY,
+            self._listen,
+            stream.finish,
+            on_user_text_callback,
+            on_ai_response_callback,
+        )
+
+    def process_recording_and_trigger(
+        self,
+        recording: Recording,
+        on_user_text_callback=None,
+        on_ai_response_callback=None,
+    ) -> asyncio.Future | None:
+        """
+        Answers a recording captured in memory, see `PhilosopherAI`.
+        """
+        return self.scheduler.submit(
+            Priority.USER_REPLY,
+            self._listen,
+            lambda: transcribe_recording(self.stt, recording),
+            on_user_text_callback,
+            on_ai_response_callback,
+        )
+
+    def process_wav_and_trigger(
+        self, file_path: str, on_user_text_callback=None, on_ai_response_callback=None
+    ) -> asyncio.Future | None:
+        """
+        Transcribes a recording and answers it, see `PhilosopherAI`.
+        """
+        return self.scheduler.submit(
+            Priority.USER_REPLY,
+            self._listen,
+            lambda: transcribe_wav(self.stt, file_path),
+            on_user_text_callback,
+            on_ai_response_callback,
+        )
+
+    async def respond(self, user_context: str, callback: Callable | None) -> None:
+        """
+        Generates advice, passes the text to `callback` and speaks it.
+        """
+        sentences: list[str] = []
+
+        async def generated() -> AsyncIterator[str]:
+            async for sentence in self.brain.stream_stoic_advice_async(user_context):
+                sentences.append(sentence)
+                yield sentence
+            advice: str = " ".join(sentences)
+            print("Advice: ", advice)
+            if callback:
+                try:
+                    callback(advice)
+                except Exception as e:
+                    print(f"Callback to GUI error: {e}")
+
+        if self.pipelined:
+            await self.voice.speak_sentences_async(generated())
+        else:
+            async for _ in generated():
+                pass
+            await self.voice.speak_async(" ".join(sentences))
+
+    async def _intervention(self, user_context: str, callback: Callable | None):
+        try:
+            await self.respond(user_context, callback)
+        except Exception as e:
+            print(f"AI module error: {e}")
+
+    async def _prepare(self, user_context: str, token: int) -> None:
+        try:
+            sentences: list[str] = [
+                sentence
+                async for sentence in self.brain.stream_stoic_advice_async(
+                    user_context, remember=False, use_cache=False
+                )
+            ]
+            advice: str = " ".join(sentences)
+            audio: bytes = b"".join(
+                [chunk async for chunk in self.voice.synthesize_async(advice)]
+            )
+            if advice != FALLBACK_ADVICE and audio:
+                if self.speculation.complete(token, user_context, advice, audio):
+                    print("[Philosopher] Intervention prepared.")
+                    return
+        except Exception as e:
+            print(f"AI module error: {e}")
+        finally:
+            self.speculation.fail(token)  # No-op once completed
+
+    async def _deliver(self, prepared: PreparedIntervention, callback: Callable | None):
+        if callback:
+            callback(prepared.text)
+        if self.gong and self.gong.play() is not None:
+            await asyncio.sleep(self.gong.get_length())
+        await self.voice.play_audio_async(prepared.audio)
+        self.brain.history.add(prepared.user_context, prepared.text)
+
+    async def _say(self, text: str, callback: Callable | None):
+        if callback:
+            callback(text)
+        if self.gong and self.gong.play() is not None:
+            await asyncio.sleep(self.gong.get_length())
+
+        if Path(CONVERSATION_STARTER_PATH).exists():
+            await self.voice.play_file_async(CONVERSATION_STARTER_PATH)
+        else:
+            print(f"Could not find audio: {CONVERSATION_STARTER_PATH}")
+
+    async def _listen(
+        self,
+        transcribe: Callable[[], str],
+        on_user_text_callback: Callable | None,
+        on_ai_response_callback: Callable | None,
+    ):
+        try:
+            # Blocking recognition, run in a worker thread
+            user_text: str = await asyncio.to_thread(transcribe)
+            if not user_text:
+                raise sr.UnknownValueError()
+            if on_user_text_callback:
+                try:
+                    on_user_text_callback(user_text)
+                except Exception as e:
+                    print(f"User callback error: {e}")
+
+            await self.respond(user_text, on_ai_response_callback)
+
+        except sr.UnknownValueError:
+            print("Could not understand you.")
+        except sr.RequestError as e:
+            print(f"No connection to Google API: {e}")
+        except Exception as e:
+            print(f"Critical mic audio error: {e}")
+        finally:
+            print("End listening.")
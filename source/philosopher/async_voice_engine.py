@@ -0,0 +1,159 @@
+import asyncio
+import io
+import os
+from typing import AsyncIterable, AsyncIterator
+import httpx
+import pygame
+from elevenlabs.client import AsyncElevenLabs
+
+from source.philosopher.tts_cache import TTSCache
+from source.philosopher.utils import ELEVENLABS_URL, TTS_MODEL_ID, WARM_UP_TIMEOUT
+from source.philosopher.voice_engine import VoiceEngine
+from source.philosopher.warmup import create_async_http_client
+
+
+class AsyncVoiceEngine(VoiceEngine):
+    def __init__(self, streaming: bool = True, cache: TTSCache | None = None) -> None:
+        """
+        `VoiceEngine` with coroutine versions of speaking and playback.
+        Downloads use `AsyncElevenLabs` and playback is awaited with `asyncio.sleep`, so
+        the event loop (e.g. the Qt loop through qasync) is never blocked.
+
+        :param streaming: Start playing while the audio is still downloading.
+        :param cache: Store of synthesized audio, a default `TTSCache` if None.
+        """
+        super().__init__(streaming=streaming, cache=cache)
+        self.async_http: httpx.AsyncClient = create_async_http_client()
+        self.async_client: AsyncElevenLabs = AsyncElevenLabs(
+            api_key=os.getenv("ELEVENLABS_API_KEY"), httpx_client=self.async_http
+        )
+        self._async_playback_lock: asyncio.Lock = asyncio.Lock()
+
+    async def warm_up_async(self) -> None:
+        """
+        Same as `warm_up`, for the pool of the async client.
+        """
+        await self.async_http.head(ELEVENLABS_URL, timeout=WARM_UP_TIMEOUT)
+
+    async def speak_async(self, text: str) -> None:
+        """
+        Converts text to audio and plays it.
+
+        :param text: Text to be converted.
+        """
+        if not text:
+            return
+        await self._play_async(self.synthesize_async(text))
+
+    async def speak_sentences_async(self, sentences: AsyncIterable[str]) -> None:
+        """
+        Speaks sentences in order while later ones are still being produced.
+        Synthesis runs as a separate task one sentence ahead of playback.
+
+        :param sentences: Text pieces, e.g. streamed from the model.
+        """
+        # One chunk queue per sentence, in speaking order; None ends each queue
+        pending: asyncio.Queue[asyncio.Queue | None] = asyncio.Queue()
+
+        async def synthesize_all() -> None:
+            try:
+                async for sentence in sentences:
+                    chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+                    pending.put_nowait(chunks)
+                    try:
+                        async for chunk in self.synthesize_async(sentence):
+                            chunks.put_nowait(chunk)
+                    finally:
+                        chunks.put_nowait(None)
+            except Exception as e:
+                print(f"Error while producing sentences: {e}")
+            finally:
+                pending.put_nowait(None)
+
+        async def drain(chunks: asyncio.Queue) -> AsyncIterator[bytes]:
+            while (chunk := await chunks.get()) is not None:
+                yield chunk
+
+        producer: asyncio.Task = asyncio.create_task(synthesize_all())
+        try:
+            while (chunks := await pending.get()) is not None:
+                await self._play_async(drain(chunks))
+        finally:
+            producer.cancel()
+
+    async def synthesize_async(self, text: str) -> AsyncIterator[bytes]:
+        """
+        Same as `synthesize`, with a non-blocking download.
+
+        :param text: Text to be converted.
+        """
+        key: str = self.cache.key(text, self.voice_id, TTS_MODEL_ID, self.output_format)
+        audio: bytes | None = self.cache.get(key)
+        if audio is not None:
+            yield audio
+            return
+
+        chunks: list[bytes] = []
+        try:
+            async for chunk in self.policy.stream_async(
+                self.async_client.text_to_speech.convert,
+                text=text,
+                voice_id=self.voice_id,
+                model_id=TTS_MODEL_ID,
+                output_format=self.output_format,
+            ):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            print(f"Error connected to ElevenLabs: {e}")
+            return
+
+        if chunks:
+            self.cache.put(key, b"".join(chunks))
+
+    async def play_audio_async(self, audio: bytes) -> None:
+        """
+        Plays audio returned by `synthesize_async`, e.g. prepared ahead of time.
+
+        :param audio: Audio in the engine's output format.
+        """
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield audio
+
+        await self._play_async(chunks())
+
+    async def play_file_async(self, file_path: str) -> None:
+        """
+        Plays out the audio.
+
+        :param file_path: Audio file path.
+        """
+        await self._play_until_finished_async(file_path)
+
+    async def _play_async(self, chunks: AsyncIterator[bytes]) -> None:
+        """
+        Plays audio in the engine's output format.
+        """
+        if not self.streaming:
+            audio: bytes = b"".join([chunk async for chunk in chunks])
+            await self._play_until_finished_async(io.BytesIO(audio))
+            return
+
+        async with self._async_playback_lock:
+            try:
+                await self.stream_player.play_async(chunks)
+            except Exception as e:
+                print(f"Error while playing audio: {e}")
+
+    async def _play_until_finished_async(self, source: str | io.BytesIO) -> None:
+        """
+        Plays a file or file-like object and returns when it ends.
+        """
+        async with self._async_playback_lock:
+            try:
+                sound: pygame.mixer.Sound = pygame.mixer.Sound(source)
+                if sound.play() is not None:
+                    await asyncio.sleep(sound.get_length())
+            except Exception as e:
+                print(f"Error while playing audio: {e}")
@@ -0,0 +1,155 @@
+import asyncio
+from collections import deque
+import time
+from typing import AsyncIterable, Iterable
+import numpy as np
+import pygame
+
+from source.philosopher.utils import PCM_SAMPLE_RATE
+
+
+class PCMStreamPlayer:
+    def __init__(
+        self,
+        sample_rate: int = PCM_SAMPLE_RATE,
+        jitter_buffer: float = 0.2,
+        block_duration: float = 0.1,
+    ) -> None:
+        """
+        Plays 16-bit mono PCM while it is still being downloaded.
+        Incoming bytes are cut into short blocks that are queued on one mixer
+        channel, playback starts as soon as `jitter_buffer` seconds are buffered.
+
+        :param sample_rate: Sample rate of the incoming PCM.
+        :param jitter_buffer: Audio buffered before playback starts (in seconds).
+        :param block_duration: Length of one queued sound (in seconds).
+        """
+        self.sample_rate: int = sample_rate
+        self.prebuffer_bytes: int = 2 * int(sample_rate * jitter_buffer)
+        self.block_bytes: int = 2 * int(sample_rate * block_duration)
+
+        self.first_audio_latency: float | None = None  # Of the last `play` (seconds)
+        self.underruns: int = 0  # Times the channel ran dry mid-stream
+
+        # Block timing, so waits end exactly when the channel needs data again
+        self._slot_free_at: float = 0.0  # When the queue slot empties
+        self._playing_until: float = 0.0  # When everything handed over has played
+
+    def play(self, chunks: Iterable[bytes]) -> None:
+        """
+        Plays the stream, returns when all of it was heard.
+
+        :param chunks: PCM byte chunks of any size, e.g. from ElevenLabs.
+        """
+        channel, pending, blocks, started = self._begin()
+        for chunk in chunks:
+            self._receive(chunk, channel, pending, blocks, started)
+
+        self._flush(pending, blocks)
+        while (delay := self._drain(channel, blocks, started)) is not None:
+            time.sleep(delay)
+
+    async def play_async(self, chunks: AsyncIterable[bytes]) -> None:
+        """
+        Same as `play`, but waits without blocking the event loop.
+
+        :param chunks: PCM byte chunks of any size, e.g. from `AsyncElevenLabs`.
+        """
+        channel, pending, blocks, started = self._begin()
+        async for chunk in chunks:
+            self._receive(chunk, channel, pending, blocks, started)
+
+        self._flush(pending, blocks)
+        while (delay := self._drain(channel, blocks, started)) is not None:
+            await asyncio.sleep(delay)
+
+    def _begin(self) -> tuple[pygame.mixer.Channel, bytearray, deque[bytes], float]:
+        """
+        Resets the statistics and reserves a channel for a new stream.
+        """
+        self.first_audio_latency = None
+        self.underruns = 0
+        self._slot_free_at = self._playing_until = time.perf_counter()
+        channel: pygame.mixer.Channel = pygame.mixer.find_channel(True)
+        return channel, bytearray(), deque(), time.perf_counter()
+
+    def _receive(
+        self,
+        chunk: bytes,
+        channel: pygame.mixer.Channel,
+        pending: bytearray,
+        blocks: deque[bytes],
+        started: float,
+    ) -> None:
+        """
+        Cuts incoming bytes into blocks and starts feeding once prebuffered.
+        """
+        pending.extend(chunk)
+        while len(pending) >= self.block_bytes:
+            blocks.append(bytes(pending[: self.block_bytes]))
+            del pending[: self.block_bytes]
+
+        buffered: int = len(blocks) * self.block_bytes
+        if self.first_audio_latency is None and buffered < self.prebuffer_bytes:
+            return
+        self._feed(channel, blocks, started)
+
+    def _flush(self, pending: bytearray, blocks: deque[bytes]) -> None:
+        """
+        Turns whatever is left into a last, shorter block (cut to whole samples).
+        """
+        if len(pending) >= 2:
+            blocks.append(bytes(pending[: len(pending) // 2 * 2]))
+        pending.clear()
+
+    def _drain(
+        self, channel: pygame.mixer.Channel, blocks: deque[bytes], started: float
+    ) -> float | None:
+        """
+        Feeds what the channel accepts after the download has finished.
+
+        :return: Seconds until the channel can take the next block (or ends),
+            None once everything has played.
+        """
+        self._feed(channel, blocks, started)
+        wake_at: float = self._slot_free_at if blocks else self._playing_until
+        delay: float = wake_at - time.perf_counter()
+        if not blocks and delay <= 0:
+            return None
+        return max(delay, 0.001)
+
+    def _feed(
+        self, channel: pygame.mixer.Channel, blocks: deque[bytes], started: float
+    ) -> None:
+        """
+        Moves blocks to the channel as long as it accepts them without waiting.
+        """
+        while blocks:
+            duration: float = len(blocks[0]) / 2 / self.sample_rate
+            if not channel.get_busy():
+                if self.first_audio_latency is not None:
+                    self.underruns += 1
+                channel.play(self._make_sound(blocks.popleft()))
+                self._slot_free_at = time.perf_counter()
+                self._playing_until = self._slot_free_at + duration
+            elif channel.get_queue() is None:
+                channel.queue(self._make_sound(blocks.popleft()))
+                self._slot_free_at = self._playing_until
+                self._playing_until += duration
+            else:
+                return
+            if self.first_audio_latency is None:
+                self.first_audio_latency = time.perf_counter() - started
+
+    def _make_sound(self, block: bytes) -> pygame.mixer.Sound:
+        """
+        Converts a PCM block to the mixer's sample rate and channel count.
+        """
+        samples: np.ndarray = np.frombuffer(block, dtype="<i2")
+        frequency, _, channels = pygame.mixer.get_init()
+        if frequency != self.sample_rate:
+            n_out: int = round(len(samples) * frequency / self.sample_rate)
+            positions: np.ndarray = np.arange(n_out) * self.sample_rate / frequency
+            samples = np.interp(positions, np.arange(len(samples)), samples)
+        frames: np.ndarray = np.repeat(samples.astype(np.int16)[:, None], channels, 1)
+        return pygame.mixer.Sound(buffer=frames.tobytes())
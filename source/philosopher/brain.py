@@ -0,0 +1,282 @@
+import asyncio
+import time
+from typing import AsyncIterator, Iterator, Protocol
+
+from source.philosopher.chat_history import ChatHistory
+from source.philosopher.resilience import ResiliencePolicy
+from source.philosopher.response_cache import ResponseCache
+from source.philosopher.sentences import SentenceSplitter
+from source.philosopher.utils import FALLBACK_ADVICE
+
+DEFAULT_CONTEXT: str = "I am stressed about my job."
+
+
+class Brain(Protocol):
+    name: str
+    history: ChatHistory
+
+    def generate_stoic_advice(
+        self,
+        user_context: str = DEFAULT_CONTEXT,
+        remember: bool = True,
+        use_cache: bool = True,
+    ) -> str:
+        """
+        :return: Whole advice for the user input.
+        """
+
+    def stream_stoic_advice(
+        self,
+        user_context: str = DEFAULT_CONTEXT,
+        remember: bool = True,
+        use_cache: bool = True,
+    ) -> Iterator[str]:
+        """
+        :return: Iterator of sentences, produced while the advice is generated.
+        """
+
+    def stream_stoic_advice_async(
+        self,
+        user_context: str = DEFAULT_CONTEXT,
+        remember: bool = True,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        :return: Async iterator of sentences.
+        """
+
+    def warm_up(self) -> None:
+        """
+        Opens the connection to the model before the first request.
+        """
+
+    async def warm_up_async(self) -> None:
+        """
+        Same as `warm_up`, on the event loop.
+        """
+
+
+class BaseBrain:
+    name: str = "Brain"
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        history: ChatHistory | None = None,
+        policy: ResiliencePolicy | None = None,
+    ) -> None:
+        """
+        Shared part of the backends: history, response cache, sentence splitting and
+        the fallback advice. Subclasses only talk to their model, see `_generate`,
+        `_stream` and `_stream_async`.
+
+        :param cache: Answers repeated prompts without a round trip, off if None.
+        :param history: Conversation memory, a default `ChatHistory` if None.
+        :param policy: Timeouts and retries of model calls, unbounded if None.
+        """
+        self.history: ChatHistory = history or ChatHistory()
+        self.cache: ResponseCache | None = cache
+        self.policy: ResiliencePolicy | None = policy
+
+    def generate_stoic_advice(
+        self,
+        user_context: str = DEFAULT_CONTEXT,
+        remember: bool = True,
+        use_cache: bool = True,
+    ) -> str:
+        """
+        Sends a question to the model and returns a response.
+
+        :param user_context: Text input from the user.
+        :param remember: Add the exchange to the history. Off for speculative
+            requests, which may never be delivered.
+        :param use_cache: Answer from and store to the response cache. Off for
+            speculative requests, which should be generated afresh every time.
+        """
+        context: str = self.history.recent()
+        cached: str | None = self._cached(user_context, context, remember, use_cache)
+        if cached is not None:
+            return cached
+        try:
+            started: float = time.perf_counter()
+            contents: list[dict] = self.history.contents(user_context)
+            raw: str = (
+                self.policy.call(self._generate, contents)
+                if self.policy
+                else self._generate(contents)
+            )
+            advice: str = self._clean(raw)
+            self._store(user_context, context, [advice], started, remember, use_cache)
+            return advice
+
+        except Exception as e:
+            print(f"{self.name} Error: {e}")
+            return FALLBACK_ADVICE
+
+    def stream_stoic_advice(
+        self,
+        user_context: str = DEFAULT_CONTEXT,
+        remember: bool = True,
+        use_cache: bool = True,
+    ) -> Iterator[str]:
+        """
+        Streams the response, sentence by sentence, while it is being generated.
+
+        :param user_context: Text input from the user.
+        :param remember: Add the exchange to the history.
+        :param use_cache: Answer from and store to the response cache.
+        :return: Iterator of cleaned sentences.
+        """
+        context: str = self.history.recent()
+        cached: str | None = self._cached(user_context, context, remember, use_cache)
+        if cached is not None:
+            yield from self._split(cached)
+            return
+
+        splitter: SentenceSplitter = SentenceSplitter()
+        produced: list[str] = []
+        try:
+            started: float = time.perf_counter()
+            for text in self._guarded_stream(self.history.contents(user_context)):
+                for sentence in splitter.feed(text):
+                    produced.append(self._clean(sentence))
+                    yield produced[-1]
+            rest: str | None = splitter.flush()
+            if rest:
+                produced.append(self._clean(rest))
+                yield produced[-1]
+            self._store(user_context, context, produced, started, remember, use_cache)
+
+        except Exception as e:
+            print(f"{self.name} Error: {e}")
+            if not produced:
+                yield FALLBACK_ADVICE
+
+    async def stream_stoic_advice_async(
+        self,
+        user_context: str = DEFAULT_CONTEXT,
+        remember: bool = True,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """
+        Same as `stream_stoic_advice`, without blocking the event loop.
+
+        :param user_context: Text input from the user.
+        :param remember: Add the exchange to the history.
+        :param use_cache: Answer from and store to the response cache.
+        :return: Async iterator of cleaned sentences.
+        """
+        context: str = self.history.recent()
+        cached: str | None = self._cached(user_context, context, remember, use_cache)
+        if cached is not None:
+            for sentence in self._split(cached):
+                yield sentence
+            return
+
+        splitter: SentenceSplitter = SentenceSplitter()
+        produced: list[str] = []
+        try:
+            started: float = time.perf_counter()
+            async for text in self._guarded_stream_async(
+                self.history.contents(user_context)
+            ):
+                for sentence in splitter.feed(text):
+                    produced.append(self._clean(sentence))
+                    yield produced[-1]
+            rest: str | None = splitter.flush()
+            if rest:
+                produced.append(self._clean(rest))
+                yield produced[-1]
+            self._store(user_context, context, produced, started, remember, use_cache)
+
+        except Exception as e:
+            print(f"{self.name} Error: {e}")
+            if not produced:
+                yield FALLBACK_ADVICE
+
+    def warm_up(self) -> None:
+        """
+        Nothing to open by default, backends with a remote model override it.
+        """
+
+    async def warm_up_async(self) -> None:
+        await asyncio.to_thread(self.warm_up)
+
+    def _generate(self, contents: list[dict]) -> str:
+        """
+        :param contents: Conversation, see `ChatHistory.contents`.
+        :return: Whole raw response of the model.
+        """
+        return "".join(self._stream(contents))
+
+    def _stream(self, contents: list[dict]) -> Iterator[str]:
+        """
+        :param contents: Conversation, see `ChatHistory.contents`.
+        :return: Pieces of the raw response as they are generated.
+        """
+        raise NotImplementedError
+
+    async def _stream_async(self, contents: list[dict]) -> AsyncIterator[str]:
+        """
+        Runs `_stream` in a worker thread, one piece at a time.
+        """
+        pieces: Iterator[str] = iter(self._stream(contents))
+        while (text := await asyncio.to_thread(next, pieces, None)) is not None:
+            yield text
+
+    def _guarded_stream(self, contents: list[dict]) -> Iterator[str]:
+        if self.policy:
+            return self.policy.stream(self._stream, contents)
+        return self._stream(contents)
+
+    def _guarded_stream_async(self, contents: list[dict]) -> AsyncIterator[str]:
+        if self.policy:
+            return self.policy.stream_async(self._stream_async, contents)
+        return self._stream_async(contents)
+
+    def _cached(
+        self, user_context: str, context: str, remember: bool, use_cache: bool
+    ) -> str | None:
+        if self.cache is None or not use_cache:
+            return None
+        cached: str | None = self.cache.get(user_context, context)
+        if cached is not None and remember:
+            self.history.add(user_context, cached)
+        return cached
+
+    def _store(
+        self,
+        user_context: str,
+        context: str,
+        sentences: list[str],
+        started: float,
+        remember: bool,
+        use_cache: bool,
+    ) -> None:
+        """
+        Records a complete answer in the history and caches it with the time it
+        took to generate.
+
+        :param context: Latest turns before the question, see `ChatHistory.recent`.
+        """
+        if not sentences:
+            return
+        advice: str = " ".join(sentences)
+        if remember:
+            self.history.add(user_context, advice)
+        if self.cache is not None and use_cache:
+            self.cache.put(user_context, advice, time.perf_counter() - started, context)
+
+    @staticmethod
+    def _split(text: str) -> list[str]:
+        splitter: SentenceSplitter = SentenceSplitter()
+        sentences: list[str] = splitter.feed(text)
+        rest: str | None = splitter.flush()
+        return sentences + [rest] if rest else sentences
+
+    @staticmethod
+    def _clean(text: str) -> str:
+        """
+        Removes markdown, which would be read out loud.
+        """
+        return text.strip().replace("*", "").replace("`", "").replace("_", "")
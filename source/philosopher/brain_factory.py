@@ -0,0 +1,43 @@
+import os
+from pathlib import Path
+
+from source.philosopher.brain import Brain
+from source.philosopher.canned_brain import CannedBrain
+from source.philosopher.gemini_brain import GeminiBrain
+from source.philosopher.local_brain import LocalBrain, llama_cpp
+from source.philosopher.response_cache import ResponseCache
+from source.philosopher.utils import BRAIN_BACKEND_ENV, LOCAL_MODEL_PATH
+
+BRAINS: dict[str, type] = {
+    "gemini": GeminiBrain,
+    "local": LocalBrain,
+    "canned": CannedBrain,
+}
+
+
+def create_brain(
+    backend: str | None = None, cache: ResponseCache | None = None
+) -> Brain:
+    """
+    Creates the brain selected by `backend` or the `PHILOSOPHER_BRAIN` variable.
+    "auto" (the default) prefers Gemini when `GEMINI_API_KEY` is set, then a local
+    model if one is installed, and falls back to canned advice, so the app always starts.
+
+    :param backend: "gemini", "local", "canned" or "auto".
+    :param cache: Response cache passed to the brain.
+    """
+    backend = (backend or os.getenv(BRAIN_BACKEND_ENV) or "auto").lower()
+    if backend in BRAINS:
+        return BRAINS[backend](cache=cache)
+    if backend != "auto":
+        raise ValueError(f"Unknown brain `{backend}`, choose from {list(BRAINS)}")
+
+    if os.getenv("GEMINI_API_KEY"):
+        return GeminiBrain(cache=cache)
+    if llama_cpp is not None and Path(LOCAL_MODEL_PATH).is_file():
+        try:
+            return LocalBrain(cache=cache)
+        except Exception as e:
+            print(f"Could not load the local model: {e}")
+    print("Warning: No Gemini key or local model. Philosopher uses canned advice.")
+    return CannedBrain(cache=cache)
@@ -0,0 +1,37 @@
+import zlib
+from typing import AsyncIterator, Iterator
+
+from source.philosopher.brain import BaseBrain
+from source.philosopher.chat_history import ChatHistory
+from source.philosopher.response_cache import ResponseCache
+from source.philosopher.utils import CANNED_ADVICE
+
+
+class CannedBrain(BaseBrain):
+    name: str = "Canned"
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        history: ChatHistory | None = None,
+        advice: tuple[str, ...] = CANNED_ADVICE,
+    ) -> None:
+        """
+        Offline brain answering instantly from a fixed list, no model involved.
+        The same message always gets the same advice, which makes it usable for
+        load tests and for machines without network or API key.
+
+        :param advice: Answers to choose from.
+        """
+        super().__init__(cache=cache, history=history)
+        self.advice: tuple[str, ...] = advice
+
+    def _stream(self, contents: list[dict]) -> Iterator[str]:
+        yield self._pick(contents)
+
+    async def _stream_async(self, contents: list[dict]) -> AsyncIterator[str]:
+        yield self._pick(contents)
+
+    def _pick(self, contents: list[dict]) -> str:
+        message: str = "".join(contents[-1]["parts"])
+        return self.advice[zlib.crc32(message.lower().encode()) % len(self.advice)]
@@ -0,0 +1,127 @@
+from collections import deque
+import threading
+
+from source.philosopher.utils import HISTORY_TOKEN_BUDGET, SUMMARY_TOKEN_BUDGET
+
+CHARS_PER_TOKEN: int = 4  # Rough average for English text
+SUMMARY_WORDS: int = 16  # Words kept from each compacted message
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Local approximation of the model's token count, no request needed.
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class ChatHistory:
+    def __init__(
+        self,
+        max_tokens: int = HISTORY_TOKEN_BUDGET,
+        max_summary_tokens: int = SUMMARY_TOKEN_BUDGET,
+        keep_turns: int = 2,
+    ) -> None:
+        """
+        Conversation sent to the model with every request, bounded by a token budget.
+        When the turns exceed `max_tokens`, the oldest ones are compacted into a
+        short summary built locally (the start of each message), so the prompt
+        and the latency stay flat however long the duck has been running.
+
+        :param max_tokens: Budget of the verbatim turns.
+        :param max_summary_tokens: Budget of the summary, its oldest lines go first.
+        :param keep_turns: Newest exchanges that are never compacted.
+        """
+        self.max_tokens: int = max_tokens
+        self.max_summary_tokens: int = max_summary_tokens
+        self.keep_turns: int = keep_turns
+
+        self.turns: deque[tuple[str, str]] = deque()  # (user, model) exchanges
+        self.summary: deque[str] = deque()
+        self.last_prompt_tokens: int = 0
+        self._turn_tokens: int = 0
+        self._summary_tokens: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def total_tokens(self) -> int:
+        return self._turn_tokens + self._summary_tokens
+
+    def contents(self, user_message: str) -> list[dict]:
+        """
+        Builds the request for `GenerativeModel.generate_content`.
+
+        :param user_message: New message of the user.
+        :return: Summary, recent turns and the new message.
+        """
+        with self._lock:
+            contents: list[dict] = []
+            if self.summary:
+                contents.append(
+                    self._content(
+                        "user",
+                        "Earlier in our conversation:\n" + "\n".join(self.summary),
+                    )
+                )
+                contents.append(self._content("model", "I remember."))
+            for user, reply in self.turns:
+                contents.append(self._content("user", user))
+                contents.append(self._content("model", reply))
+            contents.append(self._content("user", user_message))
+
+            self.last_prompt_tokens = self.total_tokens + estimate_tokens(user_message)
+            print(
+                f"[Gemini History] Prompt ~{self.last_prompt_tokens} tokens "
+                f"({len(self.turns)} turns, {len(self.summary)} summary lines)"
+            )
+            return contents
+
+    def recent(self, turns: int = 1) -> str:
+        """
+        Latest exchanges as text, which a short reply like "yes" depends on.
+        Used as the context of `ResponseCache` entries.
+        """
+        with self._lock:
+            latest: list[tuple[str, str]] = list(self.turns)[-turns:] if turns else []
+            return "\n".join(f"{user}\n{reply}" for user, reply in latest)
+
+    def add(self, user_message: str, reply: str) -> None:
+        """
+        Records a finished exchange and compacts the history if it is over budget.
+        """
+        with self._lock:
+            self.turns.append((user_message, reply))
+            self._turn_tokens += estimate_tokens(user_message) + estimate_tokens(reply)
+            while (
+                self._turn_tokens > self.max_tokens
+                and len(self.turns) > self.keep_turns
+            ):
+                self._compact(*self.turns.popleft())
+
+    def clear(self) -> None:
+        with self._lock:
+            self.turns.clear()
+            self.summary.clear()
+            self._turn_tokens = 0
+            self._summary_tokens = 0
+
+    def _compact(self, user_message: str, reply: str) -> None:
+        """
+        Must be called with `_lock` held. Moves one exchange into the summary.
+        """
+        self._turn_tokens -= estimate_tokens(user_message) + estimate_tokens(reply)
+        line: str = f"User: {self._shorten(user_message)} / You: {self._shorten(reply)}"
+        self.summary.append(line)
+        self._summary_tokens += estimate_tokens(line)
+        while self._summary_tokens > self.max_summary_tokens and self.summary:
+            self._summary_tokens -= estimate_tokens(self.summary.popleft())
+
+    @staticmethod
+    def _shorten(text: str) -> str:
+        words: list[str] = text.split()
+        if len(words) <= SUMMARY_WORDS:
+            return " ".join(words)
+        return " ".join(words[:SUMMARY_WORDS]) + "…"
+
+    @staticmethod
+    def _content(role: str, text: str) -> dict:
+        return {"role": role, "parts": [text]}
@@ -1,20 +1,47 @@
 import os
+from typing import AsyncIterator, Iterator
 import google.generativeai as genai
-from google.generativeai.types.generation_types import GenerateContentResponse
+from google.generativeai.types.generation_types import (
+    AsyncGenerateContentResponse,
+    GenerateContentResponse,
+)
 from dotenv import load_dotenv
 
+from source.philosopher.brain import BaseBrain
+from source.philosopher.chat_history import ChatHistory
+from source.philosopher.resilience import ResiliencePolicy
+from source.philosopher.response_cache import ResponseCache
 from source.philosopher.utils import (
+    GEMINI_DEADLINE,
+    GEMINI_HEDGE_REQUESTS,
+    GEMINI_TIMEOUT,
     MODEL_NAME,
+    STREAM_IDLE_TIMEOUT,
     SYSTEM_INSTRUCTION,
+    WARM_UP_TIMEOUT,
 )
 
 load_result = load_dotenv()
 
+WARM_UP_TEXT: str = "Warm up."
+
 
-class GeminiBrain:
-    def __init__(self) -> None:
+class GeminiBrain(BaseBrain):
+    name: str = "Gemini"
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        history: ChatHistory | None = None,
+        policy: ResiliencePolicy | None = None,
+    ) -> None:
         """
         Initialize connection with z Google Gemini.
+        Every request sends the bounded `history` instead of an ever-growing chat.
+
+        :param cache: Answers repeated prompts without a round trip, off if None.
+        :param history: Conversation memory, a default `ChatHistory` if None.
+        :param policy: Timeouts, retries and hedging of requests, defaults if None.
         """
         api_key: str = os.getenv("GEMINI_API_KEY")
         if not api_key:
@@ -25,30 +52,56 @@ class GeminiBrain:
         self.model: genai.GenerativeModel = genai.GenerativeModel(
             model_name=MODEL_NAME, system_instruction=SYSTEM_INSTRUCTION
         )
-        self.chat = self.model.start_chat(history=[])
+        policy = policy or ResiliencePolicy(
+            self.name,
+            timeout=GEMINI_TIMEOUT,
+            deadline=GEMINI_DEADLINE,
+            hedge=GEMINI_HEDGE_REQUESTS,
+            idle_timeout=STREAM_IDLE_TIMEOUT,
+        )
+        super().__init__(cache=cache, history=history, policy=policy)
 
-    def generate_stoic_advice(self, user_context="I am stressed about my job.") -> str:
+    def warm_up(self) -> None:
+        """
+        Counts tokens of a short text, which opens the gRPC channel (DNS, TLS and
+        HTTP/2) without generating anything. Also keeps the channel alive when idle.
         """
-        Sends a question to the Gemini model and returns a response.
+        self.model.count_tokens(
+            WARM_UP_TEXT, request_options={"timeout": WARM_UP_TIMEOUT}
+        )
 
-        :param user_context: Text input from the user.
+    async def warm_up_async(self) -> None:
         """
-        try:
-            response: GenerateContentResponse = self.chat.send_message(user_context)
-            raw_text: str = response.text.strip()
-            clean_text: str = (
-                raw_text.replace("*", "").replace("`", "").replace("_", "")
-            )
-            return clean_text
+        Same as `warm_up`, opens the channel of the async client.
+        """
+        await self.model.count_tokens_async(
+            WARM_UP_TEXT, request_options={"timeout": WARM_UP_TIMEOUT}
+        )
+
+    def _generate(self, contents: list[dict]) -> str:
+        response: GenerateContentResponse = self.model.generate_content(contents)
+        return response.text
 
-        except Exception as e:
-            print(f"Gemini Error: {e}")
-            return "Patience. The API is silent, but your mind must remain clear even in the time of doubt."
+    def _stream(self, contents: list[dict]) -> Iterator[str]:
+        response: GenerateContentResponse = self.model.generate_content(
+            contents, stream=True
+        )
+        for chunk in response:
+            yield chunk.text
+
+    async def _stream_async(self, contents: list[dict]) -> AsyncIterator[str]:
+        response: AsyncGenerateContentResponse = (
+            await self.model.generate_content_async(contents, stream=True)
+        )
+        async for chunk in response:
+            yield chunk.text
 
 
 if __name__ == "__main__":
     """
     Use `.\.venv\Scripts\python.exe -m source.philosopher.gemini_brain` to run the script below.
     """
-    brain: GeminiBrain = GeminiBrain()
+    brain: GeminiBrain = GeminiBrain(cache=ResponseCache(hit_probability=1.0))
     print(brain.generate_stoic_advice("My code keeps faulting!"))
+    print(brain.generate_stoic_advice("my code keeps faulting again"))
+    print(brain.cache.stats)
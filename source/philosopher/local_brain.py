@@ -0,0 +1,83 @@
+from pathlib import Path
+from typing import Iterator
+
+from source.philosopher.brain import BaseBrain
+from source.philosopher.chat_history import ChatHistory
+from source.philosopher.resilience import ResiliencePolicy
+from source.philosopher.response_cache import ResponseCache
+from source.philosopher.utils import (
+    LOCAL_CONTEXT_TOKENS,
+    LOCAL_MAX_TOKENS,
+    LOCAL_MODEL_PATH,
+    LOCAL_TIMEOUT,
+    STREAM_IDLE_TIMEOUT,
+    SYSTEM_INSTRUCTION,
+)
+
+# optional offline backend
+try:
+    import llama_cpp
+except ImportError:
+    llama_cpp = None
+
+
+class LocalBrain(BaseBrain):
+    name: str = "Local"
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        history: ChatHistory | None = None,
+        model_path: str | Path = LOCAL_MODEL_PATH,
+        max_tokens: int = LOCAL_MAX_TOKENS,
+        threads: int | None = None,
+    ) -> None:
+        """
+        Brain running a GGUF model on the CPU through llama.cpp, no network needed.
+        With a small quantized model the first sentence arrives in well under a second.
+
+        :param model_path: llama.cpp-compatible GGUF file.
+        :param max_tokens: Upper limit of a response, the advice is short anyway.
+        :param threads: CPU threads for inference, llama.cpp picks if None.
+        """
+        if llama_cpp is None:
+            raise ImportError("Local brain requires the 'llama-cpp-python' package")
+        if not Path(model_path).is_file():
+            raise FileNotFoundError(f"Could not find local model: {model_path}")
+
+        # No retries or hedging, a second run would only compete for the same CPU
+        policy: ResiliencePolicy = ResiliencePolicy(
+            self.name,
+            timeout=LOCAL_TIMEOUT,
+            deadline=LOCAL_TIMEOUT,
+            retries=0,
+            idle_timeout=STREAM_IDLE_TIMEOUT,
+            workers=1,
+        )
+        super().__init__(cache=cache, history=history, policy=policy)
+        self.max_tokens: int = max_tokens
+        self.model: llama_cpp.Llama = llama_cpp.Llama(
+            model_path=str(model_path),
+            n_ctx=LOCAL_CONTEXT_TOKENS,
+            n_threads=threads,
+            verbose=False,
+        )
+
+    def _stream(self, contents: list[dict]) -> Iterator[str]:
+        for chunk in self.model.create_chat_completion(
+            messages=self._messages(contents), max_tokens=self.max_tokens, stream=True
+        ):
+            text: str | None = chunk["choices"][0]["delta"].get("content")
+            if text:
+                yield text
+
+    @staticmethod
+    def _messages(contents: list[dict]) -> list[dict]:
+        """
+        Converts the Gemini-style history to OpenAI-style chat messages.
+        """
+        messages: list[dict] = [{"role": "system", "content": SYSTEM_INSTRUCTION}]
+        for content in contents:
+            role: str = "assistant" if content["role"] == "model" else "user"
+            messages.append({"role": role, "content": "".join(content["parts"])})
+        return messages
@@ -1,24 +1,61 @@
+from concurrent.futures import Future
 from pathlib import Path
-import threading
 import time
-from typing import Callable
+from typing import Callable, Iterator
 import pygame
 import speech_recognition as sr
-from source.philosopher.gemini_brain import GeminiBrain
-from source.philosopher.utils import CONVERSATION_STARTER_PATH, GONG_SOUND_PATH
+from source.philosopher.brain import Brain
+from source.philosopher.brain_factory import create_brain
+from source.philosopher.recording import Recording
+from source.philosopher.response_cache import ResponseCache
+from source.philosopher.scheduler import PhilosopherScheduler, Priority
+from source.philosopher.speech_to_text import (
+    SpeechToText,
+    TranscriptionStream,
+    create_speech_to_text,
+    transcribe_recording,
+    transcribe_wav,
+)
+from source.philosopher.speculation import InterventionSlot, PreparedIntervention
+from source.philosopher.utils import (
+    CONVERSATION_STARTER_PATH,
+    FALLBACK_ADVICE,
+    GONG_SOUND_PATH,
+    SPECULATIVE_CONTEXT,
+)
 from source.philosopher.voice_engine import VoiceEngine
+from source.philosopher.warmup import ConnectionWarmer
 
 
 class PhilosopherAI:
-    def __init__(self) -> None:
+    def __init__(self, pipelined: bool = True, backend: str | None = None) -> None:
         """
         This class connects brain and voice og the duck.
         Manages threading and cooldown not to slow down the application.
+        All requests run on one worker (see `PhilosopherScheduler`), scripted
+        phrases first, then user replies, then EEG-triggered interventions.
+
+        :param pipelined: Speak each sentence as soon as it is generated.
+        :param backend: Brain to use, see `create_brain`.
         """
-        self.brain: GeminiBrain = GeminiBrain()
+        self.brain: Brain = create_brain(backend, cache=ResponseCache())
         self.voice: VoiceEngine = VoiceEngine()
+        self.stt: SpeechToText = create_speech_to_text()
+        self.pipelined: bool = pipelined
+        self.scheduler: PhilosopherScheduler = PhilosopherScheduler(workers=1)
+        # Separate worker, so preparing an intervention never delays a reply
+        self.speculator: PhilosopherScheduler = PhilosopherScheduler(
+            workers=1, max_pending=1
+        )
+        self.speculation: InterventionSlot = InterventionSlot()
+        self.warmer: ConnectionWarmer = ConnectionWarmer()
+        self.warmer.add("Brain", lambda: self.brain.warm_up())
+        self.warmer.add("ElevenLabs", lambda: self.voice.warm_up())
+        # Nothing to keep open for speech recognition, warmed once at startup
+        self.warmer.add(
+            "Speech recognition", lambda: self.stt.warm_up(), keep_alive=False
+        )
 
-        self.is_speaking: bool = False
         self.last_intervention_time: int = 0
         self.cooldown_seconds = 60  # Np. 60 seconds timeout between
 
@@ -27,37 +64,56 @@ class PhilosopherAI:
         except Exception:
             self.gong: pygame.mixer.Sound | None = None
 
+    @property
+    def is_speaking(self) -> bool:
+        """
+        True while a request is waiting or running.
+        """
+        return self.scheduler.busy
+
+    def shutdown(self) -> None:
+        """
+        Drops waiting requests and waits for the current one to finish.
+        """
+        self.warmer.stop()
+        self.speculation.discard()
+        self.speculator.shutdown(wait=False)
+        self.scheduler.shutdown(wait=True)
+
+    def warm_up(self, keep_alive: bool = True) -> None:
+        """
+        Connects to the brain, voice and speech recognition services in the
+        background, so the first reply does not wait for handshakes.
+
+        :param keep_alive: Keep pinging the services while idle, see `ConnectionWarmer`.
+        """
+        self.warmer.start(keep_alive)
+
     def trigger_intervention(
         self,
         user_context: str,
         on_response_callback: Callable | None = None,
         force=False,
-    ):
+    ) -> Future | None:
         """
         Main pipeline that is run in main.py.
         Decides when to run the intervention in the background.
-        :param force: If True, ignore cooldown.
+        :param force: If True, ignore cooldown. Used for replies to the user.
+        :return: Future of the request, or None if it was skipped.
         """
         current_time: float = time.time()
 
-        if self.is_speaking:
-            return
-
         if not force:
+            if self.is_speaking:
+                return None  # Interventions never stack up
             if current_time - self.last_intervention_time < self.cooldown_seconds:
-                return  # Too early for another request
+                return None  # Too early for another request
 
         self.last_intervention_time: float = current_time
-        self.is_speaking = True
-
-        thread: threading.Thread = threading.Thread(
-            target=self._intervention_process,
-            args=(
-                user_context,
-                on_response_callback,
-            ),
+        priority: Priority = Priority.USER_REPLY if force else Priority.EEG_INTERVENTION
+        return self.scheduler.submit(
+            priority, self._intervention_process, user_context, on_response_callback
         )
-        thread.start()
 
     def _intervention_process(self, user_context: str, callback: Callable | None):
         """
@@ -65,7 +121,18 @@ class PhilosopherAI:
         Creates response for the user input, and converts it into `.mp3` file.
         """
         try:
-            advice: str = self.brain.generate_stoic_advice(user_context=user_context)
+            self._respond(user_context, callback)
+        except Exception as e:
+            print(f"AI module error: {e}")
+
+    def _respond(self, user_context: str, callback: Callable | None) -> None:
+        """
+        Generates advice, passes the text to `callback` and speaks it.
+        When pipelined, the first sentence is spoken while the rest is generated and
+        `callback` gets the full text as soon as generation ends.
+        """
+
+        def deliver(advice: str) -> None:
             print("Advice: ", advice)
             if callback:
                 try:
@@ -73,115 +140,214 @@ class PhilosopherAI:
                 except Exception as e:
                     print(f"Callback to GUI error: {e}")
 
+        if not self.pipelined:
+            advice: str = self.brain.generate_stoic_advice(user_context=user_context)
+            deliver(advice)
             self.voice.speak(advice)
-            time.sleep(3.0)
+            return
+
+        def sentences() -> Iterator[str]:
+            generated: list[str] = []
+            for sentence in self.brain.stream_stoic_advice(user_context=user_context):
+                generated.append(sentence)
+                yield sentence
+            deliver(" ".join(generated))
+
+        self.voice.speak_sentences(sentences())
+
+    def prepare_intervention(
+        self, user_context: str = SPECULATIVE_CONTEXT
+    ) -> Future | None:
+        """
+        Generates and synthesizes an intervention in the background, before it is
+        needed. Cheap to call on every EEG update, only one is prepared at a time.
+
+        :param user_context: Prompt for the model, the history personalises it.
+        :return: Future of the preparation, or None if one is ready or in flight.
+        """
+        token: int | None = self.speculation.begin()
+        if token is None:
+            return None
+        future: Future | None = self.speculator.submit(
+            Priority.EEG_INTERVENTION, self._prepare, user_context, token
+        )
+        if future is None:
+            self.speculation.fail(token)
+        return future
+
+    def discard_intervention(self) -> None:
+        """
+        Throws away the prepared intervention, e.g. when stress recovered.
+        """
+        self.speculation.discard()
+
+    def deliver_intervention(self, on_response_callback=None) -> Future | None:
+        """
+        Speaks the prepared intervention, with no generation or synthesis left.
+
+        :return: Future of the request, or None if nothing fresh was prepared.
+        """
+        prepared: PreparedIntervention | None = self.speculation.take()
+        if prepared is None:
+            return None
+
+        def _deliver():
+            if on_response_callback:
+                on_response_callback(prepared.text)
+            if self.gong:
+                self.voice.play_sound(self.gong).wait()
+            self.voice.play_audio(prepared.audio)
+            self.brain.history.add(prepared.user_context, prepared.text)
+
+        self.last_intervention_time = time.time()
+        return self.scheduler.submit(Priority.SCRIPTED, _deliver)
+
+    def _prepare(self, user_context: str, token: int) -> None:
+        try:
+            advice: str = self.brain.generate_stoic_advice(
+                user_context, remember=False, use_cache=False
+            )
+            audio: bytes = b"".join(self.voice.synthesize(advice))
+            if advice != FALLBACK_ADVICE and audio:
+                if self.speculation.complete(token, user_context, advice, audio):
+                    print("[Philosopher] Intervention prepared.")
+                    return
         except Exception as e:
             print(f"AI module error: {e}")
-        finally:
-            self.is_speaking = False
+        self.speculation.fail(token)
 
-    def say_specific_phrase(self, text: str, on_response_callback=None):
+    def say_specific_phrase(
+        self, text: str, on_response_callback=None
+    ) -> Future | None:
         """
         Sends the text to GUI and plays the audio.
         Can be used for scripted events (e.g., standard conversation started.).
 
         :param text:
+        :return: Future of the request, or None if it was rejected.
+        """
+
+        def _speak():
+            if on_response_callback:
+                on_response_callback(text)
+            if self.gong:
+                self.voice.play_sound(self.gong).wait()
+
+            audio_path: Path = Path(CONVERSATION_STARTER_PATH)
+            if audio_path.exists():
+                # Shares the playback lock, so it never cuts off a reply
+                self.voice.play_file(CONVERSATION_STARTER_PATH)
+            else:
+                print(f"Could not find audio: {audio_path}")
+
+        return self.scheduler.submit(Priority.SCRIPTED, _speak)
+
+    def start_listening(
+        self, sample_rate: int, on_partial: Callable[[str], None] | None = None
+    ) -> TranscriptionStream:
+        """
+        Starts transcribing a recording while it is being captured.
+        Feed it the captured frames and pass it to `process_stream_and_trigger`.
+
+        :param sample_rate: Sample rate of the captured audio.
+        :param on_partial: Function to pass the transcript so far.
+        """
+        return TranscriptionStream(self.stt, sample_rate, on_partial)
+
+    def process_stream_and_trigger(
+        self,
+        stream: TranscriptionStream,
+        on_user_text_callback=None,
+        on_ai_response_callback=None,
+    ) -> Future | None:
+        """
+        Same as `process_wav_and_trigger` for a recording that was transcribed
+        while captured, so only the end of the utterance is left to recognize.
+
+        :param stream: Transcription of the finished recording.
+        :return: Future of the request, or None if it was rejected.
+        """
+        return self.scheduler.submit(
+            Priority.USER_REPLY,
+            self._listen,
+            stream.finish,
+            on_user_text_callback,
+            on_ai_response_callback,
+        )
+
+    def process_recording_and_trigger(
+        self,
+        recording: Recording,
+        on_user_text_callback=None,
+        on_ai_response_callback=None,
+    ) -> Future | None:
+        """
+        Same as `process_wav_and_trigger` for a recording captured in memory.
+
+        :param recording: Voice recording from the GUI.
+        :return: Future of the request, or None if it was rejected.
         """
-        self.is_speaking = True  # not needed
-
-        def _speak_thread():
-            try:
-                if on_response_callback:
-                    on_response_callback(text)
-                if self.gong:
-                    self.gong.play()
-                    time.sleep(1.5)
-
-                audio_path: Path = Path(CONVERSATION_STARTER_PATH)
-                if audio_path.exists():
-                    try:
-                        if pygame.mixer.music.get_busy():
-                            pygame.mixer.music.stop()
-                        try:
-                            pygame.mixer.music.unload()
-                        except AttributeError:
-                            pass
-
-                        pygame.mixer.music.load(CONVERSATION_STARTER_PATH)
-                        pygame.mixer.music.play()
-
-                        while pygame.mixer.music.get_busy():
-                            time.sleep(0.1)
-                    except Exception as e:
-                        print(f"Could not play distress_speech: {e}")
-                else:
-                    print(f"Could not find audio: {audio_path}")
-            finally:
-                self.is_speaking = False
-
-        thread = threading.Thread(target=_speak_thread)
-        thread.start()
+        if self.is_speaking:
+            print("Mentor is speaking, you will be answered next.")
+
+        return self.scheduler.submit(
+            Priority.USER_REPLY,
+            self._listen,
+            lambda: transcribe_recording(self.stt, recording),
+            on_user_text_callback,
+            on_ai_response_callback,
+        )
 
     def process_wav_and_trigger(
         self, file_path: str, on_user_text_callback=None, on_ai_response_callback=None
-    ):
+    ) -> Future | None:
         """
         1. Records user.
-        2. Speech to text conversion (Google STT).
+        2. Speech to text conversion (see `create_speech_to_text`).
         3. Send text to GUI do GUI.
         4. Send text to Gemini -> ElevenLabs -> GUI .
 
         :param file_path: Path to the voice recording.
         :param on_user_text_callback: Function to pass text feedback.
         :param on_ai_response_callback: Function to pass voice feedback.
+        :return: Future of the request, or None if it was rejected.
         """
         if self.is_speaking:
-            print("Mentor is speaking, pay attention now.")
-            return
+            print("Mentor is speaking, you will be answered next.")
 
-        self.is_speaking = True
-
-        def _listen_thread():
-            recognizer: sr.Recognizer = sr.Recognizer()
-
-            try:
-                with sr.AudioFile(file_path) as source:
-                    audio_data = recognizer.record(source)
-
-                # language='pl-PL' for polish, 'en-US' for english
-                user_text: str = recognizer.recognize_google(
-                    audio_data, language="en-us"
-                )
-                if on_user_text_callback:
-                    try:
-                        on_user_text_callback(user_text)
-                    except Exception as e:
-                        print(f"User callback error: {e}")
-
-                ai_advice: str = self.brain.generate_stoic_advice(
-                    user_context=user_text
-                )
-                print(f"AI advice: {ai_advice}")
-
-                if on_ai_response_callback:
-                    try:
-                        on_ai_response_callback(ai_advice)
-                    except Exception as e:
-                        print(f"Błąd callbacka AI: {e}")
-
-                self.voice.speak(ai_advice)
-                time.sleep(3.0)
-
-            except sr.WaitTimeoutError:
-                print("Timeout: Could hear you.")
-            except sr.UnknownValueError:
-                print("Could not understand you.")
-            except sr.RequestError as e:
-                print(f"No connection to Google API: {e}")
-            except Exception as e:
-                print(f"Critical mic audio error: {e}")
-            finally:
-                self.is_speaking = False
-                print("End listening.")
-
-        threading.Thread(target=_listen_thread).start()
+        return self.scheduler.submit(
+            Priority.USER_REPLY,
+            self._listen,
+            lambda: transcribe_wav(self.stt, file_path),
+            on_user_text_callback,
+            on_ai_response_callback,
+        )
+
+    def _listen(
+        self,
+        transcribe: Callable[[], str],
+        on_user_text_callback: Callable | None,
+        on_ai_response_callback: Callable | None,
+    ) -> None:
+        try:
+            user_text: str = transcribe()
+            if not user_text:
+                raise sr.UnknownValueError()
+            if on_user_text_callback:
+                try:
+                    on_user_text_callback(user_text)
+                except Exception as e:
+                    print(f"User callback error: {e}")
+
+            self._respond(user_text, on_ai_response_callback)
+
+        except sr.WaitTimeoutError:
+            print("Timeout: Could hear you.")
+        except sr.UnknownValueError:
+            print("Could not understand you.")
+        except sr.RequestError as e:
+            print(f"No connection to Google API: {e}")
+        except Exception as e:
+            print(f"Critical mic audio error: {e}")
+        finally:
+            print("End listening.")
@@ -0,0 +1,35 @@
+import numpy as np
+
+
+def to_pcm16(frames: np.ndarray) -> bytes:
+    """
+    Converts audio samples to little-endian 16-bit PCM.
+
+    :param frames: Float samples in [-1, 1] or int16 samples.
+    """
+    if frames.dtype != np.int16:
+        frames = (np.clip(frames, -1.0, 1.0) * 32767).astype(np.int16)
+    return frames.astype("<i2", copy=False).tobytes()
+
+
+class Recording:
+    def __init__(self, samples: np.ndarray, sample_rate: int) -> None:
+        """
+        Voice recording held in memory, passed from the GUI to speech recognition
+        instead of a WAV file path.
+
+        :param samples: Mono samples, float in [-1, 1] or int16.
+        :param sample_rate: Sample rate of `samples`.
+        """
+        self.samples: np.ndarray = samples
+        self.sample_rate: int = sample_rate
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / self.sample_rate
+
+    def pcm16(self) -> bytes:
+        return to_pcm16(self.samples)
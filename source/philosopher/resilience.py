@@ -0,0 +1,476 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import math
+import random
+import threading
+import time
+from typing import AsyncIterator, Callable, Iterator
+import httpx
+import numpy as np
+
+_END: object = object()  # Marks an exhausted stream
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Errors a retry may fix: timeouts, lost connections, rate limiting (429) and
+    server errors (5xx). A rejected key (401/403), a bad request (400) or a bug
+    (e.g. `ValueError`) fails the same way every time.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError, httpx.TransportError)):
+        return True
+    status: int | None = _status_code(error)
+    return status is not None and (status == 429 or status >= 500)
+
+
+def _status_code(error: Exception) -> int | None:
+    """
+    HTTP status of an SDK error: `status_code` (ElevenLabs, httpx), `code`
+    (Google API core, urllib) or the same on its `response`.
+    """
+    for source in (error, getattr(error, "response", None)):
+        for attribute in ("status_code", "code", "status"):
+            value = getattr(source, attribute, None)
+            if isinstance(value, int) and 100 <= value < 600:
+                return value
+    return None
+
+
+class LatencyHistogram:
+    BOUNDS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+    def __init__(self, bounds: tuple[float, ...] = BOUNDS, window: int = 256) -> None:
+        """
+        Latencies of successful calls: cumulative bucket counts for reporting and a
+        window of the most recent samples for percentiles.
+
+        :param bounds: Upper bounds of the buckets in seconds, ascending.
+        :param window: Number of recent samples used for percentiles.
+        """
+        self.bounds: tuple[float, ...] = bounds
+        self.buckets: list[int] = [0] * len(bounds)
+        self.count: int = 0
+        self._recent: deque[float] = deque(maxlen=window)
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def counts(self) -> dict[str, int]:
+        return {
+            f"<={bound:g}s": count for bound, count in zip(self.bounds, self.buckets)
+        }
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self._recent.append(seconds)
+            for i, bound in enumerate(self.bounds):
+                if seconds <= bound:
+                    self.buckets[i] += 1
+                    break
+
+    def percentile(self, q: float) -> float | None:
+        """
+        :param q: Percentile in [0, 100].
+        :return: Latency in seconds, or None before the first sample.
+        """
+        with self._lock:
+            if not self._recent:
+                return None
+            return float(np.percentile(self._recent, q))
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """
+        Stops calling a service that keeps failing, so requests fail fast instead
+        of each waiting for its deadline. After `reset_timeout` one trial call is
+        let through, its result closes or reopens the circuit.
+
+        :param failure_threshold: Consecutive failures that open the circuit.
+        :param reset_timeout: Seconds the circuit stays open.
+        """
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.failures: int = 0
+        self._opened_at: float | None = None
+        self._trial: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial:
+                return False
+            self._trial = True  # Only one call probes the service
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+
+class _Started:
+    def __init__(self, iterator, first) -> None:
+        """
+        Stream whose first item has already arrived.
+        """
+        self.iterator = iterator
+        self.first = first
+
+    def close(self) -> None:
+        try:
+            if hasattr(self.iterator, "close"):
+                self.iterator.close()
+        except ValueError:
+            pass  # Still running in an abandoned thread
+
+
+class ResiliencePolicy:
+    def __init__(
+        self,
+        name: str,
+        timeout: float = 10.0,
+        deadline: float = 20.0,
+        retries: int = 2,
+        backoff: float = 0.25,
+        max_backoff: float = 2.0,
+        hedge: bool = False,
+        hedge_percentile: float = 95.0,
+        hedge_min_samples: int = 20,
+        idle_timeout: float | None = None,
+        breaker: CircuitBreaker | None = None,
+        workers: int = 8,
+        retry_on: Callable[[Exception], bool] = is_transient,
+    ) -> None:
+        """
+        Bounds the latency of calls to a remote service.
+        Every attempt has a `timeout`, failed attempts are retried with exponential
+        backoff and jitter until `deadline`, and a `CircuitBreaker` fails calls
+        fast while the service is down. With `hedge`, an attempt still running at
+        the p95 latency of earlier calls gets a duplicate, the first result wins.
+        Attempts run on a small thread pool. A timed-out attempt cannot be
+        killed, it finishes in the background and its result is dropped.
+        Errors that `retry_on` rejects are raised at once and do not count against
+        the circuit, the service did answer.
+
+        :param name: Service name used in logs.
+        :param timeout: Seconds per attempt. For streams, until the first item.
+        :param deadline: Seconds for the whole call, including retries.
+        :param retries: Attempts after the first one.
+        :param backoff: Delay before the first retry, doubled for each next one.
+        :param max_backoff: Upper limit of the delay.
+        :param hedge: Send a duplicate request when an attempt is slow.
+        :param hedge_percentile: Latency percentile after which to hedge.
+        :param hedge_min_samples: Calls to observe before hedging starts.
+        :param idle_timeout: Seconds allowed between stream items, unlimited if None.
+        :param breaker: Circuit breaker, a default one if None.
+        :param workers: Threads available for attempts.
+        :param retry_on: Decides if a failed attempt is worth retrying.
+        """
+        self.name: str = name
+        self.timeout: float = timeout
+        self.deadline: float = deadline
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.hedge: bool = hedge
+        self.hedge_percentile: float = hedge_percentile
+        self.hedge_min_samples: int = hedge_min_samples
+        self.idle_timeout: float | None = idle_timeout
+        self.breaker: CircuitBreaker = breaker or CircuitBreaker()
+        self.retry_on: Callable[[Exception], bool] = retry_on
+        self.histogram: LatencyHistogram = LatencyHistogram()
+
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=name
+        )
+        self.calls: int = 0
+        self.retried: int = 0
+        self.hedged: int = 0
+        self.hedge_wins: int = 0
+        self.timeouts: int = 0
+        self.failures: int = 0
+        self._counter_lock: threading.Lock = threading.Lock()  # Attempts run in pool
+
+    @property
+    def hedge_delay(self) -> float | None:
+        """
+        Seconds after which an attempt is hedged, None if hedging is off or
+        there is not enough history yet.
+        """
+        if not self.hedge or self.histogram.count < self.hedge_min_samples:
+            return None
+        return self.histogram.percentile(self.hedge_percentile)
+
+    @property
+    def stats(self) -> dict:
+        with self._counter_lock:
+            counters: dict[str, int] = {
+                "calls": self.calls,
+                "retries": self.retried,
+                "hedges": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "timeouts": self.timeouts,
+                "failures": self.failures,
+            }
+        return {
+            **counters,
+            "circuit": self.breaker.state,
+            "p50": self.histogram.percentile(50),
+            "p95": self.histogram.percentile(95),
+            "latency": self.histogram.counts,
+        }
+
+    def call(self, function: Callable, *args, **kwargs):
+        """
+        Calls `function` with timeouts, retries, hedging and circuit breaking.
+
+        :raises DeadlineExceeded: No attempt succeeded in time.
+        :raises CircuitOpenError: The service is considered down.
+        """
+        self._count("calls")
+        deadline_at: float = time.monotonic() + self.deadline
+        for attempt in range(self.retries + 1):
+            try:
+                timeout: float = self._before_attempt(deadline_at)
+                result = self._attempt(lambda: function(*args, **kwargs), timeout)
+            except CircuitOpenError:
+                self._count("failures")
+                raise
+            except Exception as e:
+                delay: float | None = self._after_failure(e, attempt, deadline_at)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+    def stream(self, function: Callable, *args, **kwargs) -> Iterator:
+        """
+        Iterates the stream returned by `function`. Getting the first item is one
+        `call` (retried and hedged), later items must arrive within `idle_timeout`.
+        """
+
+        def start() -> _Started:
+            iterator: Iterator = iter(function(*args, **kwargs))
+            return _Started(iterator, next(iterator, _END))
+
+        started: _Started = self.call(start)
+        try:
+            item = started.first
+            while item is not _END:
+                yield item
+                item = self._next(started.iterator)
+        finally:
+            started.close()
+
+    async def call_async(self, function: Callable, *args, **kwargs):
+        """
+        Same as `call` for a coroutine function, on the running event loop.
+        """
+        self._count("calls")
+        deadline_at: float = time.monotonic() + self.deadline
+        for attempt in range(self.retries + 1):
+            try:
+                timeout: float = self._before_attempt(deadline_at)
+                result = await self._attempt_async(
+                    lambda: function(*args, **kwargs), timeout
+                )
+            except CircuitOpenError:
+                self._count("failures")
+                raise
+            except Exception as e:
+                delay: float | None = self._after_failure(e, attempt, deadline_at)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+    async def stream_async(self, function: Callable, *args, **kwargs) -> AsyncIterator:
+        """
+        Same as `stream` for a function returning an async iterator.
+        """
+
+        async def start() -> _Started:
+            iterator: AsyncIterator = function(*args, **kwargs).__aiter__()
+            try:
+                return _Started(iterator, await iterator.__anext__())
+            except StopAsyncIteration:
+                return _Started(iterator, _END)
+
+        started: _Started = await self.call_async(start)
+        try:
+            item = started.first
+            while item is not _END:
+                yield item
+                try:
+                    item = await asyncio.wait_for(
+                        started.iterator.__anext__(), self.idle_timeout
+                    )
+                except StopAsyncIteration:
+                    item = _END
+                except asyncio.TimeoutError:
+                    self._count("timeouts")
+                    raise DeadlineExceeded(f"{self.name} stream stalled") from None
+        finally:
+            if hasattr(started.iterator, "aclose"):
+                await started.iterator.aclose()
+
+    def _count(self, counter: str) -> None:
+        with self._counter_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _before_attempt(self, deadline_at: float) -> float:
+        """
+        :return: Timeout of the next attempt.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"{self.name} is unavailable, circuit is open")
+        remaining: float = deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"{self.name} deadline of {self.deadline} s passed")
+        return min(self.timeout, remaining)
+
+    def _after_failure(
+        self, error: Exception, attempt: int, deadline_at: float
+    ) -> float | None:
+        """
+        :return: Backoff before the next attempt, or None to give up.
+        """
+        if not self.retry_on(error):
+            self.breaker.record_success()  # Answered, the service itself is up
+            self._count("failures")
+            return None
+        self.breaker.record_failure()
+        if isinstance(error, DeadlineExceeded):
+            self._count("timeouts")
+        delay: float = min(self.max_backoff, self.backoff * 2**attempt)
+        delay *= random.uniform(0.5, 1.0)
+        if attempt == self.retries or time.monotonic() + delay >= deadline_at:
+            self._count("failures")
+            return None
+        self._count("retried")
+        print(f"[{self.name}] Attempt {attempt + 1} failed ({error}), retrying.")
+        return delay
+
+    def _attempt(self, work: Callable, timeout: float):
+        started: float = time.monotonic()
+        futures: list[Future] = [self._executor.submit(work)]
+        hedge_delay: float | None = self.hedge_delay
+        if hedge_delay is not None and hedge_delay < timeout:
+            if not wait(futures, timeout=hedge_delay).done:
+                self._count("hedged")
+                futures.append(self._executor.submit(work))
+
+        pending: set[Future] = set(futures)
+        error: BaseException | None = None
+        while pending:
+            remaining: float = timeout - (time.monotonic() - started)
+            done, pending = wait(
+                pending, timeout=remaining, return_when=FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    self.histogram.record(time.monotonic() - started)
+                    if future is not futures[0]:
+                        self._count("hedge_wins")
+                    for loser in futures:
+                        if loser is not future:
+                            loser.add_done_callback(self._discard)
+                    return future.result()
+                error = future.exception()
+
+        for future in futures:
+            future.add_done_callback(self._discard)
+        if error is not None and not pending:
+            raise error
+        raise DeadlineExceeded(f"{self.name} did not answer within {timeout:.2f} s")
+
+    async def _attempt_async(self, work: Callable, timeout: float):
+        started: float = time.monotonic()
+        tasks: list[asyncio.Task] = [asyncio.ensure_future(work())]
+        hedge_delay: float | None = self.hedge_delay
+        if hedge_delay is not None and hedge_delay < timeout:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done:
+                self._count("hedged")
+                tasks.append(asyncio.ensure_future(work()))
+
+        pending: set[asyncio.Task] = set(tasks)
+        error: BaseException | None = None
+        try:
+            while pending:
+                remaining: float = timeout - (time.monotonic() - started)
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(remaining, 0), return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    if task.exception() is None:
+                        self.histogram.record(time.monotonic() - started)
+                        if task is not tasks[0]:
+                            self._count("hedge_wins")
+                        return task.result()
+                    error = task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if error is not None and not pending:
+            raise error
+        raise DeadlineExceeded(f"{self.name} did not answer within {timeout:.2f} s")
+
+    def _next(self, iterator: Iterator):
+        if self.idle_timeout is None:
+            return next(iterator, _END)
+        try:
+            return self._executor.submit(next, iterator, _END).result(
+                timeout=self.idle_timeout
+            )
+        except TimeoutError:
+            self._count("timeouts")
+            raise DeadlineExceeded(f"{self.name} stream stalled") from None
+
+    @staticmethod
+    def _discard(future: Future) -> None:
+        """
+        Closes the stream of an abandoned attempt once it finishes.
+        """
+        if not future.cancelled() and future.exception() is None:
+            result = future.result()
+            if isinstance(result, _Started):
+                result.close()
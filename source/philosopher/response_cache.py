@@ -0,0 +1,173 @@
+import random
+import re
+import threading
+import time
+import zlib
+import numpy as np
+
+from source.philosopher.utils import (
+    RESPONSE_CACHE_HIT_PROBABILITY,
+    RESPONSE_CACHE_THRESHOLD,
+    RESPONSE_CACHE_TTL,
+)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        threshold: float = RESPONSE_CACHE_THRESHOLD,
+        ttl: float = RESPONSE_CACHE_TTL,
+        hit_probability: float = RESPONSE_CACHE_HIT_PROBABILITY,
+        max_entries: int = 256,
+        ngram: int = 3,
+        dimensions: int = 1024,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Answers repeated prompts without asking the model.
+        A prompt matches a cached one if their normalized text is equal, or if the
+        cosine similarity of their hashed character n-gram vectors reaches
+        `threshold` ("the build is broken" ~ "the build is broken again").
+        Both must also follow the same `context`, the latest turns of the
+        conversation, so "yes" is never answered with a reply to another question.
+        Vectors of all entries live in one preallocated matrix, so a lookup is a
+        single matrix-vector product.
+
+        :param threshold: Minimum cosine similarity of a near-duplicate, 1 disables it.
+        :param ttl: Seconds an answer stays valid.
+        :param hit_probability: Chance a match is used, lower values keep replies varied.
+        :param max_entries: Number of answers kept, the oldest one is replaced.
+        :param ngram: Length of the character n-grams.
+        :param dimensions: Length of the hashed vectors.
+        :param seed: Seed of the hit-probability draws, for reproducible tests.
+        """
+        self.threshold: float = threshold
+        self.ttl: float = ttl
+        self.hit_probability: float = hit_probability
+        self.ngram: int = ngram
+        self.dimensions: int = dimensions
+
+        self._random: random.Random = random.Random(seed)
+        self._lock: threading.Lock = threading.Lock()
+        self._vectors: np.ndarray = np.zeros((max_entries, dimensions), np.float32)
+        self._created: np.ndarray = np.full(max_entries, -np.inf)
+        self._keys: list[tuple[str, str] | None] = [None] * max_entries
+        self._contexts: np.ndarray = np.zeros(max_entries, np.uint32)  # crc32
+        self._responses: list[str] = [""] * max_entries
+        self._latencies: list[float] = [0.0] * max_entries
+        self._slots: dict[tuple[str, str], int] = {}  # (context, prompt) -> row
+
+        self.exact_hits: int = 0
+        self.similar_hits: int = 0
+        self.skipped_hits: int = 0
+        self.misses: int = 0
+        self.latency_saved: float = 0.0
+
+    @property
+    def stats(self) -> dict[str, float]:
+        lookups: int = (
+            self.exact_hits + self.similar_hits + self.skipped_hits + self.misses
+        )
+        hits: int = self.exact_hits + self.similar_hits
+        return {
+            "exact_hits": self.exact_hits,
+            "similar_hits": self.similar_hits,
+            "skipped_hits": self.skipped_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "latency_saved": self.latency_saved,
+        }
+
+    def get(self, prompt: str, context: str = "") -> str | None:
+        """
+        :param prompt: Text input from the user.
+        :param context: Latest turns the prompt follows, see `ChatHistory.recent`.
+        :return: Cached answer, or None if the model has to be asked.
+        """
+        key: tuple[str, str] = (self.normalize(context), self.normalize(prompt))
+        with self._lock:
+            now: float = time.monotonic()
+            slot: int | None = self._slots.get(key)
+            exact: bool = slot is not None and self._is_fresh(slot, now)
+            if not exact:
+                slot = self._most_similar(key, now)
+            if slot is None:
+                self.misses += 1
+                return None
+            if self._random.random() >= self.hit_probability:
+                self.skipped_hits += 1
+                return None
+
+            if exact:
+                self.exact_hits += 1
+            else:
+                self.similar_hits += 1
+            self.latency_saved += self._latencies[slot]
+            return self._responses[slot]
+
+    def put(
+        self, prompt: str, response: str, latency: float = 0.0, context: str = ""
+    ) -> None:
+        """
+        Stores an answer of the model.
+
+        :param prompt: Text input from the user.
+        :param response: Answer of the model.
+        :param latency: Seconds the model took, reported as saved on every hit.
+        :param context: Latest turns the prompt followed.
+        """
+        key: tuple[str, str] = (self.normalize(context), self.normalize(prompt))
+        if not key[1]:
+            return
+        with self._lock:
+            slot: int | None = self._slots.get(key)
+            if slot is None:
+                slot = int(np.argmin(self._created))  # Empty or oldest
+                old_key: tuple[str, str] | None = self._keys[slot]
+                if old_key is not None:
+                    del self._slots[old_key]
+                self._slots[key] = slot
+                self._keys[slot] = key
+                self._vectors[slot] = self._vectorize(key[1])
+                self._contexts[slot] = zlib.crc32(key[0].encode())
+            self._responses[slot] = response
+            self._latencies[slot] = latency
+            self._created[slot] = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._slots.clear()
+            self._keys = [None] * len(self._keys)
+            self._vectors[:] = 0.0
+            self._created[:] = -np.inf
+
+    @staticmethod
+    def normalize(prompt: str) -> str:
+        """
+        Lowercase words without punctuation, single-spaced.
+        """
+        return " ".join(re.sub(r"[^\w\s]", " ", prompt.lower()).split())
+
+    def _vectorize(self, key: str) -> np.ndarray:
+        """
+        L2-normalized counts of hashed character n-grams.
+        """
+        vector: np.ndarray = np.zeros(self.dimensions, np.float32)
+        padded: str = f" {key} "
+        for i in range(max(len(padded) - self.ngram + 1, 1)):
+            gram: bytes = padded[i : i + self.ngram].encode()
+            vector[zlib.crc32(gram) % self.dimensions] += 1.0
+        norm: float = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _most_similar(self, key: tuple[str, str], now: float) -> int | None:
+        similarity: np.ndarray = self._vectors @ self._vectorize(key[1])
+        similarity[now - self._created > self.ttl] = -1.0  # Expired or empty
+        similarity[self._contexts != zlib.crc32(key[0].encode())] = -1.0
+        slot: int = int(np.argmax(similarity))
+        if similarity[slot] < self.threshold or self._keys[slot][0] != key[0]:
+            return None
+        return slot
+
+    def _is_fresh(self, slot: int, now: float) -> bool:
+        return now - self._created[slot] <= self.ttl
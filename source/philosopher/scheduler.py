@@ -0,0 +1,251 @@
+import asyncio
+from concurrent.futures import Future
+from enum import IntEnum
+import itertools
+import queue
+import threading
+from typing import Callable, Coroutine
+
+
+class Priority(IntEnum):
+    # Lower value runs first
+    SCRIPTED = 0
+    USER_REPLY = 1
+    EEG_INTERVENTION = 2
+
+
+class PhilosopherScheduler:
+    def __init__(self, workers: int = 1, max_pending: int = 4) -> None:
+        """
+        Fixed pool of worker threads fed by a priority queue.
+        Bursts of requests wait in the queue instead of each starting a thread.
+        When `max_pending` requests are waiting, a new one replaces the least
+        important waiting request if it is more important itself, else it is rejected.
+
+        :param workers: Number of worker threads. One keeps replies from overlapping.
+        :param max_pending: Maximum number of waiting (not running) requests.
+        """
+        self.max_pending: int = max_pending
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._order: itertools.count = itertools.count()  # FIFO within a priority
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: dict[Future, Priority] = {}
+        self._running: int = 0
+        self._shutdown: bool = False
+
+        self._workers: list[threading.Thread] = [
+            threading.Thread(target=self._worker_loop, daemon=True)
+            for _ in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def busy(self) -> bool:
+        """
+        True while any request is waiting or running.
+        """
+        with self._lock:
+            return bool(self._pending) or self._running > 0
+
+    def submit(
+        self, priority: Priority, function: Callable, *args, **kwargs
+    ) -> Future | None:
+        """
+        Queues a call.
+
+        :param priority: Importance of the request.
+        :param function: Called on a worker thread with `args` and `kwargs`.
+        :return: Future of the result, or None if the request was rejected.
+        """
+        with self._lock:
+            if self._shutdown:
+                return None
+            if len(self._pending) >= self.max_pending:
+                # Newest of the least important requests is the cheapest to drop
+                victim: Future = max(
+                    reversed(self._pending), key=lambda f: self._pending[f]
+                )
+                if self._pending[victim] <= priority:
+                    return None
+                self._cancel(victim)
+
+            future: Future = Future()
+            self._pending[future] = priority
+            self._queue.put(
+                (priority, next(self._order), future, function, args, kwargs)
+            )
+            return future
+
+    def cancel_pending(self, priority: Priority | None = None) -> int:
+        """
+        Cancels waiting requests. Running ones finish normally.
+
+        :param priority: Only cancel requests of this priority, all if None.
+        :return: Number of cancelled requests.
+        """
+        with self._lock:
+            victims: list[Future] = [
+                future
+                for future, future_priority in self._pending.items()
+                if priority is None or future_priority == priority
+            ]
+            for future in victims:
+                self._cancel(future)
+            return len(victims)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Rejects new requests, cancels waiting ones and stops the workers.
+
+        :param wait: Block until the running requests finish.
+        """
+        with self._lock:
+            self._shutdown = True
+        self.cancel_pending()
+        for _ in self._workers:
+            # Sorts after every real request
+            self._queue.put((len(Priority), next(self._order), None, None, (), {}))
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _cancel(self, future: Future) -> None:
+        """
+        Must be called with `_lock` held. The worker skips the cancelled entry.
+        """
+        del self._pending[future]
+        future.cancel()
+
+    def _worker_loop(self) -> None:
+        while True:
+            _, _, future, function, args, kwargs = self._queue.get()
+            if future is None:
+                return
+
+            with self._lock:
+                self._pending.pop(future, None)
+                if not future.set_running_or_notify_cancel():
+                    continue  # Cancelled while waiting
+                self._running += 1
+
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as e:
+                print(f"[Philosopher Scheduler] Request failed: {e}")
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+
+class AsyncPhilosopherScheduler:
+    def __init__(self, max_pending: int = 4) -> None:
+        """
+        Coroutine version of `PhilosopherScheduler`: one worker task on the running
+        loop takes requests from a priority queue, so replies never overlap and
+        scripted phrases still go first. The worker starts with the first request.
+
+        :param max_pending: Maximum number of waiting (not running) requests.
+        """
+        self.max_pending: int = max_pending
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._order: itertools.count = itertools.count()  # FIFO within a priority
+        self._pending: dict[asyncio.Future, Priority] = {}
+        self._running: asyncio.Future | None = None
+        self._worker: asyncio.Task | None = None
+        self._shutdown: bool = False
+
+    @property
+    def busy(self) -> bool:
+        """
+        True while any request is waiting or running.
+        """
+        return bool(self._pending) or (
+            self._running is not None and not self._running.done()
+        )
+
+    def submit(
+        self, priority: Priority, function: Callable[..., Coroutine], *args
+    ) -> asyncio.Future | None:
+        """
+        Queues a coroutine. Must be called with the event loop running.
+
+        :param priority: Importance of the request.
+        :param function: Coroutine function, called with `args` when its turn comes.
+        :return: Future of the result, or None if the request was rejected.
+        """
+        if self._shutdown:
+            return None
+        if len(self._pending) >= self.max_pending:
+            # Newest of the least important requests is the cheapest to drop
+            victim: asyncio.Future = max(
+                reversed(self._pending), key=lambda f: self._pending[f]
+            )
+            if self._pending[victim] <= priority:
+                return None
+            self._cancel(victim)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[future] = priority
+        self._queue.put_nowait((priority, next(self._order), future, function, args))
+        if self._worker is None:
+            self._worker = asyncio.ensure_future(self._worker_loop())
+        return future
+
+    def cancel_pending(self, priority: Priority | None = None) -> int:
+        """
+        Cancels waiting requests. The running one finishes normally.
+
+        :param priority: Only cancel requests of this priority, all if None.
+        :return: Number of cancelled requests.
+        """
+        victims: list[asyncio.Future] = [
+            future
+            for future, future_priority in self._pending.items()
+            if priority is None or future_priority == priority
+        ]
+        for future in victims:
+            self._cancel(future)
+        return len(victims)
+
+    def shutdown(self) -> None:
+        """
+        Rejects new requests and cancels the waiting and the running ones.
+        """
+        self._shutdown = True
+        self.cancel_pending()
+        if self._running is not None:
+            self._running.cancel()  # Also cancels its task
+        if self._worker is not None:
+            self._worker.cancel()
+
+    def _cancel(self, future: asyncio.Future) -> None:
+        """
+        The worker skips the cancelled entry.
+        """
+        del self._pending[future]
+        future.cancel()
+
+    async def _worker_loop(self) -> None:
+        while True:
+            _, _, future, function, args = await self._queue.get()
+            self._pending.pop(future, None)
+            if future.done():
+                continue  # Cancelled while waiting
+
+            task: asyncio.Task = asyncio.ensure_future(function(*args))
+            self._running = future
+            # Cancelling the returned future stops the request
+            future.add_done_callback(lambda _, task=task: task.cancel())
+            await asyncio.wait([task])
+
+            if future.done():
+                continue
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                print(f"[Philosopher Scheduler] Request failed: {task.exception()}")
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
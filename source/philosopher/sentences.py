@@ -0,0 +1,42 @@
+import re
+
+# End of a sentence: terminal punctuation, optional closing quotes, then whitespace
+SENTENCE_END: re.Pattern = re.compile(r"[.!?…]+[\"')\]]*\s+")
+
+
+class SentenceSplitter:
+    def __init__(self, min_length: int = 12) -> None:
+        """
+        Cuts streamed text into sentences as soon as each one is complete.
+
+        :param min_length: Shorter sentences are joined with the next one, so
+            fragments like "No." are not synthesized on their own.
+        """
+        self.min_length: int = min_length
+        self._pending: str = ""
+
+    def feed(self, text: str) -> list[str]:
+        """
+        Adds streamed text.
+
+        :param text: Next piece of the response.
+        :return: Sentences completed by this piece.
+        """
+        self._pending += text
+        sentences: list[str] = []
+        start: int = 0
+        for match in SENTENCE_END.finditer(self._pending):
+            sentence: str = self._pending[start : match.end()].strip()
+            if len(sentence) >= self.min_length:
+                sentences.append(sentence)
+                start = match.end()
+        self._pending = self._pending[start:]
+        return sentences
+
+    def flush(self) -> str | None:
+        """
+        :return: Text left after the last complete sentence, or None.
+        """
+        rest: str = self._pending.strip()
+        self._pending = ""
+        return rest or None
@@ -0,0 +1,120 @@
+import threading
+import time
+
+from source.philosopher.utils import SPECULATION_TTL
+
+
+class PreparedIntervention:
+    def __init__(self, user_context: str, text: str, audio: bytes, ttl: float) -> None:
+        """
+        Intervention generated and synthesized ahead of time.
+
+        :param user_context: Prompt the advice answers.
+        :param text: Advice of the model.
+        :param audio: Its speech, in the voice engine's output format.
+        :param ttl: Seconds it stays relevant.
+        """
+        self.user_context: str = user_context
+        self.text: str = text
+        self.audio: bytes = audio
+        self.expires_at: float = time.monotonic() + ttl
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class InterventionSlot:
+    def __init__(self, ttl: float = SPECULATION_TTL) -> None:
+        """
+        Holds at most one speculative intervention.
+        Preparation starts when stress becomes worrying, the result is taken when
+        stress crosses the intervention threshold, and thrown away if stress recovers.
+        Each preparation gets a token, a discard invalidates tokens in flight, so
+        a late result of an abandoned preparation is never stored.
+
+        :param ttl: Seconds a prepared intervention stays relevant.
+        """
+        self.ttl: float = ttl
+        self._lock: threading.Lock = threading.Lock()
+        self._prepared: PreparedIntervention | None = None
+        self._generation: int = 0
+        self._preparing: int | None = None  # Token of the preparation in flight
+
+        self.prepared: int = 0
+        self.delivered: int = 0
+        self.discarded: int = 0
+        self.expired: int = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "prepared": self.prepared,
+            "delivered": self.delivered,
+            "discarded": self.discarded,
+            "expired": self.expired,
+        }
+
+    def begin(self) -> int | None:
+        """
+        :return: Token for a new preparation, or None if one is ready or in flight.
+        """
+        with self._lock:
+            self._drop_expired()
+            if self._prepared is not None or self._preparing is not None:
+                return None
+            self._generation += 1
+            self._preparing = self._generation
+            return self._preparing
+
+    def complete(self, token: int, user_context: str, text: str, audio: bytes) -> bool:
+        """
+        Stores the result of a preparation.
+
+        :return: False if the preparation was discarded meanwhile.
+        """
+        with self._lock:
+            if token != self._preparing:
+                return False
+            self._preparing = None
+            self._prepared = PreparedIntervention(user_context, text, audio, self.ttl)
+            self.prepared += 1
+            return True
+
+    def fail(self, token: int) -> None:
+        """
+        Ends a preparation without result, so a new one can begin.
+        """
+        with self._lock:
+            if token == self._preparing:
+                self._preparing = None
+
+    def take(self) -> PreparedIntervention | None:
+        """
+        :return: Fresh prepared intervention, which leaves the slot, or None.
+        """
+        with self._lock:
+            self._drop_expired()
+            prepared: PreparedIntervention | None = self._prepared
+            self._prepared = None
+            if prepared is not None:
+                self.delivered += 1
+            return prepared
+
+    def discard(self) -> None:
+        """
+        Drops the prepared intervention and abandons the one in flight.
+        """
+        with self._lock:
+            if self._prepared is not None or self._preparing is not None:
+                self.discarded += 1
+            self._prepared = None
+            self._preparing = None
+
+    def _drop_expired(self) -> None:
+        """
+        Must be called with `_lock` held.
+        """
+        if self._prepared is not None and not self._prepared.is_fresh:
+            self._prepared = None
+            self.expired += 1
@@ -0,0 +1,221 @@
+import json
+from pathlib import Path
+import queue
+import threading
+from typing import Callable, Protocol
+import wave
+import numpy as np
+import speech_recognition as sr
+
+from source.philosopher.recording import Recording, to_pcm16
+from source.philosopher.utils import GOOGLE_STT_URL, STT_LANGUAGE, VOSK_MODEL_PATH
+from source.philosopher.warmup import resolve_host
+
+# optional offline backend
+try:
+    import vosk
+except ImportError:
+    vosk = None
+
+
+class RecognitionSession(Protocol):
+    def accept(self, pcm: bytes) -> str | None:
+        """
+        Consumes 16-bit mono PCM.
+
+        :return: Transcript so far if it changed, else None.
+        """
+
+    def result(self) -> str:
+        """
+        :return: Final transcript, empty if nothing was understood.
+        """
+
+
+class SpeechToText(Protocol):
+    name: str
+
+    def create_session(self, sample_rate: int) -> RecognitionSession:
+        """
+        Starts recognizing one utterance.
+        """
+
+    def warm_up(self) -> None:
+        """
+        Prepares the backend, so the first utterance is not slower than the rest.
+        """
+
+
+class GoogleSpeechToText:
+    name: str = "Google"
+
+    def create_session(self, sample_rate: int) -> RecognitionSession:
+        return _GoogleSession(sample_rate)
+
+    def warm_up(self) -> None:
+        """
+        `speech_recognition` opens a new connection per request, so only the host
+        lookup can be done ahead.
+        """
+        resolve_host(GOOGLE_STT_URL)
+
+
+class _GoogleSession:
+    def __init__(self, sample_rate: int) -> None:
+        """
+        Google's free endpoint takes whole utterances, so audio is only collected
+        and sent once the recording ends.
+        """
+        self.sample_rate: int = sample_rate
+        self._pcm: bytearray = bytearray()
+
+    def accept(self, pcm: bytes) -> str | None:
+        self._pcm.extend(pcm)
+        return None
+
+    def result(self) -> str:
+        audio: sr.AudioData = sr.AudioData(bytes(self._pcm), self.sample_rate, 2)
+        try:
+            return sr.Recognizer().recognize_google(audio, language=STT_LANGUAGE)
+        except sr.UnknownValueError:
+            return ""
+
+
+class VoskSpeechToText:
+    name: str = "Vosk"
+
+    def __init__(self, model_path: str | Path = VOSK_MODEL_PATH) -> None:
+        """
+        Offline recognizer running on the CPU, transcribing while audio is captured.
+
+        :param model_path: Unpacked Vosk model directory.
+        """
+        if vosk is None:
+            raise ImportError("Offline speech recognition requires the 'vosk' package")
+        vosk.SetLogLevel(-1)
+        self.model: vosk.Model = vosk.Model(str(model_path))
+
+    def create_session(self, sample_rate: int) -> RecognitionSession:
+        return _VoskSession(vosk.KaldiRecognizer(self.model, sample_rate))
+
+    def warm_up(self) -> None:
+        """
+        Recognizes a moment of silence, which pages the model into memory.
+        """
+        session: RecognitionSession = self.create_session(16000)
+        session.accept(bytes(16000))
+        session.result()
+
+
+class _VoskSession:
+    def __init__(self, recognizer) -> None:
+        self.recognizer = recognizer
+        self._phrases: list[str] = []  # Finalized at pauses in speech
+
+    def accept(self, pcm: bytes) -> str | None:
+        if self.recognizer.AcceptWaveform(pcm):
+            self._phrases.append(json.loads(self.recognizer.Result())["text"])
+            return self._join(self._phrases)
+        partial: str = json.loads(self.recognizer.PartialResult())["partial"]
+        return self._join([*self._phrases, partial]) if partial else None
+
+    def result(self) -> str:
+        self._phrases.append(json.loads(self.recognizer.FinalResult())["text"])
+        return self._join(self._phrases)
+
+    @staticmethod
+    def _join(phrases: list[str]) -> str:
+        return " ".join(phrase for phrase in phrases if phrase)
+
+
+def create_speech_to_text() -> SpeechToText:
+    """
+    Offline Vosk when the package and a model are available, Google otherwise.
+    """
+    if vosk is not None and Path(VOSK_MODEL_PATH).is_dir():
+        try:
+            return VoskSpeechToText()
+        except Exception as e:
+            print(f"Could not load the Vosk model: {e}")
+    return GoogleSpeechToText()
+
+
+class TranscriptionStream:
+    def __init__(
+        self,
+        stt: SpeechToText,
+        sample_rate: int,
+        on_partial: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        Transcribes audio while it is being recorded.
+        `feed` only queues frames, so it can be called from the audio callback;
+        recognition runs on a worker thread.
+
+        :param stt: Recognition backend.
+        :param sample_rate: Sample rate of the fed frames.
+        :param on_partial: Called from the worker with every updated transcript.
+        """
+        self.sample_rate: int = sample_rate
+        self.on_partial: Callable[[str], None] | None = on_partial
+        self.partial: str = ""
+
+        self._session: RecognitionSession = stt.create_session(sample_rate)
+        self._frames: queue.Queue[bytes | None] = queue.Queue()
+        self._result: str = ""
+        self._error: Exception | None = None
+        self._thread: threading.Thread = threading.Thread(
+            target=self._worker_loop, daemon=True
+        )
+        self._thread.start()
+
+    def feed(self, frames: np.ndarray) -> None:
+        """
+        Queues captured audio.
+
+        :param frames: Float samples in [-1, 1] or int16 samples, mono.
+        """
+        self._frames.put(to_pcm16(frames))
+
+    def finish(self, timeout: float | None = None) -> str:
+        """
+        Ends the utterance and waits for the final transcript.
+
+        :return: Transcript, empty if nothing was understood.
+        """
+        self._frames.put(None)
+        self._thread.join(timeout)
+        if self._error:
+            raise self._error
+        return self._result
+
+    def _worker_loop(self) -> None:
+        try:
+            while (pcm := self._frames.get()) is not None:
+                partial: str | None = self._session.accept(pcm)
+                if partial is not None and partial != self.partial:
+                    self.partial = partial
+                    if self.on_partial:
+                        self.on_partial(partial)
+            self._result = self._session.result()
+        except Exception as e:
+            self._error = e
+
+
+def transcribe_recording(stt: SpeechToText, recording: Recording) -> str:
+    """
+    Transcribes a recording captured in memory.
+    """
+    session: RecognitionSession = stt.create_session(recording.sample_rate)
+    session.accept(recording.pcm16())
+    return session.result()
+
+
+def transcribe_wav(stt: SpeechToText, file_path: str | Path) -> str:
+    """
+    Transcribes a 16-bit mono WAV file.
+    """
+    with wave.open(str(file_path), "rb") as wav:
+        session: RecognitionSession = stt.create_session(wav.getframerate())
+        session.accept(wav.readframes(wav.getnframes()))
+    return session.result()
@@ -0,0 +1,115 @@
+from collections import OrderedDict
+import hashlib
+import os
+from pathlib import Path
+import threading
+
+from source.philosopher.utils import TTS_CACHE_DIR
+
+
+class TTSCache:
+    def __init__(
+        self,
+        directory: str | Path = TTS_CACHE_DIR,
+        max_disk_bytes: int = 200 * 1024 * 1024,
+        max_memory_bytes: int = 20 * 1024 * 1024,
+    ) -> None:
+        """
+        Content-addressed store of synthesized audio.
+        Entries are named by a hash of everything that affects the audio, kept in
+        memory (LRU) and on disk (LRU by access time), each bounded in bytes.
+
+        :param directory: Cache directory, created on the first write.
+        :param max_disk_bytes: Size limit of the directory.
+        :param max_memory_bytes: Size limit of the in-memory layer.
+        """
+        self.directory: Path = Path(directory)
+        self.max_disk_bytes: int = max_disk_bytes
+        self.max_memory_bytes: int = max_memory_bytes
+
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+        self.memory_hits: int = 0
+        self.disk_hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def key(text: str, voice_id: str, model_id: str, output_format: str) -> str:
+        """
+        Cache key of one synthesis request.
+        """
+        request: str = "\0".join((text, voice_id, model_id, output_format))
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+    def get(self, key: str) -> bytes | None:
+        """
+        :return: Cached audio, or None.
+        """
+        with self._lock:
+            audio: bytes | None = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return audio
+
+            path: Path = self.directory / key
+            try:
+                audio = path.read_bytes()
+            except FileNotFoundError:
+                self.misses += 1
+                return None
+
+            os.utime(path)  # Marks it as recently used
+            self.disk_hits += 1
+            self._remember(key, audio)
+            return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        with self._lock:
+            self._remember(key, audio)
+            # Written under a temporary name, so readers never see a partial file
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temporary: Path = self.directory / f"{key}.part"
+            temporary.write_bytes(audio)
+            temporary.replace(self.directory / key)
+            self._evict_disk()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self.directory.exists():
+                for path in self.directory.iterdir():
+                    path.unlink()
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_memory_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _evict_disk(self) -> None:
+        entries: list[tuple[os.stat_result, Path]] = [
+            (path.stat(), path) for path in self.directory.iterdir()
+        ]
+        total: int = sum(stat.st_size for stat, _ in entries)
+        for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink()
+            total -= stat.st_size
@@ -18,6 +18,73 @@ TEST_SYSTEM_INSTRUCTION: Final[str] = """CONSTRAINTS:
 4. Style: Ancient greek but in english.
 """
 STOIC_VOICE_ID: Final[str] = "pqHfZKP75CvOlQylNhV4"  # using Bill bc he is a cool guy
+FALLBACK_ADVICE: Final[str] = (
+    "Patience. The API is silent, but your mind must remain clear even in the time of doubt."
+)
+
 GONG_SOUND_PATH: Final[str] = "assets/gong_sound.mp3"
 
 CONVERSATION_STARTER_PATH: Final[str] = "assets/distress_speech.mp3"
+
+# Raw 16-bit mono PCM from ElevenLabs, playable without decoding
+PCM_OUTPUT_FORMAT: Final[str] = "pcm_22050"
+PCM_SAMPLE_RATE: Final[int] = 22050
+
+TTS_MODEL_ID: Final[str] = "eleven_turbo_v2_5"
+MP3_OUTPUT_FORMAT: Final[str] = "mp3_44100_128"
+TTS_CACHE_DIR: Final[str] = ".tts_cache"
+
+STT_LANGUAGE: Final[str] = "en-us"  # 'pl-PL' for polish
+# Optional offline recognizer, e.g. unpacked "vosk-model-small-en-us-0.15"
+VOSK_MODEL_PATH: Final[str] = "assets/vosk_model"
+
+# Answers to repeated prompts, see `ResponseCache`
+RESPONSE_CACHE_THRESHOLD: Final[float] = 0.85
+RESPONSE_CACHE_TTL: Final[float] = 30 * 60.0
+RESPONSE_CACHE_HIT_PROBABILITY: Final[float] = 0.7
+
+# Conversation resent with every request, see `ChatHistory`
+HISTORY_TOKEN_BUDGET: Final[int] = 1000
+SUMMARY_TOKEN_BUDGET: Final[int] = 200
+
+# Intervention prepared while stress is worrying, see `InterventionSlot`
+SPECULATION_TTL: Final[float] = 120.0
+SPECULATIVE_CONTEXT: Final[str] = (
+    "My stress keeps rising while I work, but I have not said anything yet. "
+    "Speak to me first."
+)
+
+# Model behind the philosopher: "gemini", "local", "canned" or "auto"
+BRAIN_BACKEND_ENV: Final[str] = "PHILOSOPHER_BRAIN"
+# llama.cpp-compatible GGUF model, e.g. a 1-3B instruct model at Q4
+LOCAL_MODEL_PATH: Final[str] = "assets/models/philosopher.gguf"
+LOCAL_CONTEXT_TOKENS: Final[int] = 2048
+LOCAL_MAX_TOKENS: Final[int] = 96
+CANNED_ADVICE: Final[tuple[str, ...]] = (
+    "The bug is external. Your anger is internal. Which one can you fix?",
+    "You suffer more in imagination than in reality. What is actually in front of you?",
+    "Nothing is so bad that breathing slowly cannot make it smaller. Try it now.",
+    "Is this within your control? If not, why carry it?",
+    "The obstacle is the way. What is this failure teaching you?",
+    "Seneca waited out worse storms than this deploy. What would he do next?",
+)
+
+# Latency bounds of remote calls, see `ResiliencePolicy`
+GEMINI_TIMEOUT: Final[float] = 8.0  # Per attempt, until the first streamed chunk
+GEMINI_DEADLINE: Final[float] = 15.0  # Including retries
+TTS_TIMEOUT: Final[float] = 5.0
+TTS_DEADLINE: Final[float] = 10.0
+LOCAL_TIMEOUT: Final[float] = 10.0
+STREAM_IDLE_TIMEOUT: Final[float] = 5.0  # Between chunks of a started stream
+GEMINI_HEDGE_REQUESTS: Final[bool] = True  # Duplicates only calls slower than p95
+TTS_HEDGE_REQUESTS: Final[bool] = False  # A duplicate synthesis is billed twice
+
+# Connections opened at startup and kept alive, see `ConnectionWarmer`
+ELEVENLABS_URL: Final[str] = "https://api.elevenlabs.io"
+GOOGLE_STT_URL: Final[str] = "http://www.google.com/speech-api/v2/recognize"
+KEEP_ALIVE_INTERVAL: Final[float] = 45.0  # Below typical server idle timeouts
+WARM_UP_TIMEOUT: Final[float] = 5.0  # Per ping, a hung one is reported as failed
+POOL_KEEPALIVE_EXPIRY: Final[float] = (
+    120.0  # httpx closes idle connections after 5 s by default
+)
+POOL_MAX_CONNECTIONS: Final[int] = 4
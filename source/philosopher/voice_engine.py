@@ -1,54 +1,170 @@
+import io
 import os
-from typing import Iterator
+import queue
+import threading
+from typing import Iterable, Iterator
+import httpx
 import pygame
 from dotenv import load_dotenv
 from elevenlabs.client import ElevenLabs
-from source.philosopher.utils import STOIC_VOICE_ID
+from source.philosopher.audio_stream import PCMStreamPlayer
+from source.philosopher.resilience import ResiliencePolicy
+from source.philosopher.tts_cache import TTSCache
+from source.philosopher.utils import (
+    ELEVENLABS_URL,
+    MP3_OUTPUT_FORMAT,
+    PCM_OUTPUT_FORMAT,
+    STOIC_VOICE_ID,
+    STREAM_IDLE_TIMEOUT,
+    TTS_DEADLINE,
+    TTS_HEDGE_REQUESTS,
+    TTS_MODEL_ID,
+    TTS_TIMEOUT,
+    WARM_UP_TIMEOUT,
+)
+from source.philosopher.warmup import create_http_client
 
 load_dotenv()
 
 
 class VoiceEngine:
-    def __init__(self) -> None:
+    def __init__(self, streaming: bool = True, cache: TTSCache | None = None) -> None:
         """
         Initialize ElevenLabs client and  Pygame audio mixer.
+
+        :param streaming: Start playing while the audio is still downloading.
+        :param cache: Store of synthesized audio, a default `TTSCache` if None.
         """
         api_key: str = os.getenv("ELEVENLABS_API_KEY")
         if not api_key:
             raise ValueError(" Missing key `ELEVENLABS_API_KEY` in the file `.env`")
 
-        self.client: ElevenLabs = ElevenLabs(api_key=api_key)
+        # Pooled connections, opened ahead by `warm_up` and reused by every request
+        self.http: httpx.Client = create_http_client()
+        self.client: ElevenLabs = ElevenLabs(api_key=api_key, httpx_client=self.http)
         self.voice_id: str = STOIC_VOICE_ID
+        self.streaming: bool = streaming
+        self.output_format: str = PCM_OUTPUT_FORMAT if streaming else MP3_OUTPUT_FORMAT
+        self.stream_player: PCMStreamPlayer = PCMStreamPlayer()
+        self.cache: TTSCache = cache or TTSCache()
+        # Bounds the wait for the first audio chunk and for each next one
+        self.policy: ResiliencePolicy = ResiliencePolicy(
+            "ElevenLabs",
+            timeout=TTS_TIMEOUT,
+            deadline=TTS_DEADLINE,
+            hedge=TTS_HEDGE_REQUESTS,
+            idle_timeout=STREAM_IDLE_TIMEOUT,
+        )
+        # The mixer has one music stream, so only one utterance plays at a time;
+        # synthesis happens outside of the lock and needs no shared state.
+        self._playback_lock: threading.Lock = threading.Lock()
 
         try:
             pygame.mixer.init()
         except pygame.error as e:
             print(f"Error initializing audio: {e}")
 
+    def warm_up(self) -> None:
+        """
+        Opens a pooled connection to ElevenLabs (DNS, TCP and TLS), so the first
+        synthesis does not pay for the handshake. Also keeps it alive when idle.
+        """
+        self.http.head(ELEVENLABS_URL, timeout=WARM_UP_TIMEOUT)
+
     def speak(self, text: str) -> None:
         """
-        Converts text to audio and plays it.
+        Converts text to audio and plays it. Repeated phrases come from the cache.
 
         :param text: Text to be converted.
         """
         if not text:
             return
+        self._play(self.synthesize(text))
+
+    def speak_sentences(self, sentences: Iterable[str]) -> None:
+        """
+        Speaks sentences in order while later ones are still being produced.
+        A background thread pulls sentences and synthesizes them one after another,
+        so the next sentence downloads while the current one plays.
+
+        :param sentences: Text pieces, e.g. streamed from the model.
+        """
+        # One chunk queue per sentence, in speaking order; None ends each queue
+        pending: queue.Queue[queue.Queue | None] = queue.Queue()
+
+        def synthesize_all() -> None:
+            try:
+                for sentence in sentences:
+                    chunks: queue.Queue[bytes | None] = queue.Queue()
+                    pending.put(chunks)
+                    try:
+                        for chunk in self.synthesize(sentence):
+                            chunks.put(chunk)
+                    finally:
+                        chunks.put(None)
+            except Exception as e:
+                print(f"Error while producing sentences: {e}")
+            finally:
+                pending.put(None)
+
+        threading.Thread(target=synthesize_all, daemon=True).start()
+        while (chunks := pending.get()) is not None:
+            self._play(iter(chunks.get, None))
+
+    def synthesize(self, text: str) -> Iterator[bytes]:
+        """
+        Audio of the text in the engine's output format, from the cache or ElevenLabs.
+        Chunks are yielded as they arrive, complete downloads are cached.
+
+        :param text: Text to be converted.
+        """
+        key: str = self.cache.key(text, self.voice_id, TTS_MODEL_ID, self.output_format)
+        audio: bytes | None = self.cache.get(key)
+        if audio is not None:
+            yield audio
+            return
 
+        chunks: list[bytes] = []
         try:
-            audio_generator: Iterator[bytes] = self.client.text_to_speech.convert(
-                text=text, voice_id=self.voice_id, model_id="eleven_turbo_v2_5"
-            )
-            temp_file: str = "temp_speech.mp3"
-
-            with open(temp_file, "wb") as f:
-                for chunk in audio_generator:
-                    f.write(chunk)
-            self.play_file(temp_file)
+            for chunk in self.policy.stream(
+                self.client.text_to_speech.convert,
+                text=text,
+                voice_id=self.voice_id,
+                model_id=TTS_MODEL_ID,
+                output_format=self.output_format,
+            ):
+                chunks.append(chunk)
+                yield chunk
         except Exception as e:
             print(f"Error connected to ElevenLabs: {e}")
-        finally:
-            pygame.mixer.music.unload()
-            os.remove(temp_file)
+            return
+
+        if chunks:
+            self.cache.put(key, b"".join(chunks))
+
+    def _play(self, chunks: Iterator[bytes]) -> None:
+        """
+        Plays audio in the engine's output format.
+
+        :param chunks: Audio bytes, possibly still arriving.
+        """
+        if self.streaming:
+            with self._playback_lock:
+                try:
+                    self.stream_player.play(chunks)
+                except Exception as e:
+                    print(f"Error while playing audio: {e}")
+            return
+
+        self.play_bytes(b"".join(chunks))
+
+    def play_audio(self, audio: bytes) -> None:
+        """
+        Plays audio returned by `synthesize`, e.g. prepared ahead of time.
+
+        :param audio: Audio in the engine's output format.
+        """
+        self._play(iter([audio]))
 
     def play_file(self, file_path):
         """
@@ -56,18 +172,44 @@ class VoiceEngine:
 
         :param file_path: Audio file path.
         """
-        try:
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.stop()
+        self._play_until_finished(file_path)
+
+    def play_bytes(self, audio: bytes) -> None:
+        """
+        Plays encoded audio straight from memory.
 
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
+        :param audio: Encoded audio, e.g. a whole MP3 file.
+        """
+        self._play_until_finished(io.BytesIO(audio))
 
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
+    def play_sound(self, sound: pygame.mixer.Sound) -> threading.Event:
+        """
+        Starts a sound without waiting for it.
 
-        except Exception as e:
-            print(f"Error while playing audio: {e}")
+        :param sound: Loaded sound.
+        :return: Event set the moment the sound has finished.
+        """
+        finished: threading.Event = threading.Event()
+        if sound.play() is None:
+            finished.set()  # No free channel, nothing plays
+            return finished
+
+        timer: threading.Timer = threading.Timer(sound.get_length(), finished.set)
+        timer.daemon = True
+        timer.start()
+        return finished
+
+    def _play_until_finished(self, source: str | io.BytesIO) -> None:
+        """
+        Plays a file or file-like object and returns when it ends.
+        The length is known up front, so waiting costs no CPU.
+        """
+        with self._playback_lock:
+            try:
+                sound: pygame.mixer.Sound = pygame.mixer.Sound(source)
+                self.play_sound(sound).wait()
+            except Exception as e:
+                print(f"Error while playing audio: {e}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,199 @@
+import asyncio
+import socket
+import threading
+import time
+from typing import Awaitable, Callable
+from urllib.parse import urlsplit
+import httpx
+
+from source.philosopher.utils import (
+    KEEP_ALIVE_INTERVAL,
+    POOL_KEEPALIVE_EXPIRY,
+    POOL_MAX_CONNECTIONS,
+    WARM_UP_TIMEOUT,
+)
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=POOL_MAX_CONNECTIONS,
+        keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+    )
+
+
+def create_http_client() -> httpx.Client:
+    """
+    Pooled HTTP client keeping connections open long enough for keep-alive pings.
+    """
+    return httpx.Client(limits=_limits(), follow_redirects=True)
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """
+    Same as `create_http_client`, for async SDK clients.
+    """
+    return httpx.AsyncClient(limits=_limits(), follow_redirects=True)
+
+
+def resolve_host(url: str) -> None:
+    """
+    Resolves the host of `url`, so the first request finds it in the DNS cache.
+    For clients without a connection pool this is the only part that can be warmed.
+    """
+    parts = urlsplit(url)
+    port: int = parts.port or (443 if parts.scheme == "https" else 80)
+    socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+
+
+class ConnectionWarmer:
+    def __init__(
+        self, interval: float = KEEP_ALIVE_INTERVAL, timeout: float = WARM_UP_TIMEOUT
+    ) -> None:
+        """
+        Opens connections to external services before the first real request
+        (DNS, TCP and TLS, or a gRPC channel) and pings them while idle, so the
+        first intervention is not the slowest one.
+
+        :param interval: Seconds between keep-alive pings.
+        :param timeout: Seconds to wait for each ping. A blocking ping cannot be
+            stopped, it is reported as failed and left to finish in its thread.
+        """
+        self.interval: float = interval
+        self.timeout: float = timeout
+        self.latencies: dict[str, float | None] = {}  # Last ping, None if it failed
+        self.pings: int = 0
+
+        self._pings: dict[str, Callable[[], object]] = {}
+        self._async_pings: dict[str, Callable[[], Awaitable]] = {}
+        self._startup_only: set[str] = set()
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(
+        self, name: str, ping: Callable[[], object], keep_alive: bool = True
+    ) -> None:
+        """
+        :param name: Service name used in logs.
+        :param ping: Cheap blocking request that opens or reuses a connection.
+        :param keep_alive: Repeat the ping while idle. False for pings that keep
+            nothing open, e.g. a DNS lookup, which then only run at startup.
+        """
+        self._pings[name] = ping
+        if not keep_alive:
+            self._startup_only.add(name)
+
+    def add_async(
+        self, name: str, ping: Callable[[], Awaitable], keep_alive: bool = True
+    ) -> None:
+        """
+        Same as `add` for a coroutine function, used by `warm_up_async` only.
+        """
+        self._async_pings[name] = ping
+        if not keep_alive:
+            self._startup_only.add(name)
+
+    def warm_up(self, keep_alive: bool = False) -> dict[str, float | None]:
+        """
+        Runs the blocking pings concurrently and waits up to `timeout` for them.
+
+        :param keep_alive: Idle round, skips the pings that only run at startup.
+        :return: Seconds each ping took, None if it failed.
+        """
+        threads: dict[str, threading.Thread] = {
+            name: threading.Thread(target=self._ping, args=(name, ping), daemon=True)
+            for name, ping in self._selected(self._pings, keep_alive).items()
+        }
+        for thread in threads.values():
+            thread.start()
+        deadline: float = time.monotonic() + self.timeout
+        for name, thread in threads.items():
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                self._failed(name, f"no answer in {self.timeout:g} s")
+        self.pings += 1
+        return dict(self.latencies)
+
+    async def warm_up_async(self, keep_alive: bool = False) -> dict[str, float | None]:
+        """
+        Runs the pings concurrently on the running loop, blocking ones in threads.
+        """
+
+        async def ping_async(name: str, ping: Callable[[], Awaitable]) -> None:
+            started: float = time.perf_counter()
+            try:
+                await asyncio.wait_for(ping(), self.timeout)
+                self.latencies[name] = time.perf_counter() - started
+            except asyncio.TimeoutError:
+                self._failed(name, f"no answer in {self.timeout:g} s")
+            except Exception as e:
+                self._failed(name, e)
+
+        await asyncio.gather(
+            *(
+                ping_async(name, ping)
+                for name, ping in self._selected(self._async_pings, keep_alive).items()
+            ),
+            *(
+                ping_async(name, lambda ping=ping: asyncio.to_thread(ping))
+                for name, ping in self._selected(self._pings, keep_alive).items()
+            ),
+        )
+        self.pings += 1
+        return dict(self.latencies)
+
+    def start(self, keep_alive: bool = True) -> None:
+        """
+        Warms up in a background thread, then pings every `interval` until `stop`.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._worker_loop, args=(keep_alive,), daemon=True
+        )
+        self._thread.start()
+
+    async def keep_alive_async(self) -> None:
+        """
+        Async version of `start`, runs until cancelled.
+        """
+        self._report(await self.warm_up_async())
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.warm_up_async(keep_alive=True)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _worker_loop(self, keep_alive: bool) -> None:
+        self._report(self.warm_up())
+        while keep_alive and not self._stop.wait(self.interval):
+            self.warm_up(keep_alive=True)
+
+    @staticmethod
+    def _report(latencies: dict[str, float | None]) -> None:
+        print(
+            "[Warm-up] "
+            + ", ".join(
+                f"{name}: {'failed' if s is None else f'{s * 1000:.0f} ms'}"
+                for name, s in latencies.items()
+            )
+        )
+
+    def _selected(self, pings: dict, keep_alive: bool) -> dict:
+        if not keep_alive:
+            return pings
+        return {n: p for n, p in pings.items() if n not in self._startup_only}
+
+    def _failed(self, name: str, reason: object) -> None:
+        self.latencies[name] = None
+        print(f"[Warm-up] {name} unreachable: {reason}")
+
+    def _ping(self, name: str, ping: Callable[[], object]) -> None:
+        started: float = time.perf_counter()
+        try:
+            ping()
+            self.latencies[name] = time.perf_counter() - started
+        except Exception as e:
+            self._failed(name, e)
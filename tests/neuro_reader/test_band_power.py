@@ -0,0 +1,63 @@
+import mne
+import numpy as np
+import pytest
+
+from source.neuro_reader.band_power import BandPowerEngine, BandPowers
+
+SFREQ = 250
+N_SAMPLES = 1000
+
+
+def _mne_reference(window: np.ndarray) -> tuple[float, float, float]:
+    """Former `EEGService` computation, kept here as the ground truth."""
+    filtered = mne.filter.filter_data(window, SFREQ, 4, 40, copy=True, verbose=False)
+    psds, freqs = mne.time_frequency.psd_array_welch(
+        filtered, SFREQ, fmin=4, fmax=40, n_fft=256, verbose=False
+    )
+    avg_psd = np.mean(psds, axis=0)
+    power_alpha = np.sum(avg_psd[(freqs >= 8) & (freqs <= 13)])
+    power_beta = np.sum(avg_psd[(freqs >= 13) & (freqs <= 30)])
+    power_total = np.sum(avg_psd[(freqs >= 4) & (freqs <= 40)])
+    return power_beta / power_alpha, power_alpha / power_total, power_beta / power_total
+
+
+def _synthetic_window(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    t = np.arange(N_SAMPLES) / SFREQ
+    alpha = rng.uniform(5, 30) * np.sin(2 * np.pi * 10 * t)
+    beta = rng.uniform(5, 30) * np.sin(2 * np.pi * 21 * t)
+    drift = 40 + 15 * t  # DC offset and slow drift, removed by the band-pass
+    return rng.standard_normal((8, N_SAMPLES)) * 4 + alpha + beta + drift
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_mne_pipeline(seed):
+    """Check the engine reproduces the MNE filter + Welch results."""
+    window = _synthetic_window(seed)
+    engine = BandPowerEngine(sfreq=SFREQ, n_samples=N_SAMPLES)
+
+    powers = engine.compute(window)
+
+    expected = _mne_reference(window)
+    np.testing.assert_allclose(
+        (powers.stress_index, powers.alpha_rel, powers.beta_rel), expected, rtol=1e-6
+    )
+
+
+def test_compute_does_not_modify_input():
+    """Check windows handed over as views stay untouched."""
+    window = _synthetic_window(3)
+    original = window.copy()
+
+    BandPowerEngine(sfreq=SFREQ, n_samples=N_SAMPLES).compute(window)
+
+    np.testing.assert_array_equal(window, original)
+
+
+def test_band_powers_edge_cases():
+    """Check ratio and mood fallbacks."""
+    assert BandPowers(alpha=0.0, beta=1.0, total=1.0).stress_index == 0.0
+    assert BandPowers(alpha=1.0, beta=2.0, total=0.0).beta_rel == pytest.approx(2e9)
+    assert BandPowers(alpha=1.0, beta=2.0, total=3.0).mood == "HIGH STRESS"
+    assert BandPowers(alpha=1.0, beta=1.2, total=3.0).mood == "FOCUS"
+    assert BandPowers(alpha=1.0, beta=0.5, total=3.0).mood == "RELAX"
@@ -0,0 +1,98 @@
+import time
+
+import numpy as np
+import pytest
+
+from source.neuro_reader.dsp_process import DSPProcess, SharedSamples
+from source.neuro_reader.pipeline import EEGPipeline
+
+SFREQ = 250
+
+
+def _signal(n_samples: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    t = np.arange(n_samples) / SFREQ
+    return (
+        rng.standard_normal((4, n_samples)) * 4
+        + 20 * np.sin(2 * np.pi * 10 * t)
+        + 12 * np.sin(2 * np.pi * 22 * t)
+    )
+
+
+def test_shared_samples_round_trip_and_overrun():
+    """Check reads continue where they stopped and skip overwritten samples."""
+    samples = SharedSamples(n_channels=2, capacity=100)
+    try:
+        data = np.vstack([np.arange(300.0), -np.arange(300.0)])
+        samples.write(data[:, :30])
+        first, position = samples.read(0)
+        samples.write(data[:, 30:40])
+        second, position = samples.read(position)
+        for start in range(40, 300, samples.max_chunk):
+            samples.write(data[:, start : start + samples.max_chunk])
+        late, position = samples.read(position)
+        with pytest.raises(ValueError):
+            samples.write(data[:, :51])  # Would reach into the trusted half
+
+        np.testing.assert_array_equal(first, data[:, :30])
+        np.testing.assert_array_equal(second, data[:, 30:40])
+        np.testing.assert_array_equal(late, data[:, 250:300])  # Newest half only
+        assert position == 300
+    finally:
+        samples.close()
+        samples.shm.unlink()
+
+
+def test_process_results_match_in_process_pipeline():
+    """Check offloaded DSP returns the same band powers as the local pipeline."""
+    data = _signal(SFREQ * 6)
+    local = EEGPipeline(sfreq=SFREQ, n_channels=4)
+    # Everything is pushed before the worker is up, so it must all stay readable
+    remote = DSPProcess(sfreq=SFREQ, n_channels=4, buffer_duration=20.0)
+    remote.start()
+    try:
+        for start in range(0, data.shape[1], 25):
+            local.push(data[:, start : start + 25])
+            remote.push(data[:, start : start + 25])
+        expected = local.step()
+
+        result = None
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            result = remote.step() or result
+            if result and remote.samples.total == data.shape[1]:
+                time.sleep(0.3)  # Let the last batch through
+                result = remote.step() or result
+                break
+            time.sleep(0.05)
+    finally:
+        remote.close()
+
+    assert result is not None
+    assert result.stress_index == pytest.approx(expected.stress_index, rel=1e-6)
+    assert result.alpha_rel == pytest.approx(expected.alpha_rel, rel=1e-6)
+
+
+def test_dead_worker_is_restarted_without_touching_samples():
+    """Check a crashed worker is replaced while pushes keep going."""
+    remote = DSPProcess(sfreq=SFREQ, n_channels=4)
+    with pytest.raises(RuntimeError):
+        remote.push(_signal(25))  # Not started
+    remote.start()
+    try:
+        samples = remote.samples
+        remote.process.kill()
+        remote.process.join()
+
+        result = None
+        deadline = time.time() + 30
+        while result is None and time.time() < deadline:
+            remote.push(_signal(25))
+            result = remote.step()
+            time.sleep(0.02)
+
+        assert result is not None
+        assert remote.samples is samples
+        assert remote.process.is_alive()
+    finally:
+        remote.close()
@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+from source.neuro_reader.eeg_hub import EEGHub, benchmark
+from source.neuro_reader.snapshot import SnapshotPublisher
+
+
+class FakeService(SnapshotPublisher):
+    def __init__(self, device_name, **kwargs):
+        super().__init__()
+        self.device_name = device_name
+        self.kwargs = kwargs
+        self.running = False
+        self.stopped = False
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        self.running = False
+        self.stopped = True
+
+
+@patch("source.neuro_reader.eeg_hub.bacore")
+@patch("source.neuro_reader.eeg_hub.EEGService", FakeService)
+def test_hub_manages_devices_and_shares_core(mock_bacore):
+    """Check every device gets a service and the library is closed once."""
+    hub = EEGHub(["BA MINI 001", "BA MINI 002"])
+    hub.start()
+    late = hub.add_device("BA MINI 003")
+
+    assert hub.device_names == ["BA MINI 001", "BA MINI 002", "BA MINI 003"]
+    assert late.running
+    assert all(not s.kwargs["close_core"] for s in hub.services.values())
+
+    services = list(hub.services.values())
+    hub.stop()
+
+    assert all(service.stopped for service in services)
+    mock_bacore.close.assert_called_once()
+
+
+@patch("source.neuro_reader.eeg_hub.EEGService", FakeService)
+def test_results_are_routed_per_device():
+    """Check per-device and combined result streams."""
+    hub = EEGHub(["A", "B"])
+    only_b = []
+    combined = []
+    hub.subscribe("B", only_b.append)
+    unsubscribe_all = hub.subscribe_all(lambda name, s: combined.append((name, s)))
+
+    snapshot_a = hub.services["A"]._publish(stress_index=1.0)
+    snapshot_b = hub.services["B"]._publish(stress_index=2.0)
+    unsubscribe_all()
+    hub.services["A"]._publish(stress_index=3.0)
+
+    assert only_b == [snapshot_b]
+    assert combined == [("A", snapshot_a), ("B", snapshot_b)]
+    assert hub.get_all_data() == {"A": hub.get_data("A"), "B": snapshot_b}
+
+
+def test_benchmark_reports_throughput():
+    """Check the benchmark runs the real pipeline for every device count."""
+    results = benchmark(device_counts=(1, 2), duration=0.2)
+
+    assert set(results) == {1, 2}
+    assert all(rate > 0 for rate in results.values())
@@ -0,0 +1,79 @@
+import mne
+import numpy as np
+import pytest
+
+from source.neuro_reader.replay_service import (
+    AS_FAST_AS_POSSIBLE,
+    ReplayEEGService,
+    load_recording,
+)
+
+SFREQ = 250
+
+
+@pytest.fixture
+def recording(tmp_path):
+    rng = np.random.default_rng(0)
+    t = np.arange(SFREQ * 8) / SFREQ
+    data = np.stack(
+        [np.sin(2 * np.pi * 10 * t) + 0.5 * rng.standard_normal(t.size) for _ in "ab"]
+    )
+    path = tmp_path / "session.npz"
+    np.savez(path, data=data, sfreq=SFREQ)
+    return path, data
+
+
+def replay(path, **kwargs):
+    service = ReplayEEGService(path, speed=AS_FAST_AS_POSSIBLE, **kwargs)
+    snapshots = []
+    service.subscribe(snapshots.append)
+    service.run()
+    return service, [s for s in snapshots if s.is_ready]
+
+
+def test_replay_is_deterministic(recording):
+    """Check two fast replays publish identical results."""
+    path, data = recording
+    service, first = replay(path)
+    _, second = replay(path)
+
+    # 4 s window, one result per hop over roughly the remaining 4 s
+    assert service.windows_computed == len(first) > 4 * SFREQ // 12
+    assert [s.stress_index for s in first] == [s.stress_index for s in second]
+    assert all(s.mood == "RELAX" for s in first)  # Dominant 10 Hz alpha
+    assert not service.get_data().connected
+    assert service.throughput > 0
+
+
+def test_replay_paces_to_speed(recording):
+    """Check the replay does not run ahead of the requested speed."""
+    path, _ = recording
+    service = ReplayEEGService(path, speed=20.0)
+    service.start()
+
+    assert service.finished.wait(timeout=5.0)
+    assert service.elapsed >= 8 / 20.0 * 0.9
+
+
+def test_stop_interrupts_replay(recording):
+    """Check a slow replay can be stopped early."""
+    path, _ = recording
+    service = ReplayEEGService(path, speed=1.0)
+    service.start()
+    service.stop()
+
+    assert service.finished.is_set()
+    assert service.windows_computed == 0
+
+
+def test_load_fif(tmp_path, recording):
+    """Check FIF recordings are read with EEG channels only."""
+    _, data = recording
+    info = mne.create_info(["C3", "C4", "STI"], SFREQ, ["eeg", "eeg", "stim"])
+    raw = mne.io.RawArray(np.vstack([data, np.zeros(data.shape[1])]), info)
+    raw.save(tmp_path / "session_raw.fif", verbose=False)
+
+    samples, sfreq = load_recording(tmp_path / "session_raw.fif")
+
+    assert sfreq == SFREQ
+    np.testing.assert_allclose(samples, data, rtol=1e-6)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from source.neuro_reader.ring_buffer import RingBuffer
+
+
+def _ramp(start: int, stop: int, n_channels: int = 2) -> np.ndarray:
+    samples = np.arange(start, stop, dtype=float)
+    return np.vstack([samples + 1000 * ch for ch in range(n_channels)])
+
+
+def test_latest_returns_samples_in_order_after_wrap():
+    """Check the window stays ordered when writes wrap around."""
+    buffer = RingBuffer(n_channels=2, capacity=10)
+    for start in range(0, 33, 3):
+        buffer.extend(_ramp(start, start + 3))
+
+    assert buffer.is_full
+    assert buffer.total == 33
+    np.testing.assert_array_equal(buffer.latest(), _ramp(23, 33))
+    np.testing.assert_array_equal(buffer.latest(4), _ramp(29, 33))
+
+
+def test_latest_is_a_read_only_view():
+    """Check windows are not copied out of the buffer."""
+    buffer = RingBuffer(n_channels=2, capacity=8)
+    buffer.extend(_ramp(0, 13))
+
+    window = buffer.latest()
+
+    assert np.shares_memory(window, buffer._buffer)
+    assert not window.flags.writeable
+
+
+def test_chunk_longer_than_capacity_keeps_tail():
+    """Check oversized chunks only keep the newest samples."""
+    buffer = RingBuffer(n_channels=2, capacity=5)
+    buffer.extend(_ramp(0, 12))
+
+    assert buffer.total == 12
+    np.testing.assert_array_equal(buffer.latest(), _ramp(7, 12))
+
+
+def test_view_by_absolute_index():
+    """Check absolute indexing and rejection of evicted samples."""
+    buffer = RingBuffer(n_channels=2, capacity=6)
+    buffer.extend(_ramp(0, 20))
+
+    np.testing.assert_array_equal(buffer.view(15, 18), _ramp(15, 18))
+    with pytest.raises(IndexError):
+        buffer.view(10, 14)
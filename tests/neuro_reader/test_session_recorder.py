@@ -0,0 +1,95 @@
+import time
+import numpy as np
+
+from source.neuro_reader.replay_service import load_recording
+from source.neuro_reader.session_recorder import (
+    SAMPLES_FILE,
+    SessionReader,
+    SessionRecorder,
+)
+from source.neuro_reader.snapshot import EEGSnapshot
+
+SFREQ = 250
+
+
+def record(path, data, chunk_size=25):
+    recorder = SessionRecorder(path, SFREQ, ["C3", "C4"], index_interval=1.0)
+    recorder.start()
+    for start in range(0, data.shape[1], chunk_size):
+        recorder.write_samples(data[:, start : start + chunk_size])
+        if start % SFREQ == 0:
+            recorder.write_result(
+                EEGSnapshot().replace(stress_index=start / SFREQ, mood="FOCUS")
+            )
+    recorder.close()
+    return recorder
+
+
+def test_round_trip_is_memory_mapped(tmp_path):
+    """Check samples, results and index blocks are read back from disk."""
+    data = np.random.default_rng(0).standard_normal((2, SFREQ * 3))
+    recorder = record(tmp_path / "session", data)
+    session = SessionReader(tmp_path / "session")
+
+    assert isinstance(session.samples.base, np.memmap)
+    np.testing.assert_array_equal(session.samples, data.astype(np.float32))
+    assert session.duration == 3.0
+    assert session.meta["samples_written"] == recorder.samples_written == SFREQ * 3
+
+    assert list(session.results["stress_index"]) == [0.0, 1.0, 2.0]
+    assert list(session.results["sample_index"]) == [25, SFREQ + 25, 2 * SFREQ + 25]
+    assert session.results["mood"][0] == b"FOCUS"
+    assert len(session.results_between(0.5, 3.0)) == 2
+    assert session.window(1.0, 2.0).shape == (2, SFREQ)
+
+    assert list(session.index["sample_index"]) == [0, SFREQ, 2 * SFREQ]
+    assert session.sample_at(session.index["timestamp"][1]) == SFREQ
+
+
+def test_full_queue_drops_without_blocking(tmp_path):
+    """Check writes never wait for the disk."""
+    recorder = SessionRecorder(tmp_path, SFREQ, ["C3"], queue_size=1)
+    # Writer not started, so nothing drains the queue
+    recorder.write_samples(np.zeros((1, 10)))
+    recorder.write_samples(np.zeros((1, 10)))
+    recorder.write_result(EEGSnapshot())
+
+    assert recorder.dropped_samples == 10
+    assert recorder.dropped_results == 1
+
+
+def test_partial_tail_is_ignored(tmp_path):
+    """Check a record cut off by a crash is not exposed."""
+    record(tmp_path, np.ones((2, SFREQ)))
+    with open(tmp_path / SAMPLES_FILE, "ab") as samples_file:
+        samples_file.write(b"\x00" * 6)
+
+    assert SessionReader(tmp_path).samples.shape == (2, SFREQ)
+
+
+def test_session_can_be_replayed(tmp_path):
+    """Check recorded sessions are accepted by the replay service."""
+    data = np.ones((2, SFREQ))
+    record(tmp_path, data)
+
+    samples, sfreq = load_recording(tmp_path)
+
+    assert sfreq == SFREQ
+    np.testing.assert_array_equal(samples, data)
+
+
+def test_close_returns_when_writer_failed(tmp_path):
+    """Check a dead writer with a full queue does not hang the EEG worker."""
+    (tmp_path / SAMPLES_FILE).mkdir()  # Opening it for writing fails
+    recorder = SessionRecorder(tmp_path, SFREQ, ["C3", "C4"], queue_size=4)
+    recorder.start()
+    recorder.thread.join(timeout=1.0)
+    for _ in range(10):
+        recorder.write_samples(np.zeros((2, 25)))
+
+    started = time.perf_counter()
+    recorder.close(timeout=0.2)
+
+    assert time.perf_counter() - started < 0.5
+    assert isinstance(recorder.error, IsADirectoryError)
+    assert recorder.dropped_samples == 6 * 25
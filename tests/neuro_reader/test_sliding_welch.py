@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from scipy.signal import welch
+
+from source.neuro_reader.band_power import BandPowerEngine
+from source.neuro_reader.ring_buffer import RingBuffer
+from source.neuro_reader.sliding_welch import SlidingWelch
+
+SFREQ = 250
+N_SAMPLES = 1000
+HOP = 12
+
+
+def _signal(n_samples: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_samples) / SFREQ
+    return (
+        rng.standard_normal((8, n_samples)) * 4
+        + 20 * np.sin(2 * np.pi * 10 * t)
+        + 12 * np.sin(2 * np.pi * 22 * t)
+    )
+
+
+def _feed(welch_estimator: SlidingWelch, buffer: RingBuffer, data: np.ndarray):
+    for start in range(0, data.shape[1], 7):  # Chunks not aligned with the hop
+        buffer.extend(data[:, start : start + 7])
+        welch_estimator.update(buffer)
+
+
+def test_incremental_matches_full_recompute():
+    """Check the incremental PSD equals a from-scratch Welch of the same segments."""
+    engine = BandPowerEngine(sfreq=SFREQ, n_samples=N_SAMPLES)
+    buffer = RingBuffer(n_channels=8, capacity=N_SAMPLES)
+    estimator = SlidingWelch(engine, hop=HOP)
+    data = _signal(N_SAMPLES + 50 * HOP)
+
+    _feed(estimator, buffer, data)
+
+    assert estimator.is_ready
+    last_start = (data.shape[1] - engine.n_fft) // HOP * HOP
+    first_start = last_start - (estimator.n_slots - 1) * HOP
+    window = data[:, first_start : last_start + engine.n_fft]
+    _, expected = welch(
+        window,
+        fs=SFREQ,
+        window="hamming",
+        nperseg=engine.n_fft,
+        noverlap=engine.n_fft - HOP,
+        detrend="constant",
+    )
+    np.testing.assert_allclose(estimator.psd(), expected.mean(axis=0), rtol=1e-9)
+
+
+def test_only_new_segments_are_computed():
+    """Check updates cost one segment per hop once the window is full."""
+    engine = BandPowerEngine(sfreq=SFREQ, n_samples=N_SAMPLES)
+    buffer = RingBuffer(n_channels=8, capacity=N_SAMPLES)
+    estimator = SlidingWelch(engine, hop=HOP)
+    data = _signal(N_SAMPLES + 3 * HOP)
+
+    buffer.extend(data[:, :N_SAMPLES])
+    assert estimator.update(buffer) == estimator.n_slots
+    buffer.extend(data[:, N_SAMPLES:])
+    assert estimator.update(buffer) == 3
+    assert estimator.update(buffer) == 0
+
+
+def test_filter_gain_tracks_filtered_engine():
+    """Check weighting by the band-pass gain stays close to time-domain filtering."""
+    engine = BandPowerEngine(sfreq=SFREQ, n_samples=N_SAMPLES)
+    buffer = RingBuffer(n_channels=8, capacity=N_SAMPLES)
+    estimator = SlidingWelch(engine, hop=engine.n_fft, gain=engine.filter_gain)
+    data = _signal(N_SAMPLES, seed=4)
+
+    _feed(estimator, buffer, data)
+
+    incremental = engine.band_powers(estimator.psd())
+    reference = engine.compute(data)
+    assert incremental.stress_index == pytest.approx(reference.stress_index, rel=0.05)
+    assert incremental.alpha_rel == pytest.approx(reference.alpha_rel, rel=0.05)
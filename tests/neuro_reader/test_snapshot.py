@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+from source.neuro_reader.snapshot import EEGSnapshot, SnapshotPublisher
+from source.neuro_reader.utils import StatusEnum
+
+
+def test_snapshot_is_immutable():
+    """Check fields cannot be changed or added."""
+    snapshot = EEGSnapshot(stress_index=1.0)
+
+    with pytest.raises(AttributeError):
+        snapshot.stress_index = 2.0
+    with pytest.raises(AttributeError):
+        snapshot.extra = 1
+
+
+def test_snapshot_reads_like_eeg_data_dict():
+    """Check dict-style access used by older callers."""
+    snapshot = EEGSnapshot(stress_index=1.5, mood="FOCUS")
+
+    assert snapshot["stress_index"] == 1.5
+    assert snapshot.get("mood") == "FOCUS"
+    assert snapshot.get("missing", 0.0) == 0.0
+    assert snapshot.to_dict()["status"] == StatusEnum.DISCONNECTED.value
+    with pytest.raises(KeyError):
+        snapshot["missing"]
+
+
+def test_publish_swaps_whole_snapshots():
+    """Check readers only ever see consistent snapshots with growing seq."""
+    publisher = SnapshotPublisher()
+    stop = threading.Event()
+
+    def writer():
+        value = 0
+        while not stop.is_set():
+            value += 1
+            publisher._publish(stress_index=float(value), alpha_rel=float(value))
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        last_seq = publisher.seq
+        for _ in range(20000):
+            snapshot = publisher.get_data()
+            assert snapshot.stress_index == snapshot.alpha_rel
+            assert snapshot.seq >= last_seq
+            last_seq = snapshot.seq
+    finally:
+        stop.set()
+        thread.join()
+
+    assert publisher.get_data() is publisher.get_data()
+
+
+def test_subscribers_are_notified_until_unsubscribed():
+    """Check push delivery and that a failing listener does not block others."""
+    publisher = SnapshotPublisher()
+    received = []
+
+    def broken_listener(snapshot):
+        raise RuntimeError("GUI is gone")
+
+    publisher.subscribe(broken_listener)
+    unsubscribe = publisher.subscribe(received.append)
+
+    first = publisher._publish(stress_index=1.0)
+    unsubscribe()
+    publisher._publish(stress_index=2.0)
+
+    assert received == [first]
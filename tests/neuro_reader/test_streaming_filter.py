@@ -0,0 +1,44 @@
+import numpy as np
+from scipy.signal import sosfilt
+
+from source.neuro_reader.streaming_filter import StreamingBandpass
+
+SFREQ = 250
+
+
+def test_chunked_output_equals_single_pass():
+    """Check filter state carries over chunk borders."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((4, 2000)) + 30
+    whole = StreamingBandpass(sfreq=SFREQ, n_channels=4).process(data)
+
+    streaming = StreamingBandpass(sfreq=SFREQ, n_channels=4)
+    borders = [0, 1, 17, 250, 251, 900, 2000]
+    chunked = np.hstack(
+        [streaming.process(data[:, a:b]) for a, b in zip(borders, borders[1:])]
+    )
+
+    np.testing.assert_allclose(chunked, whole, atol=1e-10)
+
+
+def test_dc_offset_does_not_ring():
+    """Check the initial state absorbs the electrode offset."""
+    data = np.full((2, 500), 1500.0)
+    filtered = StreamingBandpass(sfreq=SFREQ, n_channels=2).process(data)
+
+    assert np.max(np.abs(filtered)) < 1e-6
+
+
+def test_reset_starts_a_new_stream():
+    """Check reset drops the previous state."""
+    rng = np.random.default_rng(1)
+    first, second = rng.standard_normal((2, 3, 300))
+    bandpass = StreamingBandpass(sfreq=SFREQ, n_channels=3)
+    bandpass.process(first)
+
+    bandpass.reset()
+    restarted = bandpass.process(second)
+
+    fresh = StreamingBandpass(sfreq=SFREQ, n_channels=3).process(second)
+    np.testing.assert_allclose(restarted, fresh)
+    assert not np.allclose(restarted, sosfilt(bandpass.sos, second, axis=-1))
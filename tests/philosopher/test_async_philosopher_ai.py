@@ -0,0 +1,142 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+from source.philosopher.async_philosopher_ai import AsyncPhilosopherAI
+from source.philosopher.async_voice_engine import AsyncVoiceEngine
+from source.philosopher.scheduler import Priority
+
+
+class FakeAsyncBrain:
+    def __init__(self, backend=None, cache=None):
+        pass
+
+    async def stream_stoic_advice_async(self, user_context):
+        await asyncio.sleep(0.1)  # Network round trip
+        yield f"Calm about {user_context}."
+
+
+class FakeAsyncVoice:
+    def __init__(self):
+        self.spoken = []
+        self.speaking = 0
+        self.overlaps = 0
+
+    async def speak_sentences_async(self, sentences):
+        self.speaking += 1
+        self.overlaps += self.speaking > 1
+        try:
+            async for sentence in sentences:
+                await asyncio.sleep(0.05)
+                self.spoken.append(sentence)
+        finally:
+            self.speaking -= 1
+
+
+@patch("source.philosopher.async_philosopher_ai.AsyncVoiceEngine", FakeAsyncVoice)
+@patch("source.philosopher.async_philosopher_ai.create_brain", FakeAsyncBrain)
+def test_requests_run_one_at_a_time_without_threads():
+    """Check queued requests never overlap and cost no threads."""
+    philosopher = AsyncPhilosopherAI()
+    replies = []
+
+    async def run():
+        threads_before = threading.active_count()
+        futures = [
+            philosopher.trigger_intervention(str(i), replies.append, force=True)
+            for i in range(4)
+        ]
+        assert philosopher.is_speaking
+        assert threading.active_count() == threads_before
+        await asyncio.gather(*futures)
+        return futures
+
+    futures = asyncio.run(run())
+
+    assert all(future.done() and not future.cancelled() for future in futures)
+    assert replies == [f"Calm about {i}." for i in range(4)]
+    assert philosopher.voice.overlaps == 0
+    assert not philosopher.is_speaking
+
+
+@patch("source.philosopher.async_philosopher_ai.AsyncVoiceEngine", FakeAsyncVoice)
+@patch("source.philosopher.async_philosopher_ai.create_brain", FakeAsyncBrain)
+def test_user_reply_runs_before_waiting_intervention():
+    """Check a user reply overtakes an EEG intervention waiting in the queue."""
+    philosopher = AsyncPhilosopherAI()
+    replies = []
+
+    async def run():
+        first = philosopher.trigger_intervention("first", replies.append, force=True)
+        await asyncio.sleep(0)  # First one starts running
+        eeg = philosopher.scheduler.submit(
+            Priority.EEG_INTERVENTION, philosopher._intervention, "eeg", replies.append
+        )
+        reply = philosopher.trigger_intervention("reply", replies.append, force=True)
+        await asyncio.gather(first, eeg, reply)
+
+    asyncio.run(run())
+
+    assert replies == ["Calm about first.", "Calm about reply.", "Calm about eeg."]
+
+
+@patch("source.philosopher.async_philosopher_ai.AsyncVoiceEngine", FakeAsyncVoice)
+@patch("source.philosopher.async_philosopher_ai.create_brain", FakeAsyncBrain)
+def test_shutdown_cancels_requests():
+    """Check cancellation stops requests before they speak."""
+    philosopher = AsyncPhilosopherAI()
+
+    async def run():
+        running = philosopher.trigger_intervention("deadline", force=True)
+        waiting = philosopher.trigger_intervention("exam", force=True)
+        assert philosopher.trigger_intervention("eeg") is None  # Busy
+        await asyncio.sleep(0.01)
+        philosopher.shutdown()
+        await asyncio.gather(running, waiting, return_exceptions=True)
+        assert philosopher.trigger_intervention("late", force=True) is None
+        return running, waiting
+
+    running, waiting = asyncio.run(run())
+
+    assert running.cancelled()
+    assert waiting.cancelled()
+    assert philosopher.voice.spoken == []
+    assert not philosopher.is_speaking
+
+
+@patch("source.philosopher.voice_engine.ElevenLabs")
+@patch("source.philosopher.async_voice_engine.AsyncElevenLabs")
+@patch("source.philosopher.voice_engine.pygame")
+@patch("os.getenv")
+def test_async_sentences_are_spoken_in_order(
+    mock_getenv, mock_pygame, mock_async_elevenlabs, mock_elevenlabs
+):
+    """Check the async voice speaks the first sentence before the rest exists."""
+    mock_getenv.return_value = "KEY"
+    engine = AsyncVoiceEngine()
+    events = []
+
+    async def fake_model():
+        for sentence in ["One.", "Two."]:
+            await asyncio.sleep(0.05)
+            events.append(("generated", sentence))
+            yield sentence
+
+    async def fake_tts(text):
+        yield text.encode()
+
+    async def fake_play(chunks):
+        events.append(("played", b"".join([c async for c in chunks]).decode()))
+
+    with (
+        patch.object(engine, "synthesize_async", side_effect=fake_tts),
+        patch.object(engine, "_play_async", side_effect=fake_play),
+    ):
+        asyncio.run(engine.speak_sentences_async(fake_model()))
+
+    assert events == [
+        ("generated", "One."),
+        ("played", "One."),
+        ("generated", "Two."),
+        ("played", "Two."),
+    ]
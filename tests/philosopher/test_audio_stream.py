@@ -0,0 +1,104 @@
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+from source.philosopher.audio_stream import PCMStreamPlayer
+
+RATE = 22050
+
+
+class FakeSound:
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.duration = len(buffer) / 2 / RATE
+
+
+class FakeChannel:
+    """Mixer channel that 'plays' sounds in real time."""
+
+    def __init__(self):
+        self.played = []
+        self.received = []
+        self.current_end = 0.0
+        self.queued = None
+        self.first_play = None
+
+    def _advance(self):
+        now = time.perf_counter()
+        if self.queued is not None and now >= self.current_end:
+            self._start(self.queued, max(self.current_end, now))
+            self.queued = None
+
+    def _start(self, sound, at):
+        self.played.append(sound)
+        self.current_end = at + sound.duration
+
+    def get_busy(self):
+        self._advance()
+        return time.perf_counter() < self.current_end
+
+    def get_queue(self):
+        self._advance()
+        return self.queued
+
+    def play(self, sound):
+        self.first_play = self.first_play or time.perf_counter()
+        self.received.append(sound)
+        self._start(sound, time.perf_counter())
+
+    def queue(self, sound):
+        self.received.append(sound)
+        self.queued = sound
+
+
+def fake_elevenlabs(duration=1.0, chunk_duration=0.05, delay=0.02):
+    """PCM chunks arriving faster than real time, like a download."""
+    samples = (np.sin(np.arange(int(RATE * duration)) / 10) * 1000).astype("<i2")
+    data = samples.tobytes()
+    step = 2 * int(RATE * chunk_duration) + 1  # Odd, splits samples across chunks
+    for start in range(0, len(data), step):
+        time.sleep(delay)
+        yield data[start : start + step]
+
+
+@patch("source.philosopher.audio_stream.pygame")
+def test_playback_starts_before_download_ends(mock_pygame):
+    """Check the first audio plays after the jitter buffer, not the whole file."""
+    channel = FakeChannel()
+    mock_pygame.mixer.find_channel.return_value = channel
+    mock_pygame.mixer.get_init.return_value = (RATE, -16, 1)
+    mock_pygame.mixer.Sound.side_effect = lambda buffer: FakeSound(buffer)
+
+    downloaded = []
+
+    def tracked():
+        for chunk in fake_elevenlabs():
+            downloaded.append(time.perf_counter())
+            yield chunk
+
+    player = PCMStreamPlayer(jitter_buffer=0.2, block_duration=0.1)
+    player.play(tracked())
+    finished = time.perf_counter()
+
+    assert channel.first_play < downloaded[-1]
+    assert player.first_audio_latency < 0.5 * (downloaded[-1] - downloaded[0])
+    assert sum(len(s.buffer) for s in channel.received) == 2 * RATE
+    assert finished - channel.first_play >= 0.95  # Returns once 1 s was heard
+
+
+@patch("source.philosopher.audio_stream.pygame")
+def test_blocks_are_converted_to_mixer_format(mock_pygame):
+    """Check PCM is resampled and duplicated for a 44.1 kHz stereo mixer."""
+    mock_pygame.mixer.get_init.return_value = (2 * RATE, -16, 2)
+    mock_pygame.mixer.Sound.side_effect = lambda buffer: buffer
+
+    block = np.array([0, 100, 200, 300], dtype="<i2").tobytes()
+    frames = np.frombuffer(PCMStreamPlayer()._make_sound(block), dtype="<i2")
+
+    assert frames.reshape(-1, 2).tolist()[:4] == [
+        [0, 0],
+        [50, 50],
+        [100, 100],
+        [150, 150],
+    ]
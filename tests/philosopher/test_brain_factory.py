@@ -0,0 +1,78 @@
+import asyncio
+import os
+import time
+from unittest.mock import patch
+import pytest
+
+from source.philosopher.brain_factory import create_brain
+from source.philosopher.canned_brain import CannedBrain
+from source.philosopher.gemini_brain import GeminiBrain
+from source.philosopher.local_brain import LocalBrain
+from source.philosopher.utils import CANNED_ADVICE
+
+
+@patch.dict(os.environ, {}, clear=True)
+def test_starts_without_any_key():
+    """Check a missing Gemini key falls back instead of failing at startup."""
+    with patch("source.philosopher.brain_factory.llama_cpp", None):
+        assert isinstance(create_brain(), CannedBrain)
+
+
+@patch("source.philosopher.gemini_brain.genai")
+@patch.dict(os.environ, {"GEMINI_API_KEY": "KEY"}, clear=True)
+def test_prefers_gemini_with_key(mock_genai):
+    """Check the online model is used when a key is configured."""
+    assert isinstance(create_brain(), GeminiBrain)
+
+
+@patch.dict(os.environ, {"GEMINI_API_KEY": "KEY", "PHILOSOPHER_BRAIN": "canned"})
+def test_backend_is_selected_at_runtime():
+    """Check the environment variable overrides the automatic choice."""
+    assert isinstance(create_brain(), CannedBrain)
+    with pytest.raises(ValueError, match="Unknown brain"):
+        create_brain("gpt")
+
+
+def test_local_brain_requires_model(tmp_path):
+    """Check a missing GGUF file is reported clearly."""
+    with patch("source.philosopher.local_brain.llama_cpp", object()):
+        with pytest.raises(FileNotFoundError):
+            LocalBrain(model_path=tmp_path / "missing.gguf")
+
+
+def test_local_brain_converts_history_to_chat_messages():
+    """Check the shared history maps to system, user and assistant roles."""
+    contents = [
+        {"role": "user", "parts": ["Tests fail."]},
+        {"role": "model", "parts": ["Why?"]},
+        {"role": "user", "parts": ["Flaky."]},
+    ]
+
+    messages = LocalBrain._messages(contents)
+
+    assert [m["role"] for m in messages] == ["system", "user", "assistant", "user"]
+    assert messages[-1]["content"] == "Flaky."
+
+
+def test_canned_brain_is_instant_and_deterministic():
+    """Check canned advice needs no model and repeats for the same message."""
+    brain = CannedBrain()
+
+    started = time.perf_counter()
+    first = brain.generate_stoic_advice("The build is red.", remember=False)
+    elapsed = time.perf_counter() - started
+
+    assert first in CANNED_ADVICE
+    assert brain.generate_stoic_advice("The build is red.") == first
+    assert elapsed < 0.01
+    assert " ".join(list(brain.stream_stoic_advice("The build is red."))) == first
+
+
+def test_canned_brain_streams_async():
+    """Check the async stream produces the same sentences."""
+    brain = CannedBrain()
+
+    async def collect():
+        return [s async for s in brain.stream_stoic_advice_async("Deadline.")]
+
+    assert asyncio.run(collect()) == list(brain.stream_stoic_advice("Deadline."))
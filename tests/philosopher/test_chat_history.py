@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock, patch
+
+from source.philosopher.chat_history import ChatHistory, estimate_tokens
+from source.philosopher.gemini_brain import GeminiBrain
+
+
+def test_contents_alternate_roles_and_end_with_message():
+    """Check the request holds previous exchanges and the new message last."""
+    history = ChatHistory()
+    history.add("My tests fail.", "Are the tests your enemy?")
+
+    contents = history.contents("No, but they are red.")
+
+    assert [c["role"] for c in contents] == ["user", "model", "user"]
+    assert contents[-1]["parts"] == ["No, but they are red."]
+
+
+def test_prompt_size_stays_flat_over_long_session():
+    """Check hundreds of exchanges never push the prompt past the budget."""
+    history = ChatHistory(max_tokens=300, max_summary_tokens=100, keep_turns=2)
+    message = "My deployment failed again and the pager keeps ringing. " * 2
+
+    sizes = []
+    for _ in range(500):
+        history.contents(message)
+        sizes.append(history.last_prompt_tokens)
+        history.add(message, "Which part of this is within your control?")
+
+    assert max(sizes) <= 300 + 100 + estimate_tokens(message)
+    assert sizes[-1] == sizes[-100]
+
+
+def test_old_turns_are_compacted_into_summary():
+    """Check compacted exchanges stay in the prompt as short summary lines."""
+    history = ChatHistory(max_tokens=40, keep_turns=1)
+    history.add("The build broke right before the demo " * 3, "Breathe.")
+    history.add("Now my manager is angry.", "His anger is his own.")
+
+    contents = history.contents("What do I do?")
+
+    assert len(history.turns) == 1
+    assert "User: The build broke right before the demo" in contents[0]["parts"][0]
+    assert [c["role"] for c in contents] == ["user", "model"] * 2 + ["user"]
+
+
+@patch("source.philosopher.gemini_brain.genai")
+@patch("os.getenv")
+def test_brain_sends_history_with_each_request(mock_getenv, mock_genai):
+    """Check a reply becomes part of the next request."""
+    mock_getenv.return_value = "FAKE_KEY"
+    model = mock_genai.GenerativeModel.return_value
+    model.generate_content.return_value = MagicMock(text="Is it truly yours?")
+    brain = GeminiBrain()
+
+    brain.generate_stoic_advice("The bug is back.")
+    brain.generate_stoic_advice("It is.")
+
+    (contents,) = model.generate_content.call_args.args
+    assert [c["parts"][0] for c in contents] == [
+        "The bug is back.",
+        "Is it truly yours?",
+        "It is.",
+    ]
@@ -1,7 +1,9 @@
+import asyncio
 import pytest
 import os
 from unittest.mock import MagicMock, patch
 from source.philosopher.gemini_brain import GeminiBrain
+from source.philosopher.utils import FALLBACK_ADVICE
 
 
 def test_init_raises_error_without_api_key():
@@ -56,3 +58,56 @@ def test_generate_stoic_advice_api_failure(mock_getenv, mock_genai):
     result = brain.generate_stoic_advice("Help me")
 
     assert "Patience. The API is silent" in result
+
+
+@patch("source.philosopher.gemini_brain.genai")
+@patch("os.getenv")
+def test_stream_stoic_advice_yields_sentences(mock_getenv, mock_genai):
+    """Check the streamed response is split into clean sentences."""
+    mock_getenv.return_value = "FAKE_KEY"
+    chunks = [
+        MagicMock(text=t) for t in ["The *bug* is ext", "ernal. Your anger", " is not."]
+    ]
+    mock_model = mock_genai.GenerativeModel.return_value
+    mock_model.generate_content.return_value = iter(chunks)
+
+    brain = GeminiBrain()
+    sentences = list(brain.stream_stoic_advice("Help me"))
+
+    assert sentences == ["The bug is external.", "Your anger is not."]
+    assert mock_model.generate_content.call_args.kwargs["stream"] is True
+
+
+@patch("source.philosopher.gemini_brain.genai")
+@patch("os.getenv")
+def test_stream_stoic_advice_api_failure(mock_getenv, mock_genai):
+    """Check the fallback is spoken when nothing was generated."""
+    mock_getenv.return_value = "FAKE_KEY"
+    mock_model = mock_genai.GenerativeModel.return_value
+    mock_model.generate_content.side_effect = Exception("Google Server Error 500")
+
+    brain = GeminiBrain()
+
+    assert list(brain.stream_stoic_advice("Help me")) == [FALLBACK_ADVICE]
+
+
+@patch("source.philosopher.gemini_brain.genai")
+@patch("os.getenv")
+def test_stream_stoic_advice_async(mock_getenv, mock_genai):
+    """Check the async stream yields the same clean sentences."""
+    mock_getenv.return_value = "FAKE_KEY"
+
+    async def response():
+        for text in ["Fear is `only` a", " thought. Let it pass."]:
+            yield MagicMock(text=text)
+
+    async def generate_content_async(contents, stream):
+        return response()
+
+    mock_model = mock_genai.GenerativeModel.return_value
+    mock_model.generate_content_async.side_effect = generate_content_async
+
+    async def collect():
+        return [s async for s in GeminiBrain().stream_stoic_advice_async("Help")]
+
+    assert asyncio.run(collect()) == ["Fear is only a thought.", "Let it pass."]
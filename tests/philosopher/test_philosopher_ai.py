@@ -0,0 +1,60 @@
+import threading
+import time
+from unittest.mock import patch
+
+from source.philosopher.philosopher_ai import PhilosopherAI
+from source.philosopher.scheduler import Priority
+
+
+class FakeBrain:
+    def __init__(self, backend=None, cache=None):
+        self.finished_at = None
+
+    def stream_stoic_advice(self, user_context):
+        yield "First, breathe."
+        time.sleep(0.1)
+        yield "Then, look again."
+        self.finished_at = time.perf_counter()
+
+
+class FakeVoice:
+    def __init__(self):
+        self.spoken = []
+
+    def speak_sentences(self, sentences):
+        for sentence in sentences:
+            self.spoken.append((sentence, time.perf_counter()))
+
+
+@patch("source.philosopher.philosopher_ai.VoiceEngine", FakeVoice)
+@patch("source.philosopher.philosopher_ai.create_brain", FakeBrain)
+def test_pipelined_reply_speaks_before_generation_ends():
+    """Check sentences reach the voice while the model is still generating."""
+    philosopher = PhilosopherAI(pipelined=True)
+    replies = []
+
+    philosopher._respond("My build failed.", replies.append)
+
+    spoken = philosopher.voice.spoken
+    assert [sentence for sentence, _ in spoken] == [
+        "First, breathe.",
+        "Then, look again.",
+    ]
+    assert spoken[0][1] < philosopher.brain.finished_at
+    assert replies == ["First, breathe. Then, look again."]
+
+
+@patch("source.philosopher.philosopher_ai.VoiceEngine", FakeVoice)
+@patch("source.philosopher.philosopher_ai.create_brain", FakeBrain)
+def test_interventions_do_not_stack_while_speaking():
+    """Check EEG interventions are skipped while a reply is queued or running."""
+    philosopher = PhilosopherAI()
+    release = threading.Event()
+    philosopher.scheduler.submit(Priority.USER_REPLY, release.wait)
+
+    assert philosopher.is_speaking
+    assert philosopher.trigger_intervention("stress") is None
+
+    release.set()
+    philosopher.shutdown()
+    assert not philosopher.is_speaking
@@ -0,0 +1,236 @@
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+
+from source.philosopher.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceeded,
+    LatencyHistogram,
+    ResiliencePolicy,
+    is_transient,
+)
+
+
+class FakeServer:
+    """Local HTTP server answering each request after `delays[n]` seconds."""
+
+    def __init__(self, delays=(0.0,), statuses=(200,)):
+        self.requests = 0
+        order = itertools.count()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                n = next(order)
+                server.requests += 1
+                time.sleep(delays[min(n, len(delays) - 1)])
+                status = statuses[min(n, len(statuses) - 1)]
+                body = f"reply {n}".encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except OSError:
+                    pass  # Client gave up
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def get(self):
+        with urllib.request.urlopen(self.url, timeout=5) as response:
+            return response.read().decode()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server_factory():
+    servers = []
+
+    def create(**kwargs):
+        servers.append(FakeServer(**kwargs))
+        return servers[-1]
+
+    yield create
+    for server in servers:
+        server.close()
+
+
+def test_slow_server_is_cut_off_at_deadline(server_factory):
+    """Check a hanging server costs the deadline, not its own delay."""
+    server = server_factory(delays=(2.0,))
+    policy = ResiliencePolicy("Fake", timeout=0.2, deadline=0.5, backoff=0.05)
+
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded):
+        policy.call(server.get)
+
+    assert time.perf_counter() - started < 0.8
+    assert policy.stats["timeouts"] >= 2
+
+
+def test_failures_are_retried_with_backoff(server_factory):
+    """Check transient server errors are retried until one succeeds."""
+    server = server_factory(statuses=(503, 503, 200))
+    policy = ResiliencePolicy("Fake", retries=2, backoff=0.01)
+
+    assert policy.call(server.get) == "reply 2"
+    assert policy.stats["retries"] == 2
+    assert server.requests == 3
+
+
+def test_circuit_opens_after_repeated_failures(server_factory):
+    """Check a failing service is not called while the circuit is open."""
+    server = server_factory(statuses=(500,))
+    policy = ResiliencePolicy(
+        "Fake", retries=0, breaker=CircuitBreaker(failure_threshold=3)
+    )
+
+    for _ in range(3):
+        with pytest.raises(Exception):
+            policy.call(server.get)
+    with pytest.raises(CircuitOpenError):
+        policy.call(server.get)
+
+    assert server.requests == 3
+    assert policy.breaker.state == "open"
+
+
+@pytest.mark.parametrize("status", [400, 401, 403])
+def test_client_errors_are_not_retried(server_factory, status):
+    """Check a rejected request fails at once and keeps the circuit closed."""
+    server = server_factory(statuses=(status,))
+    policy = ResiliencePolicy(
+        "Fake", retries=2, backoff=0.01, breaker=CircuitBreaker(failure_threshold=1)
+    )
+
+    for _ in range(2):
+        with pytest.raises(urllib.error.HTTPError):
+            policy.call(server.get)
+
+    assert server.requests == 2
+    assert policy.stats["retries"] == 0
+    assert policy.stats["failures"] == 2
+    assert policy.breaker.state == "closed"
+
+
+def test_bugs_are_not_retried():
+    """Check only timeouts, lost connections, 429 and 5xx are transient."""
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise ValueError("bad argument")
+
+    policy = ResiliencePolicy("Fake", retries=2, backoff=0.01)
+
+    with pytest.raises(ValueError):
+        policy.call(broken)
+    assert len(calls) == 1
+    assert is_transient(ConnectionError("reset"))
+    assert is_transient(DeadlineExceeded())
+
+
+def test_circuit_recovers_after_trial_call():
+    """Check one successful probe closes the circuit again."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()  # Only one probe at a time
+    breaker.record_success()
+
+    assert breaker.state == "closed"
+
+
+def test_slow_request_is_hedged_after_p95(server_factory):
+    """Check a duplicate request bounds the latency of an outlier."""
+    server = server_factory(delays=(0.0,) * 20 + (1.0, 0.0))
+    policy = ResiliencePolicy("Fake", timeout=2.0, hedge=True, hedge_min_samples=20)
+    for _ in range(20):
+        policy.call(server.get)
+
+    started = time.perf_counter()
+    reply = policy.call(server.get)
+
+    assert reply == "reply 21"
+    assert time.perf_counter() - started < 0.5
+    assert policy.stats["hedges"] == 1
+    assert policy.stats["hedge_wins"] == 1
+
+
+def test_stream_retries_until_first_item():
+    """Check a stream failing before its first chunk is restarted."""
+    attempts = []
+
+    def chunks():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("reset")
+        yield from [b"a", b"b"]
+
+    policy = ResiliencePolicy("Fake", backoff=0.01)
+
+    assert list(policy.stream(chunks)) == [b"a", b"b"]
+    assert len(attempts) == 2
+
+
+def test_stalled_stream_is_cut_off():
+    """Check a stream that stops sending raises instead of hanging."""
+
+    def chunks():
+        yield b"a"
+        time.sleep(1.0)
+        yield b"b"
+
+    policy = ResiliencePolicy("Fake", idle_timeout=0.1)
+    received = []
+
+    with pytest.raises(DeadlineExceeded):
+        for chunk in policy.stream(chunks):
+            received.append(chunk)
+    assert received == [b"a"]
+
+
+def test_async_call_is_bounded():
+    """Check coroutines get the same deadline and retries."""
+    policy = ResiliencePolicy("Fake", timeout=0.1, deadline=0.3, backoff=0.01)
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(1.0)
+
+    async def run():
+        started = time.perf_counter()
+        with pytest.raises(DeadlineExceeded):
+            await policy.call_async(slow)
+        return time.perf_counter() - started
+
+    assert asyncio.run(run()) < 0.5
+    assert len(calls) >= 2
+
+
+def test_histogram_reports_buckets_and_percentiles():
+    """Check latencies are counted per bucket."""
+    histogram = LatencyHistogram(bounds=(0.1, 1.0, float("inf")))
+    for seconds in [0.05] * 9 + [2.0]:
+        histogram.record(seconds)
+
+    assert histogram.counts == {"<=0.1s": 9, "<=1s": 0, "<=infs": 1}
+    assert histogram.percentile(50) == 0.05
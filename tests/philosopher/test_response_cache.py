@@ -0,0 +1,112 @@
+import time
+from unittest.mock import MagicMock, patch
+
+from source.philosopher.gemini_brain import GeminiBrain
+from source.philosopher.response_cache import ResponseCache
+
+
+def test_exact_match_ignores_case_and_punctuation():
+    """Check a repeated prompt is answered from the cache."""
+    cache = ResponseCache(hit_probability=1.0)
+    cache.put("My code keeps faulting!", "Faults are teachers.", latency=1.5)
+
+    assert cache.get("my code keeps   faulting") == "Faults are teachers."
+    assert cache.stats["exact_hits"] == 1
+    assert cache.stats["latency_saved"] == 1.5
+
+
+def test_near_duplicate_is_found():
+    """Check a reworded prompt hits while an unrelated one misses."""
+    cache = ResponseCache(hit_probability=1.0)
+    cache.put("the build is broken", "Rebuild your calm first.")
+
+    assert cache.get("The build is broken again") == "Rebuild your calm first."
+    assert cache.get("my manager yelled at me") is None
+    assert cache.stats["similar_hits"] == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hit_rate"] == 0.5
+
+
+def test_entries_expire():
+    """Check answers older than the TTL are not used."""
+    cache = ResponseCache(ttl=0.05, hit_probability=1.0)
+    cache.put("deadline tomorrow", "Time is borrowed.")
+    time.sleep(0.1)
+
+    assert cache.get("deadline tomorrow") is None
+    assert cache.get("deadline tomorrow!!") is None
+
+
+def test_hit_probability_keeps_variety():
+    """Check some matches are skipped so the model is asked again."""
+    cache = ResponseCache(hit_probability=0.5, seed=1)
+    cache.put("I am stressed", "Breathe.")
+
+    answers = [cache.get("I am stressed") for _ in range(200)]
+
+    assert 60 < answers.count(None) < 140
+    assert cache.stats["skipped_hits"] == answers.count(None)
+
+
+def test_oldest_entry_is_replaced_when_full():
+    """Check the cache never grows past `max_entries`."""
+    cache = ResponseCache(max_entries=2, hit_probability=1.0, threshold=1.0)
+    for prompt in ["first prompt", "second prompt", "third prompt"]:
+        cache.put(prompt, prompt.upper())
+
+    assert cache.get("first prompt") is None
+    assert cache.get("third prompt") == "THIRD PROMPT"
+
+
+@patch("source.philosopher.gemini_brain.genai")
+@patch("os.getenv")
+def test_brain_streams_cached_answer_without_round_trip(mock_getenv, mock_genai):
+    """Check a repeated prompt is streamed from the cache."""
+    mock_getenv.return_value = "FAKE_KEY"
+    mock_model = mock_genai.GenerativeModel.return_value
+    mock_model.generate_content.return_value = iter(
+        [MagicMock(text="The code is not you. Fix it calmly.")]
+    )
+    brain = GeminiBrain(cache=ResponseCache(hit_probability=1.0))
+
+    first = list(brain.stream_stoic_advice("My code keeps faulting"))
+    brain.history.clear()  # Same question in a new conversation
+    second = list(brain.stream_stoic_advice("my code keeps faulting!"))
+
+    assert first == second == ["The code is not you.", "Fix it calmly."]
+    mock_model.generate_content.assert_called_once()
+
+
+def test_same_message_after_different_context_misses():
+    """Check a reply is only reused after the same previous turn."""
+    cache = ResponseCache(hit_probability=1.0)
+    cache.put("yes", "Then start now.", context="Will you start today?\nGood.")
+
+    assert cache.get("yes", context="Will you start today?\nGood.") is not None
+    assert cache.get("yes!!", context="Will you start today?\nGood.") is not None
+    assert cache.get("yes", context="Did you quit?\nWhy?") is None
+    assert cache.get("yes") is None
+
+
+@patch("source.philosopher.gemini_brain.genai")
+@patch("os.getenv")
+def test_brain_answers_same_message_per_question(mock_getenv, mock_genai):
+    """Check "yes" after two different questions gets two answers."""
+    mock_getenv.return_value = "FAKE_KEY"
+    mock_model = mock_genai.GenerativeModel.return_value
+    mock_model.generate_content.side_effect = [
+        MagicMock(text="Will you start today?"),
+        MagicMock(text="Then start now."),
+        MagicMock(text="Did you quit your job?"),
+        MagicMock(text="Then mourn it briefly."),
+    ]
+    brain = GeminiBrain(cache=ResponseCache(hit_probability=1.0))
+
+    brain.generate_stoic_advice("I keep delaying my thesis")
+    first = brain.generate_stoic_advice("yes")
+    brain.generate_stoic_advice("I left the company")
+    second = brain.generate_stoic_advice("yes")
+
+    assert first == "Then start now."
+    assert second == "Then mourn it briefly."
+    assert mock_model.generate_content.call_count == 4
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+
+from source.philosopher.scheduler import (
+    AsyncPhilosopherScheduler,
+    PhilosopherScheduler,
+    Priority,
+)
+
+
+def blocked_scheduler(**kwargs):
+    """Scheduler whose only worker waits until the returned event is set."""
+    scheduler = PhilosopherScheduler(workers=1, **kwargs)
+    release = threading.Event()
+    started = threading.Event()
+
+    def hold():
+        started.set()
+        release.wait()
+
+    scheduler.submit(Priority.SCRIPTED, hold)
+    started.wait()
+    return scheduler, release
+
+
+def test_requests_run_by_priority():
+    """Check scripted phrases run before user replies and EEG interventions."""
+    scheduler, release = blocked_scheduler()
+    order = []
+    futures = [
+        scheduler.submit(priority, order.append, priority.name)
+        for priority in [
+            Priority.EEG_INTERVENTION,
+            Priority.USER_REPLY,
+            Priority.SCRIPTED,
+        ]
+    ]
+
+    assert scheduler.busy
+    release.set()
+    for future in futures:
+        future.result(timeout=1.0)
+    scheduler.shutdown()
+
+    assert order == ["SCRIPTED", "USER_REPLY", "EEG_INTERVENTION"]
+
+
+def test_full_queue_drops_least_important():
+    """Check backpressure replaces the newest least important request."""
+    scheduler, release = blocked_scheduler(max_pending=2)
+    first_eeg = scheduler.submit(Priority.EEG_INTERVENTION, lambda: "first")
+    second_eeg = scheduler.submit(Priority.EEG_INTERVENTION, lambda: "second")
+
+    reply = scheduler.submit(Priority.USER_REPLY, lambda: "reply")
+    rejected = scheduler.submit(Priority.EEG_INTERVENTION, lambda: "third")
+    release.set()
+
+    assert second_eeg.cancelled()
+    assert rejected is None
+    assert reply.result(timeout=1.0) == "reply"
+    assert first_eeg.result(timeout=1.0) == "first"
+    scheduler.shutdown()
+
+
+def test_cancel_and_shutdown():
+    """Check waiting requests can be cancelled and shutdown rejects new ones."""
+    scheduler, release = blocked_scheduler()
+    eeg = scheduler.submit(Priority.EEG_INTERVENTION, lambda: None)
+    reply = scheduler.submit(Priority.USER_REPLY, lambda: "reply")
+
+    assert scheduler.cancel_pending(Priority.EEG_INTERVENTION) == 1
+    assert eeg.cancelled()
+
+    release.set()
+    assert reply.result(timeout=1.0) == "reply"
+    assert not reply.cancelled()
+    scheduler.shutdown()
+
+    scheduler, release = blocked_scheduler()
+    waiting = scheduler.submit(Priority.USER_REPLY, lambda: "late")
+    scheduler.shutdown(wait=False)
+    release.set()
+
+    assert waiting.cancelled()
+    assert scheduler.submit(Priority.SCRIPTED, lambda: None) is None
+
+
+def test_failed_request_keeps_worker_alive():
+    """Check an exception is stored in the future and the worker continues."""
+    scheduler = PhilosopherScheduler()
+    failed = scheduler.submit(Priority.USER_REPLY, lambda: 1 / 0)
+    ok = scheduler.submit(Priority.USER_REPLY, lambda: "ok")
+
+    assert isinstance(failed.exception(timeout=1.0), ZeroDivisionError)
+    assert ok.result(timeout=1.0) == "ok"
+    scheduler.shutdown()
+
+
+def test_async_full_queue_drops_least_important():
+    """Check the coroutine scheduler applies the same backpressure."""
+
+    async def run():
+        scheduler = AsyncPhilosopherScheduler(max_pending=2)
+        release = asyncio.Event()
+        hold = scheduler.submit(Priority.SCRIPTED, release.wait)
+        await asyncio.sleep(0)
+        first_eeg = scheduler.submit(Priority.EEG_INTERVENTION, asyncio.sleep, 0, 1)
+        second_eeg = scheduler.submit(Priority.EEG_INTERVENTION, asyncio.sleep, 0, 2)
+        reply = scheduler.submit(Priority.USER_REPLY, asyncio.sleep, 0, "reply")
+        rejected = scheduler.submit(Priority.EEG_INTERVENTION, asyncio.sleep, 0, 3)
+        release.set()
+
+        assert second_eeg.cancelled()
+        assert rejected is None
+        assert await reply == "reply"
+        assert await first_eeg == 1
+        assert await hold
+        assert not scheduler.busy
+        scheduler.shutdown()
+
+    asyncio.run(run())
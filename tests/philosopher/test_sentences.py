@@ -0,0 +1,23 @@
+from source.philosopher.sentences import SentenceSplitter
+
+
+def test_sentences_are_emitted_when_complete():
+    """Check sentences come out as soon as their end has streamed in."""
+    splitter = SentenceSplitter()
+
+    assert splitter.feed("The obstacle is the") == []
+    assert splitter.feed(" way. What stands in ") == ["The obstacle is the way."]
+    assert splitter.feed("the way becomes the way?\n") == [
+        "What stands in the way becomes the way?"
+    ]
+    assert splitter.flush() is None
+
+
+def test_short_fragments_are_joined():
+    """Check fragments shorter than the minimum are not spoken on their own."""
+    splitter = SentenceSplitter(min_length=20)
+
+    assert splitter.feed('No. "Really?" Yes, truly so. Why') == [
+        'No. "Really?" Yes, truly so.'
+    ]
+    assert splitter.flush() == "Why"
@@ -0,0 +1,113 @@
+import time
+from unittest.mock import patch
+
+from source.philosopher.canned_brain import CannedBrain
+from source.philosopher.chat_history import ChatHistory
+from source.philosopher.philosopher_ai import PhilosopherAI
+from source.philosopher.response_cache import ResponseCache
+from source.philosopher.speculation import InterventionSlot
+
+
+class SlowBrain:
+    def __init__(self, backend=None, cache=None):
+        self.history = ChatHistory()
+        self.calls = []
+
+    def generate_stoic_advice(self, user_context, remember=True, use_cache=True):
+        self.calls.append((remember, use_cache))
+        time.sleep(0.2)  # Network round trip
+        return "Stress is a story you tell yourself."
+
+
+class FakeVoice:
+    def __init__(self):
+        self.played = []
+
+    def synthesize(self, text):
+        time.sleep(0.2)
+        yield text.encode()
+
+    def play_audio(self, audio):
+        self.played.append(audio)
+
+
+def test_slot_holds_one_intervention():
+    """Check only one preparation runs and its result is taken once."""
+    slot = InterventionSlot()
+    token = slot.begin()
+
+    assert slot.begin() is None
+    assert slot.complete(token, "stress", "Breathe.", b"audio")
+    assert slot.begin() is None
+    assert slot.take().text == "Breathe."
+    assert slot.take() is None
+
+
+def test_discarded_preparation_is_not_stored():
+    """Check a result arriving after recovery is thrown away."""
+    slot = InterventionSlot()
+    token = slot.begin()
+    slot.discard()
+
+    assert not slot.complete(token, "stress", "Too late.", b"audio")
+    assert slot.take() is None
+    assert slot.stats["discarded"] == 1
+
+
+def test_prepared_intervention_expires():
+    """Check an old intervention is not delivered."""
+    slot = InterventionSlot(ttl=0.05)
+    slot.complete(slot.begin(), "stress", "Stale.", b"audio")
+    time.sleep(0.1)
+
+    assert slot.take() is None
+    assert slot.stats["expired"] == 1
+
+
+@patch("source.philosopher.philosopher_ai.VoiceEngine", FakeVoice)
+@patch("source.philosopher.philosopher_ai.create_brain", SlowBrain)
+def test_intervention_is_delivered_without_generation():
+    """Check the prepared intervention plays at once when stress peaks."""
+    philosopher = PhilosopherAI()
+    philosopher.gong = None
+    replies = []
+
+    philosopher.prepare_intervention().result(timeout=2.0)
+    assert not philosopher.is_speaking
+    assert philosopher.prepare_intervention() is None
+
+    started = time.perf_counter()
+    philosopher.deliver_intervention(replies.append).result(timeout=2.0)
+
+    assert time.perf_counter() - started < 0.1
+    assert replies == ["Stress is a story you tell yourself."]
+    assert philosopher.voice.played == [b"Stress is a story you tell yourself."]
+    assert philosopher.brain.calls == [(False, False)]
+    assert len(philosopher.brain.history.turns) == 1
+    philosopher.shutdown()
+
+
+@patch("source.philosopher.philosopher_ai.VoiceEngine", FakeVoice)
+@patch("source.philosopher.philosopher_ai.create_brain", SlowBrain)
+def test_nothing_to_deliver_after_recovery():
+    """Check recovering from worry discards the intervention in flight."""
+    philosopher = PhilosopherAI()
+    preparation = philosopher.prepare_intervention()
+
+    philosopher.discard_intervention()
+    preparation.result(timeout=2.0)
+
+    assert philosopher.deliver_intervention() is None
+    assert len(philosopher.brain.history.turns) == 0
+    philosopher.shutdown()
+
+
+def test_speculative_advice_bypasses_cache():
+    """Check preparations are generated afresh and leave the cache untouched."""
+    cache = ResponseCache(hit_probability=1.0)
+    brain = CannedBrain(cache=cache)
+    brain.generate_stoic_advice("Stress is rising.", remember=False, use_cache=False)
+    brain.generate_stoic_advice("Stress is rising.", remember=False, use_cache=False)
+
+    assert cache.get("Stress is rising.") is None
+    assert cache.stats["misses"] == 1  # Only the lookup above
@@ -0,0 +1,126 @@
+import threading
+import wave
+from unittest.mock import patch
+import numpy as np
+import speech_recognition as sr
+
+from source.philosopher.recording import Recording
+from source.philosopher.speech_to_text import (
+    GoogleSpeechToText,
+    TranscriptionStream,
+    create_speech_to_text,
+    transcribe_recording,
+    transcribe_wav,
+)
+
+
+class FakeSession:
+    """Recognizes one word per 100 ms of audio."""
+
+    words = ["why", "is", "my", "build", "red"]
+
+    def __init__(self, sample_rate):
+        self.bytes_per_word = sample_rate // 10 * 2
+        self.received = 0
+        self.threads = set()
+
+    def accept(self, pcm):
+        self.threads.add(threading.current_thread())
+        self.received += len(pcm)
+        return self._text()
+
+    def result(self):
+        return self._text()
+
+    def _text(self):
+        return " ".join(self.words[: self.received // self.bytes_per_word])
+
+
+class FakeSpeechToText:
+    name = "Fake"
+
+    def __init__(self):
+        self.sessions = []
+
+    def create_session(self, sample_rate):
+        self.sessions.append(FakeSession(sample_rate))
+        return self.sessions[-1]
+
+
+def test_partials_arrive_while_recording():
+    """Check transcripts are produced from frames before the recording ends."""
+    partials = []
+    stream = TranscriptionStream(FakeSpeechToText(), 16000, partials.append)
+
+    for _ in range(3):
+        stream.feed(np.zeros(1600, dtype=np.float32))
+    text = stream.finish(timeout=1.0)
+
+    assert partials == ["why", "why is", "why is my"]
+    assert text == "why is my"
+
+
+def test_feed_does_not_recognize_on_caller_thread():
+    """Check the audio callback thread only queues frames."""
+    stt = FakeSpeechToText()
+    stream = TranscriptionStream(stt, 16000)
+
+    stream.feed(np.zeros(1600, dtype=np.float32))
+    stream.finish(timeout=1.0)
+
+    assert threading.current_thread() not in stt.sessions[0].threads
+
+
+def test_float_frames_are_converted_to_pcm16():
+    """Check float frames are clipped and scaled to 16-bit samples."""
+    stt = FakeSpeechToText()
+    stream = TranscriptionStream(stt, 16000)
+    received = []
+
+    with patch.object(FakeSession, "accept", side_effect=received.append):
+        stream.feed(np.array([0.0, 0.5, 2.0, -1.0], dtype=np.float32))
+        stream.finish(timeout=1.0)
+
+    samples = np.frombuffer(received[0], dtype="<i2")
+    assert samples.tolist() == [0, 16383, 32767, -32767]
+
+
+def test_wav_file_is_transcribed(tmp_path):
+    """Check a WAV recording goes through the same backend interface."""
+    path = tmp_path / "voice.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(bytes(2 * 3200))
+
+    assert transcribe_wav(FakeSpeechToText(), path) == "why is"
+
+
+def test_google_backend_recognizes_whole_utterance():
+    """Check the online backend sends the collected audio once, at the end."""
+    stream = TranscriptionStream(GoogleSpeechToText(), 16000)
+    with patch.object(
+        sr.Recognizer, "recognize_google", return_value="memento mori"
+    ) as recognize:
+        stream.feed(np.zeros(800, dtype=np.int16))
+        stream.feed(np.zeros(800, dtype=np.int16))
+        text = stream.finish(timeout=1.0)
+
+    (audio,) = recognize.call_args.args
+    assert text == "memento mori"
+    assert len(audio.get_raw_data()) == 3200
+
+
+@patch("source.philosopher.speech_to_text.vosk", None)
+def test_falls_back_to_google_without_vosk():
+    """Check startup does not need the offline model."""
+    assert isinstance(create_speech_to_text(), GoogleSpeechToText)
+
+
+def test_recording_is_transcribed_from_memory():
+    """Check an in-memory recording reaches the backend without a file."""
+    recording = Recording(np.zeros(4800, dtype=np.float32), 16000)
+
+    assert recording.duration == 0.3
+    assert transcribe_recording(FakeSpeechToText(), recording) == "why is my"
@@ -0,0 +1,47 @@
+import os
+
+from source.philosopher.tts_cache import TTSCache
+
+
+def test_key_covers_every_audio_parameter():
+    """Check a different voice, model or format never shares an entry."""
+    base = TTSCache.key("Patience.", "voice", "model", "pcm_22050")
+
+    assert base == TTSCache.key("Patience.", "voice", "model", "pcm_22050")
+    assert base != TTSCache.key("Patience.", "other", "model", "pcm_22050")
+    assert base != TTSCache.key("Patience.", "voice", "other", "pcm_22050")
+    assert base != TTSCache.key("Patience.", "voice", "model", "mp3_44100_128")
+
+
+def test_disk_entries_survive_restart(tmp_path):
+    """Check a new cache instance reads earlier entries from disk."""
+    TTSCache(tmp_path).put("a", b"audio")
+    cache = TTSCache(tmp_path)
+
+    assert cache.get("a") == b"audio"
+    assert cache.get("a") == b"audio"
+    assert cache.get("b") is None
+    assert cache.stats == {"memory_hits": 1, "disk_hits": 1, "misses": 1}
+
+
+def test_memory_layer_evicts_least_recently_used(tmp_path):
+    """Check the memory layer stays within its byte limit."""
+    cache = TTSCache(tmp_path, max_memory_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    cache.get("a")
+    cache.put("c", b"12345")
+
+    assert list(cache._memory) == ["a", "c"]
+    assert cache.get("b") == b"12345"  # Still on disk
+
+
+def test_disk_evicts_least_recently_used(tmp_path):
+    """Check the directory stays within its byte limit."""
+    cache = TTSCache(tmp_path, max_disk_bytes=10)
+    for age, key in enumerate(["a", "b"]):
+        cache.put(key, b"12345")
+        os.utime(tmp_path / key, (age, age))
+    cache.put("c", b"12345")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["b", "c"]
@@ -1,9 +1,12 @@
+import threading
+import time
 import pytest
 import os
 from unittest.mock import patch
 
+from source.philosopher.tts_cache import TTSCache
 from source.philosopher.voice_engine import VoiceEngine
-from source.philosopher.utils import STOIC_VOICE_ID
+from source.philosopher.utils import PCM_OUTPUT_FORMAT, STOIC_VOICE_ID
 
 
 def test_init_raises_error_without_api_key():
@@ -22,9 +25,12 @@ def test_init_success(mock_getenv, mock_pygame, mock_elevenlabs):
     mock_getenv.return_value = "FAKE_API_KEY"
     engine = VoiceEngine()
 
-    mock_elevenlabs.assert_called_once_with(api_key="FAKE_API_KEY")
+    mock_elevenlabs.assert_called_once_with(
+        api_key="FAKE_API_KEY", httpx_client=engine.http
+    )
     mock_pygame.mixer.init.assert_called_once()
     assert engine.voice_id == STOIC_VOICE_ID
+    assert not engine.policy.hedge  # A duplicate synthesis is billed twice
 
 
 @patch("source.philosopher.voice_engine.ElevenLabs")
@@ -39,3 +45,154 @@ def test_speak_empty_text_does_nothing(mock_getenv, mock_pygame, mock_elevenlabs
     engine.speak(None)
 
     mock_elevenlabs.return_value.text_to_speech.convert.assert_not_called()
+
+
+@patch("source.philosopher.voice_engine.ElevenLabs")
+@patch("source.philosopher.voice_engine.pygame")
+@patch("os.getenv")
+def test_speak_streams_pcm(mock_getenv, mock_pygame, mock_elevenlabs, tmp_path):
+    """Check streaming mode requests raw PCM and plays it as it arrives."""
+    mock_getenv.return_value = "KEY"
+    engine = VoiceEngine(cache=TTSCache(tmp_path))
+    convert = mock_elevenlabs.return_value.text_to_speech.convert
+    convert.return_value = iter([b"\x00\x01", b"\x02\x03"])
+
+    played = []
+    with patch.object(engine.stream_player, "play", side_effect=played.extend):
+        engine.speak("Memento mori.")
+
+    assert convert.call_args.kwargs["output_format"] == PCM_OUTPUT_FORMAT
+    assert played == [b"\x00\x01", b"\x02\x03"]
+
+
+@patch("source.philosopher.voice_engine.ElevenLabs")
+@patch("source.philosopher.voice_engine.pygame")
+@patch("os.getenv")
+def test_repeated_phrase_is_cached(mock_getenv, mock_pygame, mock_elevenlabs, tmp_path):
+    """Check a repeated phrase is played without calling ElevenLabs again."""
+    mock_getenv.return_value = "KEY"
+    engine = VoiceEngine(cache=TTSCache(tmp_path))
+    convert = mock_elevenlabs.return_value.text_to_speech.convert
+    convert.return_value = iter([b"\x00\x01", b"\x02\x03"])
+
+    played = []
+    with patch.object(engine.stream_player, "play", side_effect=played.extend):
+        engine.speak("Patience.")
+        engine.speak("Patience.")
+
+    convert.assert_called_once()
+    assert played == [b"\x00\x01", b"\x02\x03", b"\x00\x01\x02\x03"]
+    assert engine.cache.stats == {"memory_hits": 1, "disk_hits": 0, "misses": 1}
+
+
+class FakeSound:
+    """Sound lasting 50 ms that records how many sounds played at once."""
+
+    playing = []
+    overlaps = []
+
+    def __init__(self, source):
+        self.source = source
+
+    def get_length(self):
+        return 0.05
+
+    def play(self):
+        FakeSound.overlaps.append(len(FakeSound.playing))
+        FakeSound.playing.append(self)
+        threading.Timer(0.05, FakeSound.playing.remove, (self,)).start()
+        return object()
+
+
+@patch("source.philosopher.voice_engine.ElevenLabs")
+@patch("source.philosopher.voice_engine.pygame")
+@patch("os.getenv")
+def test_mp3_is_played_from_memory(
+    mock_getenv, mock_pygame, mock_elevenlabs, tmp_path, monkeypatch
+):
+    """Check non-streaming playback never touches the filesystem."""
+    monkeypatch.chdir(tmp_path)
+    mock_getenv.return_value = "KEY"
+    mock_pygame.mixer.Sound.side_effect = FakeSound
+    engine = VoiceEngine(streaming=False, cache=TTSCache(tmp_path / "cache"))
+    convert = mock_elevenlabs.return_value.text_to_speech.convert
+    convert.return_value = iter([b"ID3", b"mp3"])
+
+    engine.speak("Amor fati.")
+
+    (source,) = mock_pygame.mixer.Sound.call_args.args
+    assert source.getvalue() == b"ID3mp3"
+    assert [path.name for path in tmp_path.iterdir()] == ["cache"]
+
+
+@patch("source.philosopher.voice_engine.ElevenLabs")
+@patch("source.philosopher.voice_engine.pygame")
+@patch("os.getenv")
+def test_playback_returns_when_sound_ends(mock_getenv, mock_pygame, mock_elevenlabs):
+    """Check completion is signalled by the sound length, not a fixed delay."""
+    mock_getenv.return_value = "KEY"
+    engine = VoiceEngine(streaming=False)
+
+    started = time.perf_counter()
+    finished = engine.play_sound(FakeSound("gong"))
+
+    assert not finished.is_set()
+    assert finished.wait(timeout=1.0)
+    assert 0.04 < time.perf_counter() - started < 0.5
+
+
+@patch("source.philosopher.voice_engine.ElevenLabs")
+@patch("source.philosopher.voice_engine.pygame")
+@patch("os.getenv")
+def test_concurrent_playback_is_serialized(mock_getenv, mock_pygame, mock_elevenlabs):
+    """Check two threads never play speech at the same time."""
+    mock_getenv.return_value = "KEY"
+    mock_pygame.mixer.Sound.side_effect = FakeSound
+    engine = VoiceEngine(streaming=False)
+    FakeSound.overlaps.clear()
+
+    threads = [
+        threading.Thread(target=engine.play_bytes, args=(b"audio",)) for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert FakeSound.overlaps == [0, 0, 0]
+
+
+@patch("source.philosopher.voice_engine.ElevenLabs")
+@patch("source.philosopher.voice_engine.pygame")
+@patch("os.getenv")
+def test_sentences_are_spoken_in_order_while_generated(
+    mock_getenv, mock_pygame, mock_elevenlabs
+):
+    """Check the first sentence plays before the model has finished."""
+    mock_getenv.return_value = "KEY"
+    engine = VoiceEngine()
+    events = []
+
+    def fake_model():
+        for sentence in ["One.", "Two.", "Three."]:
+            time.sleep(0.05)
+            events.append(("generated", sentence))
+            yield sentence
+        events.append(("generation finished", None))
+
+    def fake_tts(text):
+        time.sleep(0.01)
+        yield text.encode()
+
+    def fake_play(chunks):
+        events.append(("played", b"".join(chunks).decode()))
+
+    with (
+        patch.object(engine, "synthesize", side_effect=fake_tts),
+        patch.object(engine, "_play", side_effect=fake_play),
+    ):
+        engine.speak_sentences(fake_model())
+
+    played = [text for kind, text in events if kind == "played"]
+    assert played == ["One.", "Two.", "Three."]
+    assert events.index(("played", "One.")) < events.index(("generated", "Two."))
@@ -0,0 +1,191 @@
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+import pytest
+
+from source.philosopher.warmup import (
+    ConnectionWarmer,
+    create_async_http_client,
+    create_http_client,
+)
+
+HANDSHAKE = 0.3
+
+
+class KeepAliveServer:
+    """Local HTTP/1.1 server whose new connections cost `HANDSHAKE` seconds."""
+
+    def __init__(self):
+        self.connections = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                server.connections += 1
+                time.sleep(HANDSHAKE)  # Stands in for DNS, TCP and TLS
+
+            def do_HEAD(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self):
+                body = b"ok"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    server = KeepAliveServer()
+    yield server
+    server.close()
+
+
+def timed_get(client, url):
+    started = time.perf_counter()
+    client.get(url).raise_for_status()
+    return time.perf_counter() - started
+
+
+def test_warmed_client_skips_handshake(server):
+    """Check the first request after a warm-up reuses the pooled connection."""
+    with create_http_client() as cold:
+        cold_latency = timed_get(cold, server.url)
+
+    with create_http_client() as warm:
+        warmer = ConnectionWarmer()
+        warmer.add("Fake", lambda: warm.head(server.url))
+        latencies = warmer.warm_up()
+        warm_latency = timed_get(warm, server.url)
+
+    assert cold_latency >= HANDSHAKE
+    assert latencies["Fake"] >= HANDSHAKE
+    assert warm_latency < HANDSHAKE / 2
+    assert server.connections == 2
+
+
+def test_services_are_warmed_in_parallel(server):
+    """Check the warm-up costs one handshake, not one per service."""
+    clients = [create_http_client() for _ in range(3)]
+    warmer = ConnectionWarmer()
+    for n, client in enumerate(clients):
+        warmer.add(f"Fake {n}", lambda client=client: client.head(server.url))
+
+    started = time.perf_counter()
+    warmer.warm_up()
+
+    assert time.perf_counter() - started < HANDSHAKE * 2
+    assert server.connections == 3
+    for client in clients:
+        client.close()
+
+
+def test_keep_alive_pings_reuse_connection(server):
+    """Check idle pings keep using the one connection opened at startup."""
+    with create_http_client() as client:
+        warmer = ConnectionWarmer(interval=0.05)
+        warmer.add("Fake", lambda: client.head(server.url))
+        warmer.start()
+        time.sleep(HANDSHAKE + 0.3)
+        warmer.stop()
+
+        assert warmer.pings >= 3
+        assert timed_get(client, server.url) < HANDSHAKE / 2
+    assert server.connections == 1
+
+
+def test_failed_ping_does_not_stop_warm_up(server):
+    """Check an unreachable service is reported without affecting the others."""
+    warmer = ConnectionWarmer()
+
+    def unreachable():
+        raise ConnectionError("refused")
+
+    with create_http_client() as client:
+        warmer.add("Down", unreachable)
+        warmer.add("Fake", lambda: client.head(server.url))
+        latencies = warmer.warm_up()
+
+    assert latencies["Down"] is None
+    assert latencies["Fake"] is not None
+
+
+def test_async_client_is_warmed(server):
+    """Check coroutine pings warm the pool of an async client."""
+
+    async def run():
+        async with create_async_http_client() as client:
+            warmer = ConnectionWarmer()
+            warmer.add_async("Fake", lambda: client.head(server.url))
+            await warmer.warm_up_async()
+            started = time.perf_counter()
+            (await client.get(server.url)).raise_for_status()
+            return time.perf_counter() - started
+
+    assert asyncio.run(run()) < HANDSHAKE / 2
+    assert server.connections == 1
+
+
+def test_hung_ping_is_reported_as_failed(server):
+    """Check a ping that never answers costs the timeout, not the warm-up."""
+    release = threading.Event()
+    timeout = HANDSHAKE * 2
+    warmer = ConnectionWarmer(timeout=timeout)
+
+    async def hung_async():
+        await asyncio.sleep(10)
+
+    with create_http_client() as client:
+        warmer.add("Hung", release.wait)
+        warmer.add("Fake", lambda: client.head(server.url))
+        warmer.add_async("Hung async", hung_async)
+
+        started = time.perf_counter()
+        latencies = warmer.warm_up()
+        assert time.perf_counter() - started < timeout + 0.2
+        assert latencies["Hung"] is None
+        assert latencies["Fake"] is not None
+
+        async def run():
+            started = time.perf_counter()
+            latencies = await warmer.warm_up_async()
+            release.set()  # asyncio.run waits for the thread of the hung ping
+            return time.perf_counter() - started, latencies
+
+        seconds, latencies = asyncio.run(run())
+        assert seconds < timeout + 0.2
+        assert latencies["Hung async"] is None
+        assert latencies["Hung"] is None
+
+
+def test_startup_only_ping_is_not_repeated():
+    """Check a ping that keeps nothing open runs at startup only."""
+    calls = []
+    warmer = ConnectionWarmer(interval=0.02)
+    warmer.add("DNS", lambda: calls.append("DNS"), keep_alive=False)
+    warmer.add("Pool", lambda: calls.append("Pool"))
+    warmer.start()
+    time.sleep(0.2)
+    warmer.stop()
+
+    assert calls.count("DNS") == 1
+    assert calls.count("Pool") >= 3